@@ -0,0 +1,225 @@
+"""
+Measures the latency of right clicking an action, from the context menu
+event to the menu being built.
+
+Each right click is timed through the panel as it is now, where the user
+actions come from the cached settings of the environment and the entries of
+the plugin come from the menu cache of the engine. The same menu is also
+built the way the panel used to build it, reading the settings through
+scribble.get and calling the actions of the plugin on every click.
+
+The panel runs offscreen against a temporary plugin location, and its
+settings are written to a temporary directory. The size of the settings
+file can be increased to see how the old path scales with it.
+
+Usage:
+
+    python benchmarks/context_menu.py [--clicks 200] [--user-actions 50]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import functools
+import collections
+
+
+# -- This is the directory holding the launchpanel package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# -- This is the environment the panel is created in
+ENVIRONMENT_ID = 'context_menu_benchmark'
+
+# -- The plugin we right click has a handful of menu entries
+PLUGIN_CODE = '''
+import launchpad
+
+
+class Benchmarked(launchpad.LaunchAction):
+    Name = "Benchmarked"
+
+    @classmethod
+    def actions(cls):
+        return dict(
+            ("Entry %s" % index, cls.run)
+            for index in range(10)
+        )
+'''
+
+
+# ------------------------------------------------------------------------------
+def pump(app, seconds=0.0):
+    """
+    Processes events (including deferred deletes) for the given time
+    """
+    from Qt import QtCore
+
+    end_time = time.time() + seconds
+
+    while True:
+        app.processEvents()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+        if time.time() >= end_time:
+            break
+
+        time.sleep(0.01)
+
+
+# ------------------------------------------------------------------------------
+def close_menus(app, widget):
+    from Qt import QtWidgets
+
+    for menu in widget.findChildren(QtWidgets.QMenu):
+        menu.close()
+        menu.deleteLater()
+
+    pump(app)
+
+
+# ------------------------------------------------------------------------------
+def old_context_menu(widget, event):
+    """
+    This is how the context menu was built before the settings and the
+    menu entries were cached
+    """
+    import scribble
+    import qtility
+
+    item = widget.itemAt(event.pos())
+
+    settings = scribble.get(widget._launch_panel.environment_id)
+    is_user_item = item.identifier in settings.get('user_actions', list())
+
+    menu_dict = collections.OrderedDict()
+    menu_dict.update(widget.factory.request(item.identifier).actions())
+    menu_dict['-'] = None
+
+    if is_user_item:
+        menu_dict['Remove From User Panel'] = functools.partial(
+            widget.removeUserItem,
+            item.identifier,
+        )
+    else:
+        menu_dict['Add To User Panel'] = functools.partial(
+            widget.addUserItem,
+            item.identifier,
+        )
+
+    menu = qtility.menus.create(menu_dict, parent=widget)
+    menu.popup(event.globalPos())
+
+
+# ------------------------------------------------------------------------------
+def measure(app, widget, event, method, clicks):
+    """
+    Times the given method handling the event, returning the time of
+    each click in seconds
+    """
+    timings = list()
+
+    for _ in range(clicks):
+        start = time.perf_counter()
+        method(widget, event)
+        timings.append(time.perf_counter() - start)
+
+        close_menus(app, widget)
+
+    return timings
+
+
+# ------------------------------------------------------------------------------
+def report(label, timings):
+    timings = sorted(timings)
+
+    print(
+        '{:<32}{:>12.3f}{:>12.3f}{:>12.3f}'.format(
+            label,
+            timings[len(timings) // 2] * 1000,
+            timings[int(len(timings) * 0.95)] * 1000,
+            timings[-1] * 1000,
+        )
+    )
+
+
+# ------------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clicks', type=int, default=200)
+    parser.add_argument(
+        '--user-actions',
+        type=int,
+        default=50,
+        help='The number of user actions stored in the settings file',
+    )
+    arguments = parser.parse_args()
+
+    # -- The settings are written somewhere temporary, which has to be
+    # -- set before scribble is imported
+    temp_directory = tempfile.mkdtemp(prefix='launchpanel-benchmark-')
+    os.environ['XDG_CONFIG_HOME'] = temp_directory
+    os.environ['PYSCRIBBLE_STORAGE_DIR'] = os.path.join(temp_directory, 'pyscribble')
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    sys.path.insert(0, ROOT)
+
+    plugin_location = os.path.join(temp_directory, 'plugins')
+    os.makedirs(plugin_location)
+
+    with open(os.path.join(plugin_location, 'benchmarked.py'), 'w') as f:
+        f.write(PLUGIN_CODE)
+
+    try:
+        from Qt import QtGui, QtWidgets
+        from launchpanel import core, environment
+
+        app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+        environment.settings(ENVIRONMENT_ID).user_actions = [
+            'Missing %s' % index
+            for index in range(arguments.user_actions)
+        ]
+
+        panel = core.LaunchPanel(
+            plugin_locations=[plugin_location],
+            environment_id=ENVIRONMENT_ID,
+        )
+        panel.show()
+        pump(app, 0.5)
+
+        # -- We right click the action in the tab showing all the actions
+        widget = panel._action_lists[0]
+        panel.ui.tabPanel.setCurrentWidget(widget)
+        pump(app, 0.1)
+
+        position = widget.visualItemRect(widget.item(0)).center()
+
+        event = QtGui.QContextMenuEvent(
+            QtGui.QContextMenuEvent.Mouse,
+            position,
+            widget.mapToGlobal(position),
+        )
+
+        # -- The first click builds the entries of the plugin in the
+        # -- background, every click after that uses the cached entries
+        first = measure(app, widget, event, core.ActionListWidget.contextMenuEvent, 1)
+        pump(app, 0.5)
+
+        print('{:<32}{:>12}{:>12}{:>12}'.format('path', 'median (ms)', 'p95 (ms)', 'max (ms)'))
+        report('current (first click)', first)
+        report('current', measure(app, widget, event, core.ActionListWidget.contextMenuEvent, arguments.clicks))
+        report('scribble.get', measure(app, widget, event, old_context_menu, arguments.clicks))
+
+        panel.close()
+        panel.deleteLater()
+        pump(app)
+
+    finally:
+        shutil.rmtree(temp_directory, ignore_errors=True)
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures how long it takes to import launchpanel in a fresh interpreter.
+
+The package itself should import quickly as it defers the ui modules (and
+Qt) until they are needed. The import of the ui is measured alongside it
+for comparison.
+
+Usage:
+
+    python benchmarks/import_time.py [--runs 10]
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+
+# -- This is the directory holding the launchpanel package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# -- These are the imports we measure, in the order they are reported
+IMPORTS = [
+    ('interpreter', 'pass'),
+    ('launchpanel', 'import launchpanel'),
+    ('launchpanel.headless', 'import launchpanel.headless'),
+    ('launchpanel.core', 'import launchpanel.core'),
+]
+
+
+# ------------------------------------------------------------------------------
+def measure(code, runs):
+    """
+    Runs the given code in a fresh interpreter the given number of times,
+    returning the time taken by each run in seconds.
+    """
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [ROOT] + [path for path in sys.path if path],
+    )
+
+    timings = list()
+
+    for _ in range(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', code], env=environment)
+        timings.append(time.time() - start)
+
+    return timings
+
+
+# ------------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    arguments = parser.parse_args()
+
+    print('{:<24}{:>12}{:>12}'.format('import', 'median (ms)', 'min (ms)'))
+
+    for label, code in IMPORTS:
+        timings = sorted(measure(code, arguments.runs))
+
+        print(
+            '{:<24}{:>12.1f}{:>12.1f}'.format(
+                label,
+                timings[len(timings) // 2] * 1000,
+                timings[0] * 1000,
+            )
+        )
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -48,6 +48,29 @@ This is particulary useful if you are running multiple projects and want a
 bespoke set of plugins displayed for each one.
 
 
+# Headless
+
+Actions can be listed, run or status checked from the command line without
+any ui (for instance on render farm nodes) through run.py:
+
+```
+python run.py headless=list
+python run.py headless=run action="My Action" environment_id=foo
+python run.py headless=status action="My Action"
+```
+
+
+# Single Instance
+
+When launching from run.py you can pass single_instance=true. The first
+invocation will then listen for any later invocations, which simply hand
+their arguments over and exit rather than starting a new panel.
+
+```
+python run.py environment_id=foo single_instance=true
+```
+
+
 ## Dependencies
 
 
@@ -64,5 +87,49 @@ Launchpad has been tested under Python 2.7 and Python 3.7 on Windows and Ubuntu.
 """
 __version__ = "3.0.1"
 
-from .core import launch
 from . import utils
+
+__all__ = [
+    'launch',
+    'launch_single_instance',
+    'utils',
+]
+
+
+# ------------------------------------------------------------------------------
+def launch(*args, **kwargs):
+    """
+    Creates (or uses) the QApplication and instances the panel. See
+    core.launch for details. The ui modules are only imported when this
+    is first called, meaning the package can be used without Qt (for
+    instance when running actions headless).
+    """
+    from . import core
+    return core.launch(*args, **kwargs)
+
+
+# ------------------------------------------------------------------------------
+def launch_single_instance(*args, **kwargs):
+    """
+    Launches the panel as the single instance. See
+    core.launch_single_instance for details. Use instance.forward to pass
+    arguments to a running instance.
+    """
+    from . import core
+    return core.launch_single_instance(*args, **kwargs)
+
+
+# ------------------------------------------------------------------------------
+def __getattr__(name):
+    """
+    The ui module used to be imported along with the package, so
+    launchpanel.core is still available as an attribute. It is imported
+    the first time it is asked for.
+    """
+    if name == 'core':
+        # -- A relative import would look the attribute up on this module
+        # -- first, coming straight back here
+        import importlib
+        return importlib.import_module(__name__ + '.core')
+
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
@@ -0,0 +1,251 @@
+"""
+This is the entry point of the plugin host process. It is executed directly
+by path rather than imported as part of the launchpanel package, which means
+the host never pays for (or risks) importing Qt. It must therefore only ever
+import from the standard library and launchpad.
+
+The host imports all the plugins once and then serves requests from the
+panel over a local connection. Each connection is served by its own thread,
+so a slow status check never holds up a run request.
+
+Usage:
+
+    python _plugin_host.py <address> <authkey> [<plugin_location> ...]
+"""
+import os
+import sys
+import threading
+import binascii
+import traceback
+import multiprocessing.connection
+
+# -- We're executed by path, so python has put our own directory at the front
+# -- of the sys.path. That would expose the launchpanel modules to plugins as
+# -- top level modules, so we take it back out.
+if __name__ == '__main__':
+    del sys.path[0]
+
+import launchpad
+import importlib.util
+
+# -- We're not imported as part of the launchpanel package, so we load the
+# -- utils module (which only uses the standard library) from alongside us
+_spec = importlib.util.spec_from_file_location(
+    '_launchpanel_utils',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils.py'),
+)
+utils = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(utils)
+
+
+# ------------------------------------------------------------------------------
+def _serialise_menu(structure):
+    """
+    Callables cannot be passed between processes, so this replaces any
+    callables in a menu structure with True whilst retaining any sub menus
+    and separators.
+    """
+    menu = list()
+
+    for label, target in structure.items():
+        if isinstance(target, dict):
+            menu.append((label, _serialise_menu(target)))
+
+        elif callable(target):
+            menu.append((label, True))
+
+        else:
+            menu.append((label, None))
+
+    return menu
+
+
+# ------------------------------------------------------------------------------
+class PluginHost(object):
+    """
+    Holds the factory and resolves any requests made against it. Every
+    public cmd_ method can be called by the panel.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, plugin_locations):
+        self.factory = launchpad.LaunchPad(plugin_locations=plugin_locations)
+
+        # -- Requests are served from multiple threads, so any changes
+        # -- to the factory are serialised
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------------------------------
+    def handle(self, command, kwargs):
+        """
+        Resolves the given command and returns a tuple of (success, result)
+        """
+        handler = getattr(self, 'cmd_%s' % command, None)
+
+        if not handler:
+            return False, 'Unknown command : %s' % command
+
+        # -- We're running code from within a plugin, so we wrap it as we
+        # -- cannot guarantee its quality
+        try:
+            return True, handler(**kwargs)
+
+        except:
+            return False, traceback.format_exc()
+
+    # --------------------------------------------------------------------------
+    def cmd_paths(self):
+        return self.factory.paths()
+
+    # --------------------------------------------------------------------------
+    def cmd_add_path(self, path):
+        with self._lock:
+            self.factory.add_path(path)
+
+    # --------------------------------------------------------------------------
+    def cmd_remove_path(self, path):
+        with self._lock:
+            self.factory.remove_path(path)
+
+    # --------------------------------------------------------------------------
+    def cmd_register_file(self, filepath):
+        """
+        Registers the plugins in the given file without searching any
+        paths, returning their identifiers.
+        """
+        with self._lock:
+            return utils.register_file(self.factory, filepath)
+
+    # --------------------------------------------------------------------------
+    def cmd_identifiers(self, show_beta=False):
+        return self.factory.identifiers(show_beta=show_beta)
+
+    # --------------------------------------------------------------------------
+    def cmd_grouped_identifiers(self, show_beta=False):
+        return self.factory.grouped_identifiers(show_beta=show_beta)
+
+    # --------------------------------------------------------------------------
+    def cmd_describe(self):
+        """
+        Returns the static information of every plugin in one go so the
+        panel does not need to make a request per plugin.
+        """
+        descriptions = dict()
+
+        # -- There may be multiple versions of a plugin, so we always
+        # -- describe the one the factory would give us
+        for identifier in set(plugin.Name for plugin in self.factory.plugins()):
+            plugin = self.factory.request(identifier)
+
+            descriptions[identifier] = dict(
+                Name=plugin.Name,
+                Description=plugin.Description,
+                Icon=plugin.Icon,
+                Groups=list(plugin.Groups or list()),
+                Version=plugin.Version,
+                STATUS_DELAY=plugin.STATUS_DELAY,
+                RUN_CONCURRENCY=getattr(plugin, 'RUN_CONCURRENCY', 1),
+                RUN_QUEUE=getattr(plugin, 'RUN_QUEUE', False),
+                state=plugin.state().value,
+            )
+
+        return descriptions
+
+    # --------------------------------------------------------------------------
+    def cmd_state(self, identifier):
+        return self.factory.request(identifier).state().value
+
+    # --------------------------------------------------------------------------
+    def cmd_status(self, identifier):
+        status = self.factory.request(identifier).status_message() or None
+
+        # -- Whatever we return needs to be passed back to the
+        # -- panel, so we only ever return strings
+        if status is not None:
+            status = str(status)
+
+        return status
+
+    # --------------------------------------------------------------------------
+    def cmd_run(self, identifier):
+        self.factory.request(identifier).run()
+
+    # --------------------------------------------------------------------------
+    def cmd_actions(self, identifier):
+        return _serialise_menu(self.factory.request(identifier).actions())
+
+    # --------------------------------------------------------------------------
+    def cmd_invoke_action(self, identifier, path):
+        """
+        Calls a menu action, where the path is the list of labels leading
+        to it (to allow for sub menus)
+        """
+        target = self.factory.request(identifier).actions()
+
+        for label in path:
+            target = target[label]
+
+        target()
+
+
+# ------------------------------------------------------------------------------
+def _serve_connection(host, connection):
+    """
+    Serves requests on a single connection until it is closed
+    """
+    while True:
+        try:
+            command, kwargs = connection.recv()
+
+        except (EOFError, IOError, OSError):
+            break
+
+        connection.send(host.handle(command, kwargs))
+
+    connection.close()
+
+
+# ------------------------------------------------------------------------------
+def _exit_with_parent():
+    """
+    The panel holds our stdin open for as long as it is alive, so once it
+    closes (even if the panel crashes) we exit too.
+    """
+    sys.stdin.read()
+    os._exit(0)
+
+
+# ------------------------------------------------------------------------------
+def main(address, authkey, plugin_locations):
+    host = PluginHost(plugin_locations)
+
+    # -- Only start listening once all the plugins are imported, the panel
+    # -- will keep trying to connect until then
+    listener = multiprocessing.connection.Listener(
+        address,
+        authkey=authkey,
+    )
+
+    # -- This thread will end the process when the panel goes away
+    watcher = threading.Thread(target=_exit_with_parent)
+    watcher.daemon = True
+    watcher.start()
+
+    while True:
+        connection = listener.accept()
+
+        thread = threading.Thread(
+            target=_serve_connection,
+            args=(host, connection),
+        )
+        thread.daemon = True
+        thread.start()
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main(
+        sys.argv[1],
+        binascii.unhexlify(sys.argv[2]),
+        sys.argv[3:],
+    )
@@ -0,0 +1,172 @@
+"""
+This is the build step which packs everything in the _resources directory
+into a single precompiled bundle. This is made up of a binary Qt resource
+file (holding all the images and stylesheets) and python classes generated
+from each of the designer .ui files.
+
+When the bundle exists (and was built against the Qt binding in use) the
+resources module serves everything from it, meaning there are no individual
+file opens or xml parsing at startup. Without it the files are used as they
+always have been.
+
+The bundle can be built by running:
+
+    python -m launchpanel.bundle
+
+The rcc and uic tools are guessed from the Qt binding in use, but can be
+given explicitly:
+
+    python -m launchpanel.bundle rcc=/path/to/rcc uic=/path/to/uic
+
+Passing verbose=true prints each command as it is run.
+
+The bundle is written to the _compiled directory, which is packaged along
+with launchpanel when it exists, so it should be built before packaging.
+"""
+import os
+import sys
+import subprocess
+import xml.etree.ElementTree
+
+from . import utils
+from . import resources
+
+
+# -- These are the tools we look for if none are given. The binary resource
+# -- is always built by rcc itself, as the binding wrappers only generate python
+_RCC_TOOLS = ['rcc', 'pyside6-rcc', 'rcc-qt5', 'rcc-qt6']
+
+_UIC_TOOLS = {
+    'PySide6': 'pyside6-uic',
+    'PySide2': 'pyside2-uic',
+    'PyQt5': 'pyuic5',
+    'PyQt4': 'pyuic4',
+    'PySide': 'pyside-uic',
+}
+
+
+# ------------------------------------------------------------------------------
+def _run(command, verbose=False):
+    """
+    Runs the given command, raising if it fails
+    """
+    if verbose:
+        print(' '.join(command))
+
+    subprocess.check_call(command)
+
+
+# ------------------------------------------------------------------------------
+def _write_qrc(filepath, names):
+    """
+    Writes out the qrc file describing all our resources
+    """
+    lines = [
+        '<!DOCTYPE RCC><RCC version="1.0">',
+        '<qresource prefix="/%s">' % resources.BUNDLE_PREFIX,
+    ]
+
+    for name in names:
+        lines.append(
+            '    <file alias="%s">%s</file>' % (
+                name,
+                os.path.join(resources.location(), name).replace('\\', '/'),
+            )
+        )
+
+    lines.append('</qresource>')
+    lines.append('</RCC>')
+
+    with open(filepath, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+# ------------------------------------------------------------------------------
+def _ui_class(filepath):
+    """
+    Returns the generated class name and the base widget class of a
+    designer .ui file
+    """
+    root = xml.etree.ElementTree.parse(filepath).getroot()
+    widget = root.find('widget')
+
+    return 'Ui_%s' % widget.get('name'), widget.get('class')
+
+
+# ------------------------------------------------------------------------------
+def build(rcc=None, uic=None, verbose=False):
+    """
+    Builds the bundle into the _compiled directory.
+
+    :param rcc: Optional path to the rcc tool
+    :param uic: Optional path to the uic tool for the Qt binding in use
+    :param verbose: If True each command is printed as it is run
+    """
+    import Qt
+
+    output = resources.compiled_location()
+
+    if not os.path.exists(output):
+        os.makedirs(output)
+
+    names = sorted(os.listdir(resources.location()))
+
+    # -- Pack all the resources into the binary resource file
+    qrc_path = os.path.join(output, 'resources.qrc')
+    _write_qrc(qrc_path, names)
+
+    errors = list()
+
+    for tool in [rcc] if rcc else _RCC_TOOLS:
+        try:
+            _run(
+                [tool, '-binary', qrc_path, '-o', os.path.join(output, resources.BUNDLE_FILE)],
+                verbose,
+            )
+            break
+
+        except (OSError, subprocess.CalledProcessError):
+            errors.append(str(sys.exc_info()[1]))
+
+    else:
+        raise Exception('Could not build the resource file :\n%s' % '\n'.join(errors))
+
+    os.remove(qrc_path)
+
+    # -- Now generate a python class for each ui file
+    ui_classes = dict()
+    uic = uic or _UIC_TOOLS[Qt.__binding__]
+
+    for name in names:
+        if not name.endswith('.ui'):
+            continue
+
+        module_name = 'ui_%s' % name[:-3]
+
+        _run(
+            [uic, resources.get_file(name), '-o', os.path.join(output, module_name + '.py')],
+            verbose,
+        )
+        ui_classes[name] = (module_name,) + _ui_class(resources.get_file(name))
+
+    # -- Finally write out the description of the bundle. This is what the
+    # -- resources module reads to decide whether it can use the bundle
+    with open(os.path.join(output, '__init__.py'), 'w') as f:
+        f.write(
+            '"""\nThis is generated by launchpanel.bundle, do not edit it.\n"""\n'
+            'BINDING = %r\n\nRESOURCES = %r\n\nUI_CLASSES = %r\n' % (
+                Qt.__binding__,
+                names,
+                ui_classes,
+            )
+        )
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    _, _kwargs = utils.format_sys_argv()
+    build(
+        rcc=_kwargs.get('rcc'),
+        uic=_kwargs.get('uic'),
+        verbose=_kwargs.get('verbose', False),
+    )
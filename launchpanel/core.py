@@ -15,18 +15,24 @@ This module has the following dependencies:
 """
 import os
 import sys
-import time
-import ctypes
 import qtility
-import scribble
 import launchpad
 import functools
+import contextlib
 import collections
 
 from Qt import QtCore, QtGui, QtWidgets
 
-from . import create
+from . import utils
+from . import engine
+from . import status
+from . import environment
+from . import instance
+from . import imaging
+from . import execution
 from . import styling
+from . import tracing
+from . import watchdog
 from . import resources
 from . import constants as c
 
@@ -42,8 +48,20 @@ class LaunchPanel(QtWidgets.QWidget):
     TAB_SIDE = 1
     TAB_TOP = 2
 
+    # -- This is how long (in ms) we wait for the icon size to settle
+    # -- before rebuilding the pixmaps at full quality
+    ICON_RESIZE_DELAY = 250
+
+    # -- This is how long (in ms) we gather status results for before
+    # -- saving them to the status history
+    STATUS_HISTORY_DELAY = 2000
+
     tabStateUpdated = QtCore.Signal(object)
 
+    # -- This is emitted (from a background thread) once the mirror has
+    # -- synced, stating whether anything changed
+    mirrorSynced = QtCore.Signal(bool)
+
     # --------------------------------------------------------------------------
     def __init__(self,
                  plugin_locations=None,
@@ -51,11 +69,23 @@ class LaunchPanel(QtWidgets.QWidget):
                  # style='space',
                  title='Launch Panel',
                  style_overrides=None,
-                 parent=None):
+                 parent=None,
+                 use_plugin_host=None,
+                 use_mirror=None):
         super(LaunchPanel, self).__init__(parent=parent)
 
-        # -- Store our scribble id
+        # -- Store our scribble id, along with the settings of the
+        # -- environment which are cached for the whole session
         self.environment_id = environment_id
+        self.settings = environment.settings(environment_id)
+
+        # -- The last known statuses are shown whilst the status checks run,
+        # -- and are saved once the results stop arriving
+        self.status_history = status.history(environment_id)
+        self._history_timer = QtCore.QTimer(self)
+        self._history_timer.setSingleShot(True)
+        self._history_timer.setInterval(self.STATUS_HISTORY_DELAY)
+        self._history_timer.timeout.connect(self.status_history.save)
 
         # -- Store the base launch panel title
         self.base_title = title
@@ -63,6 +93,11 @@ class LaunchPanel(QtWidgets.QWidget):
         # -- Define our alert icon
         self._alert_icon = QtGui.QIcon(QtGui.QPixmap(resources.get('alert.png')))
 
+        # -- These allow us to go straight from an action list to its tab
+        # -- and the badge showing its number of alerts
+        self._tab_lookup = dict()
+        self._tab_badges = dict()
+
         # -- Set the window properties
         self.setWindowTitle('Launch Panel')
         self.setWindowIcon(QtGui.QIcon(resources.get('launch.png')))
@@ -70,14 +105,16 @@ class LaunchPanel(QtWidgets.QWidget):
         # -- If we're on windows we need to tell windows that python is actually just
         # -- hosting an application and is not the application itself.
         if sys.platform == 'win32':
+            import ctypes
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(c.APP_ID)
 
         # -- Create a default layout
         self.setLayout(qtility.layouts.slimify(QtWidgets.QVBoxLayout()))
         
         # -- Load in the ui
-        self.ui = qtility.designer.load(resources.get('launchpad.ui'))
-        self.layout().addWidget(self.ui)
+        with tracing.span('load ui', 'startup'):
+            self.ui = resources.load_ui('launchpad.ui')
+            self.layout().addWidget(self.ui)
 
         # -- Assign icons
         self.ui.tabPanel.setTabIcon(
@@ -85,57 +122,103 @@ class LaunchPanel(QtWidgets.QWidget):
             QtGui.QIcon(QtGui.QPixmap(resources.get('options.png'))),
         )
 
-        qtility.styling.apply(
-            [
-                styling.get_style(),
-            ],
-            self,
-        )
-
-        # -- Set the window geometry if we have the settings
-        settings = scribble.get(self.environment_id)
-        self.window().setGeometry(
-            *settings.get(
-                'geometry',
+        with tracing.span('apply stylesheet', 'style', target='LaunchPanel'):
+            qtility.styling.apply(
                 [
-                    300,
-                    300,
-                    400,
-                    400,
-                ]
+                    styling.get_style(),
+                ],
+                self,
             )
-        )
+
+        # -- Set the window geometry if we have the settings
+        self.window().setGeometry(*self.settings.geometry)
 
         # -- Update the icon size variable to reflect what it actually
         # -- is
-        self.ui.iconSize.setValue(settings.get('icon_size', 50))
-        self.ui.statusInterval.setValue(settings.get('status_inverval', 1800))
-        self.ui.showBeta.setChecked(settings.get('show_beta', False))
+        self.ui.iconSize.setValue(self.settings.icon_size)
+        self.ui.statusInterval.setValue(self.settings.status_interval)
+        self.ui.showBeta.setChecked(self.settings.show_beta)
+        self.ui.throttleStatusChecks.setChecked(self.settings.throttle_status_checks)
 
         # -- Combine any paths we're given with any stored paths
         # -- and then ensure we remove any duplicates
-        stored_plugin_paths = settings.get('plugin_locations', [])
+        stored_plugin_paths = self.settings.plugin_locations
         stored_plugin_paths.extend(plugin_locations or list())
         stored_plugin_paths = list(set(stored_plugin_paths))
 
         # -- Define the default settings
         self.tabMode = None
-        self.setTabMode(scribble.get(environment_id).get('tabMode', self.TAB_AUTO))
+        tab_mode = self.settings.tab_mode
+        self.setTabMode(self.TAB_AUTO if tab_mode is None else tab_mode)
 
         # -- We'll store all of our list widgets here so we can interact
         # -- with them as we need to
         self._action_lists = list()
 
-        # -- Now we need to instance our action factory
-        self.factory = launchpad.LaunchPad(plugin_locations=stored_plugin_paths)
+        # -- Now we need to get our action factory. This comes from the engine
+        # -- which is shared by all the panels in this process, so any other
+        # -- panel using the same locations will share the factory. If
+        # -- requested we run the plugins in a separate host process,
+        # -- otherwise they are imported directly into this process.
+        if use_plugin_host is None:
+            use_plugin_host = self.settings.use_plugin_host
+
+        # -- If requested, plugins are read from a local mirror of their
+        # -- locations rather than from the locations themselves
+        if use_mirror is None:
+            use_mirror = self.settings.use_mirror
+
+        self.mirror = None
+
+        if use_mirror:
+            from . import mirror
+            self.mirror = mirror.Mirror()
+
+        self.mirrorSynced.connect(self.mirrorUpdated)
+
+        self.engine = engine.get()
+
+        # -- Watch for the ui becoming unresponsive. Setting the threshold
+        # -- to zero in the settings turns this off
+        self.engine.setStallThreshold(self.settings.stall_threshold, owner=self)
+        self.use_plugin_host = use_plugin_host
+        self.factory = None
+
+        # -- These are the locations this panel was asked to search, which
+        # -- do not include any the factory adds itself
+        self.plugin_locations = list()
+
+        # -- Once we're gone the engine can discard our factory if no
+        # -- other panel is using it
+        self.destroyed.connect(functools.partial(self.engine.release, self))
+
+        # -- Plugins registered by any panel sharing our factory are
+        # -- added to our ui too
+        self.engine.pluginRegistered.connect(self._pluginRegistered)
+
+        with tracing.span('discover plugins', 'startup'):
+            self.setPluginPaths(stored_plugin_paths)
+
+        # -- All action runs go through the runner, which tracks which
+        # -- actions are in flight
+        self.runner = execution.ActionRunner(parent=self)
+        self.runner.started.connect(self.actionStarted)
+        self.runner.finished.connect(self.actionFinished)
+
+        # -- Whilst the tabs are being rebuilt we hold back reacting to
+        # -- the active tab changing, see _rebuildingTabs
+        self._rebuilding_tabs = False
 
         # -- Populate the ui with all our actions
-        self.populate()
+        with tracing.span('populate', 'startup'):
+            self.populate()
 
         # -- Each user has their own favourites tab which they
         # -- can pin things to
         self.user_tab = None
-        self.populateUserActions()
+
+        with tracing.span('populate user actions', 'startup'):
+            self.populateUserActions()
 
         # -- Now we restore our tab based on the scribble settings
         self.restoreActiveTab()
@@ -145,10 +228,21 @@ class LaunchPanel(QtWidgets.QWidget):
         # -- are present
         self._timer = QtCore.QTimer(self)
         self._timer.setSingleShot(False)
-        self._timer.setInterval(settings.get('status_inverval', 1800) * 1000)
+        self._timer.setInterval(self.settings.status_interval * 1000)
         self._timer.timeout.connect(self.performStatusCheck)
+        self._timer.timeout.connect(self.syncMirror)
         self._timer.start()
 
+        # -- Resizing the icons is coalesced through this timer so we
+        # -- only rebuild the pixmaps once the user stops dragging
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.ICON_RESIZE_DELAY)
+        self._resize_timer.timeout.connect(self.finaliseIconSize)
+
+        # -- This is the window whose screen changes we are watching
+        self._watched_window = None
+
         # -- Hook up signals and slots
         self.ui.iconSize.valueChanged.connect(self.resizeIcons)
         self.ui.addPluginPath.clicked.connect(self.addPluginPath)
@@ -158,9 +252,13 @@ class LaunchPanel(QtWidgets.QWidget):
         self.ui.tabModeCombo.currentIndexChanged.connect(self.setTabMode)
         self.ui.statusInterval.valueChanged.connect(self.updateStatusInterval)
         self.ui.showBeta.stateChanged.connect(self.toggleBetaPlugins)
+        self.ui.throttleStatusChecks.stateChanged.connect(self.toggleStatusThrottling)
+        self.ui.refreshStatusMetrics.clicked.connect(self.refreshStatusMetrics)
+        self.ui.tabPanel.currentChanged.connect(self.refreshStatusMetrics)
 
-        # -- Begin with a status check
+        # -- Begin with a status check, and bring the mirror up to date
         self.performStatusCheck()
+        self.syncMirror()
 
     # --------------------------------------------------------------------------
     def setTabMode(self, tab_mode=None):
@@ -185,9 +283,7 @@ class LaunchPanel(QtWidgets.QWidget):
         self.ui.tabModeCombo.setCurrentIndex(tab_mode)
 
         # -- Store the tab mode into the scribble data
-        settings = scribble.get(self.environment_id)
-        settings['tabMode'] = tab_mode
-        settings.save()
+        self.settings.tab_mode = tab_mode
 
         # -- Test whether the window is wide
         is_wide = self.size().width() > self.size().height()
@@ -198,26 +294,30 @@ class LaunchPanel(QtWidgets.QWidget):
         # -- set the orientation of the tab bar to the top
         if self.tabMode == self.TAB_TOP or should_be_top:
             self.ui.tabPanel.setTabPosition(QtWidgets.QTabWidget.North)
-            qtility.styling.apply(
-                [
-                    styling.get_style(),
-                    resources.get('north.qss'),
-                ],
-                self.ui.tabPanel,
-            )
+
+            with tracing.span('apply stylesheet', 'style', target='north.qss'):
+                qtility.styling.apply(
+                    [
+                        styling.get_style(),
+                        styling.get_style('north.qss'),
+                    ],
+                    self.ui.tabPanel,
+                )
 
         # -- To be here we're expected to have the tab on the side, or we're
         # -- in auto mode and the window is long, so we switch to a side
         # -- tab
         else:
             self.ui.tabPanel.setTabPosition(QtWidgets.QTabWidget.West)
-            qtility.styling.apply(
-                [
-                    styling.get_style(),
-                    resources.get('west.qss'),
-                ],
-                self.ui.tabPanel,
-            )
+
+            with tracing.span('apply stylesheet', 'style', target='west.qss'):
+                qtility.styling.apply(
+                    [
+                        styling.get_style(),
+                        styling.get_style('west.qss'),
+                    ],
+                    self.ui.tabPanel,
+                )
 
     # --------------------------------------------------------------------------
     def populate(self):
@@ -227,63 +327,101 @@ class LaunchPanel(QtWidgets.QWidget):
         """
         # -- Clear the plugin combo and refresh it
         self.ui.pluginPaths.clear()
-        for path in self.factory.paths():
+        for path in self.pluginPaths():
             self.ui.pluginPaths.addItem(path)
 
-        # -- Clear all our list widget references
-        self._action_lists = list()
+        with self._rebuildingTabs():
 
-        # -- This is a list of tabs we never want to remove
-        protected_tabs = ['']
+            # -- This is a list of tabs we never want to remove
+            protected_tabs = ['']
 
-        # -- Start by clearing all tabs and entries in the 'all' panel
-        while self.ui.tabPanel.count() > len(protected_tabs):
-            for tab_index in range(self.ui.tabPanel.count()):
-                if self.ui.tabPanel.tabText(tab_index) not in protected_tabs:
-                    self.ui.tabPanel.removeTab(tab_index)
-                    break
+            # -- Start by clearing all tabs and entries in the 'all' panel
+            while self.ui.tabPanel.count() > len(protected_tabs):
+                for tab_index in range(self.ui.tabPanel.count()):
+                    if self.ui.tabPanel.tabText(tab_index) not in protected_tabs:
+                        self._removeTab(tab_index)
+                        break
 
-        # -- Get the scribble settings
-        settings = scribble.get(self.environment_id)
+            # -- Clear all our list widget references
+            self._action_lists = list()
 
-        # -- Now we can begin populating all the tabs. We start by adding
-        # -- the persistent 'All' tab which shows all actions
-        widget = ActionListWidget(
-            factory=self.factory,
-            action_list=None,
-            show_beta=self.ui.showBeta.isChecked(),
-            size=settings.get('icon_size', 75),
-            parent=self,
-        )
-        self._action_lists.append(widget)
+            # -- Now we can begin populating all the tabs. We start by adding
+            # -- the persistent 'All' tab which shows all actions
+            widget = ActionListWidget(
+                factory=self.factory,
+                action_list=None,
+                show_beta=self.ui.showBeta.isChecked(),
+                size=self.settings.icon_size,
+                parent=self,
+            )
+            self._action_lists.append(widget)
 
-        # -- Add the tab into the ui
-        self.ui.tabPanel.insertTab(
-            0,
-            widget,
-            'All',
-        )
+            # -- Add the tab into the ui
+            self.ui.tabPanel.insertTab(
+                0,
+                widget,
+                'All',
+            )
 
-        # -- We now need to cycle over all the grouped identifiers
-        # -- and create a ListWidget containing them.
-        groups = self.factory.grouped_identifiers(
-            show_beta=self.ui.showBeta.isChecked(),
-        )
+            # -- We now need to cycle over all the grouped identifiers
+            # -- and create a ListWidget containing them.
+            groups = self.factory.grouped_identifiers(
+                show_beta=self.ui.showBeta.isChecked(),
+            )
 
-        group_names = reversed(sorted(list(groups.keys())))
+            group_names = reversed(sorted(list(groups.keys())))
 
-        for group_name in group_names:
+            for group_name in group_names:
 
-            # -- We do not show uncategorised items. They will
-            # -- show in the 'All' tab
-            if group_name == 'Uncategorised':
-                continue
+                # -- We do not show uncategorised items. They will
+                # -- show in the 'All' tab
+                if group_name == 'Uncategorised':
+                    continue
 
+                widget = ActionListWidget(
+                    factory=self.factory,
+                    action_list=groups[group_name],
+                    show_beta=self.ui.showBeta.isChecked(),
+                    size=self.settings.icon_size,
+                    parent=self,
+                )
+
+                # -- Hook up event signals specific to this widget type
+                widget.alertPropogation.connect(self.updateTabState)
+
+                # -- Hook up the event to update the ui whenever the
+                # -- user scrolls over
+                self.ui.tabPanel.insertTab(
+                    0,
+                    widget,
+                    group_name,
+                )
+                self._action_lists.append(widget)
+
+    # --------------------------------------------------------------------------
+    def populateUserActions(self):
+        """
+        Builds the users customisable tab
+        """
+        with self._rebuildingTabs():
+
+            # -- Read the user settings
+            user_picked_actions = self.settings.user_actions
+            user_tab_index = self._getIndexFromTabName('[+]')
+
+            if user_tab_index >= 0:
+                self.user_tab = None
+                self._removeTab(user_tab_index)
+
+            if not user_picked_actions:
+                return
+
+            # -- Build the tab
             widget = ActionListWidget(
                 factory=self.factory,
-                action_list=groups[group_name],
+                action_list=user_picked_actions,
                 show_beta=self.ui.showBeta.isChecked(),
-                size=settings.get('icon_size', 75),
+                size=self.settings.icon_size,
                 parent=self,
             )
 
@@ -295,53 +433,54 @@ class LaunchPanel(QtWidgets.QWidget):
             self.ui.tabPanel.insertTab(
                 0,
                 widget,
-                group_name,
+                '[+]',
             )
             self._action_lists.append(widget)
 
     # --------------------------------------------------------------------------
-    def populateUserActions(self):
+    @contextlib.contextmanager
+    def _rebuildingTabs(self):
         """
-        Builds the users customisable tab
+        Holds back reacting to the active tab changing whilst the tabs are
+        rebuilt, as it changes with every tab removed or added. Once they
+        are rebuilt the tab which was active beforehand is made active
+        again, and we only react if that tab no longer exists.
         """
-        # -- Get the current tab name
         current_tab = self.ui.tabPanel.tabText(self.ui.tabPanel.currentIndex())
+        self._rebuilding_tabs = True
 
-        # -- Read the user settings
-        settings = scribble.get(self.environment_id)
-        user_picked_actions = settings.get('user_actions', list())
-        user_tab_index = self._getIndexFromTabName('[+]')
+        try:
+            yield
+            self._setTabByName(current_tab)
 
-        if user_tab_index >= 0:
-            self.user_tab = None
-            self.ui.tabPanel.removeTab(user_tab_index)
+        finally:
+            self._rebuilding_tabs = False
 
-        if not user_picked_actions:
-            return
+        if self.ui.tabPanel.tabText(self.ui.tabPanel.currentIndex()) != current_tab:
+            self.storeActiveTab()
+            self.refreshStatusMetrics()
 
-        # -- Build the tab
-        widget = ActionListWidget(
-            factory=self.factory,
-            action_list=user_picked_actions,
-            show_beta=self.ui.showBeta.isChecked(),
-            size=settings.get('icon_size', 75),
-            parent=self,
-        )
+    # --------------------------------------------------------------------------
+    def _removeTab(self, tab_index):
+        """
+        Removes the given tab. If it holds an action list then the list is
+        torn down, cancelling any checks it has in flight and freeing its
+        delegates and pixmaps.
+        """
+        widget = self.ui.tabPanel.widget(tab_index)
+        self.ui.tabPanel.removeTab(tab_index)
 
-        # -- Hook up event signals specific to this widget type
-        widget.alertPropogation.connect(self.updateTabState)
+        # -- The tab bar deletes the badge along with the tab
+        self._tab_lookup.pop(widget, None)
+        self._tab_badges.pop(widget, None)
 
-        # -- Hook up the event to update the ui whenever the
-        # -- user scrolls over
-        self.ui.tabPanel.insertTab(
-            0,
-            widget,
-            '[+]',
-        )
-        self._action_lists.append(widget)
+        if not isinstance(widget, ActionListWidget):
+            return
+
+        if widget in self._action_lists:
+            self._action_lists.remove(widget)
 
-        # -- Restore the tab selection
-        self._setTabByName(current_tab)
+        widget.teardown()
 
     # --------------------------------------------------------------------------
     # noinspection PyUnusedLocal
@@ -356,6 +495,34 @@ class LaunchPanel(QtWidgets.QWidget):
         # -- Store the current window size in our scribble settings
         self.storeWidgetGeometry()
 
+    # --------------------------------------------------------------------------
+    # noinspection PyUnusedLocal
+    def showEvent(self, event):
+        """
+        Watches for the window moving between screens, as the icons need
+        rebuilding if the screens have different pixel ratios.
+        """
+        handle = self.window().windowHandle()
+
+        if handle and handle is not self._watched_window:
+            handle.screenChanged.connect(self.updateDevicePixelRatio)
+            self._watched_window = handle
+
+        self.updateDevicePixelRatio()
+
+    # --------------------------------------------------------------------------
+    def updateDevicePixelRatio(self, screen=None):
+        """
+        Rebuilds the icons of all the lists if the pixel ratio of the screen
+        the panel is on has changed.
+
+        :param screen: Optional QScreen the panel is now on
+        """
+        ratio = imaging.device_pixel_ratio(screen or self)
+
+        for list_widget in self._action_lists:
+            list_widget.setDevicePixelRatio(ratio)
+
     # --------------------------------------------------------------------------
     # noinspection PyUnusedLocal
     def hideEvent(self, event):
@@ -366,6 +533,10 @@ class LaunchPanel(QtWidgets.QWidget):
         # -- Store the current window size in our scribble settings
         self.storeWidgetGeometry()
 
+        # -- Save any statuses which are waiting to be saved
+        self._history_timer.stop()
+        self.status_history.save()
+
     # --------------------------------------------------------------------------
     def storeWidgetGeometry(self):
         """
@@ -374,15 +545,91 @@ class LaunchPanel(QtWidgets.QWidget):
 
         # -- Store the current window size in our scribble settings
         window = self.window()
-        settings = scribble.get(self.environment_id)
-        settings['geometry'] = [
+        self.settings.geometry = [
             window.pos().x() + 7,
             window.pos().y() + 32,
             window.width(),
             window.height(),
         ]
 
-        settings.save()
+    # --------------------------------------------------------------------------
+    def pluginPaths(self):
+        """
+        Returns the plugin locations the factory is searching. If the mirror
+        is in use these are the mirrored locations rather than the local
+        copies.
+
+        :return: list(str)
+        """
+        paths = self.factory.paths()
+
+        if self.mirror:
+            paths = [self.mirror.remote(path) for path in paths]
+
+        return paths
+
+    # --------------------------------------------------------------------------
+    def setPluginPaths(self, plugin_locations, refresh=False):
+        """
+        Switches to the factory for the given plugin locations. The factory
+        may be shared with other panels, so rather than changing it we ask
+        the engine for the factory of the new locations. This does not
+        repopulate the ui.
+
+        :param plugin_locations: List of plugin locations
+        :param refresh: If True the locations are searched again, even if
+            there is already a factory for them
+        """
+        self.plugin_locations = list(plugin_locations)
+
+        if self.mirror:
+            plugin_locations = self.mirror.localise(plugin_locations)
+
+        self.factory = self.engine.factory(
+            plugin_locations=plugin_locations,
+            use_plugin_host=self.use_plugin_host,
+            refresh=refresh,
+            owner=self,
+        )
+
+        # -- Any locations which are not mirrored yet are used directly, so
+        # -- we start mirroring them. Once they are mirrored we are told
+        # -- through mirrorSynced and switch to the local copies.
+        if self.mirror and not all(self.mirror.synced(path) for path in self.plugin_locations):
+            self.syncMirror()
+
+        # -- A refreshed factory gives us new plugins, so none of the
+        # -- cached menu entries are needed
+        if refresh:
+            self.engine.menus.invalidate()
+
+    # --------------------------------------------------------------------------
+    def syncMirror(self):
+        """
+        Brings the mirror up to date in the background. If anything has
+        changed the ui is refreshed once the sync is complete.
+        """
+        if not self.mirror:
+            return
+
+        self.mirror.sync_in_background(
+            self.plugin_locations,
+            callback=self.mirrorSynced.emit,
+        )
+
+    # --------------------------------------------------------------------------
+    def mirrorUpdated(self, changed):
+        """
+        Triggered once the mirror has synced. If anything changed then the
+        plugins are searched for again and the ui is refreshed.
+        """
+        if not changed:
+            return
+
+        self.setPluginPaths(self.plugin_locations, refresh=True)
+        self.populate()
+        self.populateUserActions()
+        self.performStatusCheck()
 
     # --------------------------------------------------------------------------
     def addPluginPath(self, path=None):
@@ -404,12 +651,10 @@ class LaunchPanel(QtWidgets.QWidget):
             path = path.replace('\\', '/')
 
         # -- Add the path and refresh the ui
-        self.factory.add_path(path)
+        self.setPluginPaths(self.plugin_locations + [path])
 
         # -- Update the paths in the scribble data
-        settings = scribble.get(self.environment_id)
-        settings['plugin_locations'] = self.factory.paths()
-        settings.save()
+        self.settings.plugin_locations = self.plugin_locations
 
         # -- Re-populate the ui
         self.populate()
@@ -430,15 +675,20 @@ class LaunchPanel(QtWidgets.QWidget):
         path = path or self.ui.pluginPaths.currentText()
 
         # -- Remove the path and re-populate the ui only if the
-        # -- path exists in the factory
-        if path in self.factory.paths():
-            self.factory.remove_path(path)
+        # -- path is one this panel was given
+        if path in self.plugin_locations:
+            self.setPluginPaths(
+                [
+                    location
+                    for location in self.plugin_locations
+                    if location != path
+                ],
+            )
             self.populate()
+            self.populateUserActions()
 
             # -- Update the paths in the scribble data
-            settings = scribble.get(self.environment_id)
-            settings['plugin_locations'] = self.factory.paths()
-            settings.save()
+            self.settings.plugin_locations = self.plugin_locations
 
     # --------------------------------------------------------------------------
     # noinspection PyUnusedLocal
@@ -446,11 +696,12 @@ class LaunchPanel(QtWidgets.QWidget):
         """
         This stores the currently active tab into the scribble data
         """
-        settings = scribble.get(self.environment_id)
-        settings['active_tab'] = self.ui.tabPanel.tabText(
+        if self._rebuilding_tabs:
+            return
+
+        self.settings.active_tab = self.ui.tabPanel.tabText(
             self.ui.tabPanel.currentIndex(),
         )
-        settings.save()
 
     # --------------------------------------------------------------------------
     def restoreActiveTab(self):
@@ -459,8 +710,7 @@ class LaunchPanel(QtWidgets.QWidget):
         that if it exists.
         """
         # -- Get the stored tab name from the settings
-        settings = scribble.get(self.environment_id)
-        tab_name = settings.get('active_tab', None)
+        tab_name = self.settings.active_tab
 
         # -- If no tab information is stored we do not do anything
         if not tab_name:
@@ -472,9 +722,7 @@ class LaunchPanel(QtWidgets.QWidget):
     # ----------------------------------------------------------------------------------
     def toggleBetaPlugins(self):
 
-        settings = scribble.get(self.environment_id)
-        settings['show_beta'] = self.ui.showBeta.isChecked()
-        settings.save()
+        self.settings.show_beta = self.ui.showBeta.isChecked()
 
         self.populate()
         self.populateUserActions()
@@ -483,8 +731,9 @@ class LaunchPanel(QtWidgets.QWidget):
     def resizeIcons(self, icon_size=None):
         """
         Resizes the icons to the given size (or to the ui settings if no
-        size is given). All changes through this method will be stored
-        ready for the next run.
+        size is given). The existing pixmaps are scaled immediately, and
+        once the size settles they are rebuilt at full quality and the
+        size is stored ready for the next run.
 
         :param icon_size:
         :return:
@@ -498,10 +747,21 @@ class LaunchPanel(QtWidgets.QWidget):
         for action_list in self._action_lists:
             action_list.setIconSize(QtCore.QSize(icon_size, icon_size))
 
+        # -- (Re)start the timer, meaning we only finalise once there
+        # -- have been no changes for a short period
+        self._resize_timer.start()
+
+    # --------------------------------------------------------------------------
+    def finaliseIconSize(self):
+        """
+        Rebuilds all the pixmaps at the current icon size and stores
+        the size in the settings.
+        """
+        for action_list in self._action_lists:
+            action_list.requestPixmaps()
+
         # -- Store the value in the scribble settings
-        settings = scribble.get(self.environment_id)
-        settings['icon_size'] = self.ui.iconSize.value()
-        settings.save()
+        self.settings.icon_size = self.ui.iconSize.value()
 
     # --------------------------------------------------------------------------
     def updateStatusInterval(self, inverval=None):
@@ -517,9 +777,79 @@ class LaunchPanel(QtWidgets.QWidget):
         self._timer.setInterval(interval * 1000)
 
         # -- Store the value in the scribble settings
-        settings = scribble.get(self.environment_id)
-        settings['status_inverval'] = interval
-        settings.save()
+        self.settings.status_interval = interval
+
+    # --------------------------------------------------------------------------
+    def toggleStatusThrottling(self):
+        """
+        Sets whether plugins whose status checks keep failing are throttled
+        """
+        self.settings.throttle_status_checks = self.ui.throttleStatusChecks.isChecked()
+
+        self.refreshStatusMetrics()
+
+    # --------------------------------------------------------------------------
+    # noinspection PyUnusedLocal
+    def refreshStatusMetrics(self, *args, **kwargs):
+        """
+        Shows the status check metrics of every plugin in the options tab.
+        This is only done whilst the options tab is visible.
+        """
+        if self._rebuilding_tabs:
+            return
+
+        if self.ui.tabPanel.currentWidget() != self.ui.TabOptions:
+            return
+
+        table = self.ui.statusMetrics
+
+        headers = [
+            'Plugin',
+            'Checks',
+            'Errors',
+            'Timeouts',
+            'Mean (ms)',
+            'Max (ms)',
+            'Latency (%s s)' % ' / '.join(str(b) for b in status.Metrics.BUCKETS + ['+']),
+            'Throttled',
+            'Last Error',
+        ]
+
+        # -- Sorting has to be suspended whilst we fill the table,
+        # -- otherwise rows move as they are being filled
+        table.setSortingEnabled(False)
+        table.clear()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+
+        report = status.metrics().report()
+        table.setRowCount(len(report))
+
+        for row, entry in enumerate(report):
+            values = [
+                entry['name'],
+                entry['calls'],
+                entry['errors'],
+                entry['timeouts'],
+                int(entry['mean_time'] * 1000),
+                int(entry['max_time'] * 1000),
+                ' / '.join(str(count) for count in entry['histogram']),
+                'Yes' if entry['throttled'] and self.settings.throttle_status_checks else '',
+                entry['last_error'] or '',
+            ]
+
+            for column, value in enumerate(values):
+                # -- Numbers are stored as numbers so they sort as such
+                table_item = QtWidgets.QTableWidgetItem()
+                table_item.setData(QtCore.Qt.DisplayRole, value)
+
+                if column == len(values) - 1:
+                    table_item.setToolTip(value)
+
+                table.setItem(row, column, table_item)
+
+        table.setSortingEnabled(True)
+        table.resizeColumnsToContents()
 
     # --------------------------------------------------------------------------
     # noinspection PyUnusedLocal
@@ -542,11 +872,147 @@ class LaunchPanel(QtWidgets.QWidget):
 
     # --------------------------------------------------------------------------
     def initiateWizard(self):
+        # -- The wizard is rarely used, so we only import it on demand
+        from . import create
+
         wizard = create.ClassWizard()
         wizard.exec_()
 
-        if wizard.save_directory:
-            self.addPluginPath(wizard.save_directory)
+        if wizard.save_location:
+            self.registerPluginFile(wizard.save_location)
+
+    # --------------------------------------------------------------------------
+    def registerPluginFile(self, filepath):
+        """
+        Registers the plugins within the given file and adds them to the ui
+        without repopulating it. If the file is not within a location the
+        factory already knows about then the location is added instead.
+
+        :param filepath: Absolute path to the plugin file
+        """
+        directory = os.path.abspath(os.path.dirname(filepath))
+        known_paths = [
+            os.path.abspath(path)
+            for path in self.pluginPaths()
+        ]
+
+        if not any(
+                (directory + os.sep).startswith(path + os.sep)
+                for path in known_paths
+        ):
+            self.addPluginPath(directory)
+            return
+
+        # -- The factory may be shared, so the engine tells every panel
+        # -- using it about the plugins through pluginRegistered
+        self.engine.registerPluginFile(self.factory, filepath)
+
+    # --------------------------------------------------------------------------
+    def _pluginRegistered(self, factory, identifiers):
+        """
+        Adds the plugins which were registered with our factory to the ui,
+        replacing the rows of any which were already shown.
+
+        :param factory: The factory the plugins were registered with
+        :param identifiers: Identifiers of the registered plugins
+        """
+        if factory is not self.factory:
+            return
+
+        for identifier in identifiers:
+            self.addAction(identifier)
+
+    # --------------------------------------------------------------------------
+    def addAction(self, identifier):
+        """
+        Adds the given action into the 'All' tab and the tabs of each of
+        its groups, creating any group tabs which do not yet exist.
+
+        :param identifier: Identifier of the action to add
+        """
+        action = self.factory.request(identifier)
+        state = action.state()
+
+        # -- Respect the same filtering as a full population
+        if state == launchpad.PluginStates.INVALID:
+            return
+
+        if launchpad.PluginStates.BETA in state and not self.ui.showBeta.isChecked():
+            return
+
+        for group_name in ['All'] + list(action.Groups or list()):
+
+            widget = self.ui.tabPanel.widget(self._getIndexFromTabName(group_name))
+
+            if not isinstance(widget, ActionListWidget):
+                widget = self._addGroupTab(group_name)
+
+            item = widget.addAction(identifier)
+            widget.performSingleStatusCheck(item)
+
+    # --------------------------------------------------------------------------
+    def _addGroupTab(self, group_name):
+        """
+        Creates an empty tab for the given group, placing it alphabetically
+        amongst the other group tabs.
+        """
+        widget = ActionListWidget(
+            factory=self.factory,
+            action_list=[],
+            show_beta=self.ui.showBeta.isChecked(),
+            size=self.settings.icon_size,
+            parent=self,
+        )
+        widget.alertPropogation.connect(self.updateTabState)
+
+        # -- Group tabs sit before the 'All' tab, and after the user tab
+        insert_index = self._getIndexFromTabName('All')
+
+        for tab_idx in range(insert_index):
+            tab_name = self.ui.tabPanel.tabText(tab_idx)
+
+            if tab_name != '[+]' and tab_name.lower() > group_name.lower():
+                insert_index = tab_idx
+                break
+
+        self.ui.tabPanel.insertTab(
+            insert_index,
+            widget,
+            group_name,
+        )
+        self._action_lists.append(widget)
+
+        return widget
+
+    # --------------------------------------------------------------------------
+    def actionStarted(self, identifier):
+        """
+        Shows the busy state on every item representing the given action
+        """
+        for list_widget in self._action_lists:
+            list_widget.setBusy(identifier, True)
+
+    # --------------------------------------------------------------------------
+    def actionFinished(self, identifier):
+        """
+        Clears the busy state of the given action (unless another run of it
+        is still in flight) and triggers a status check for it.
+        """
+        busy = self.runner.isRunning(identifier)
+
+        for list_widget in self._action_lists:
+            list_widget.setBusy(identifier, busy)
+
+        # -- Running the action may well have changed its status, so any
+        # -- result shared by another process is no longer valid
+        plugin = self.factory.request(identifier)
+
+        if plugin:
+            self.engine.board.invalidate(plugin)
+            self.engine.menus.invalidate(plugin)
+
+        # -- Trigger a status check for this action
+        self.performStatusCheckOfActionType(identifier)
 
     # --------------------------------------------------------------------------
     def performStatusCheck(self):
@@ -560,6 +1026,13 @@ class LaunchPanel(QtWidgets.QWidget):
         for list_widget in self._action_lists:
             list_widget.performStatusCheck()
 
+    # --------------------------------------------------------------------------
+    def queueStatusHistorySave(self):
+        """
+        Saves the status history once the status results stop arriving
+        """
+        self._history_timer.start()
+
     # --------------------------------------------------------------------------
     def performStatusCheckOfActionType(self, action_type):
         """
@@ -578,41 +1051,129 @@ class LaunchPanel(QtWidgets.QWidget):
                     list_widget.performSingleStatusCheck(item)
 
     # --------------------------------------------------------------------------
-    def updateTabState(self, action_list):
+    def _tabIndex(self, widget):
+        """
+        Returns the index of the tab holding the given widget, or -1 if it
+        is not in a tab. The indices are cached, and only looked up again
+        if the tabs have changed since.
+        """
+        tab_index = self._tab_lookup.get(widget, -1)
+
+        if tab_index >= 0 and self.ui.tabPanel.widget(tab_index) is widget:
+            return tab_index
+
+        self._tab_lookup = dict(
+            (self.ui.tabPanel.widget(idx), idx)
+            for idx in range(self.ui.tabPanel.count())
+        )
+
+        return self._tab_lookup.get(widget, -1)
+
+    # --------------------------------------------------------------------------
+    def _setTabBadge(self, widget, tab_index, count):
+        """
+        Shows the given number of alerts alongside the tab, hiding the
+        badge when there are none.
+        """
+        badge = self._tab_badges.get(widget)
+
+        if not badge:
+
+            # -- There is no need to create a badge just to hide it
+            if not count:
+                return
+
+            tab_bar = self.ui.tabPanel.tabBar()
+
+            badge = QtWidgets.QLabel(parent=tab_bar)
+            badge.setObjectName('alertBadge')
+            badge.setAlignment(QtCore.Qt.AlignCenter)
+
+            tab_bar.setTabButton(tab_index, QtWidgets.QTabBar.RightSide, badge)
+            self._tab_badges[widget] = badge
+
+        badge.setText(str(count))
+        badge.setVisible(count > 0)
+
+    # --------------------------------------------------------------------------
+    # noinspection PyUnusedLocal
+    def updateTabState(self, action_list, identifiers=None):
         """
         Updates the tab state for the action list based on whether there
-        are any active alerts
+        are any active alerts. The list keeps its own count of alerts, so
+        this does not need to look at any of its items.
 
         :param action_list: ActionListWidget to check
         :type action_list: ActionListWidget
 
+        :param identifiers: The identifiers of the actions whose state
+            has changed
+        :type identifiers: set
+
         :return:
         """
-        # -- Assume no alerts by default, so use a null icon
-        icon_to_use = QtGui.QIcon()
+        tab_index = self._tabIndex(action_list)
+
+        if tab_index >= 0:
+            self.ui.tabPanel.setTabIcon(
+                tab_index,
+                self._alert_icon if action_list.alert_count else QtGui.QIcon(),
+            )
+            self._setTabBadge(action_list, tab_index, action_list.alert_count)
+
+        self.tabStateUpdated.emit(action_list)
+
+    # --------------------------------------------------------------------------
+    def memoryReport(self):
+        """
+        Reports the live counts and estimated sizes of the resources held
+        by the panel, broken down by tab. This is a diagnostic to help
+        track where memory goes during long sessions.
 
-        # -- Cycle over our list widgets items
-        for idx in range(action_list.count()):
+        Pixmaps which are shared (such as the placeholder icon) are only
+        counted once in the totals. Any list widgets which are still alive
+        but no longer shown in a tab are reported under 'orphaned'.
 
-            # -- Get the item, anad check if there is a status
-            if action_list.item(idx).status:
-                icon_to_use = self._alert_icon
+        :return: dict
+        """
+        # -- We use this to ensure shared pixmaps and images are only
+        # -- counted once across the whole report
+        seen = set()
 
-        # -- Now cycle over our tab panels so we can find the tab which
-        # -- this list widget resides under
-        for idx in range(self.ui.tabPanel.count()):
+        tabs = dict()
+        shown = list()
 
-            # -- Get the widget
-            widget = self.ui.tabPanel.widget(idx)
+        for tab_idx in range(self.ui.tabPanel.count()):
+            widget = self.ui.tabPanel.widget(tab_idx)
 
-            # -- We're only interested in the matching list widget
-            if widget != action_list:
+            if not isinstance(widget, ActionListWidget):
                 continue
 
-            # -- Assign the icon
-            self.ui.tabPanel.setTabIcon(idx, icon_to_use)
+            shown.append(widget)
+            tabs[self.ui.tabPanel.tabText(tab_idx)] = widget.memoryReport(seen)
 
-        self.tabStateUpdated.emit(action_list)
+        # -- Anything which is a child of the panel but not in a tab is
+        # -- being held on to when it should not be
+        orphaned = [
+            widget.memoryReport(seen)
+            for widget in self.findChildren(ActionListWidget)
+            if widget not in shown
+        ]
+
+        totals = collections.OrderedDict()
+
+        for report in list(tabs.values()) + orphaned:
+            for key, value in report.items():
+                totals[key] = totals.get(key, 0) + value
+
+        # -- Finally we count the settings objects which are held
+        totals['settings'] = len(environment.cached())
+
+        return dict(
+            tabs=tabs,
+            orphaned=orphaned,
+            totals=totals,
+        )
 
 
 # ------------------------------------------------------------------------------
@@ -622,114 +1183,315 @@ class ActionListWidget(QtWidgets.QListWidget):
     This is a QListWidget which is specifically designed to take in the
     launchpad factory and list of actions to be shown.
     """
-    # -- This signal is used to alert that changes in
-    # -- state have occured
-    alertPropogation = QtCore.Signal(object)
+    # -- This is how long (in ms) we wait for a plugin to build its context
+    # -- menu entries before giving up on them
+    MENU_DEADLINE = 10000
+
+    # -- This signal is used to alert that changes in state have occured. It
+    # -- is emitted with this widget and the set of identifiers which changed,
+    # -- and at most once per pass of the event loop
+    alertPropogation = QtCore.Signal(object, object)
+
+    # --------------------------------------------------------------------------
+    def __init__(self, factory, action_list, show_beta=False, size=75, parent=None):
+        super(ActionListWidget, self).__init__(parent=parent)
+
+        # -- store the launch panel
+        self._launch_panel = parent
+        self._parent = parent
+        self._show_beta = show_beta
+
+        # -- This variable can be used to query whether this widget has any items
+        # -- within it which have alerts
+        self.status_tracker = dict()
+
+        # -- This is the number of items which currently have an alert, and
+        # -- is kept up to date as their statuses change
+        self.alert_count = 0
+
+        # -- Changes in state are gathered here and then propogated together
+        # -- once control returns to the event loop
+        self._pending_alerts = set()
+        self._alert_timer = QtCore.QTimer(self)
+        self._alert_timer.setSingleShot(True)
+        self._alert_timer.setInterval(0)
+        self._alert_timer.timeout.connect(self.propogateAlerts)
+
+        # -- Define some optimisation variables
+        self._size = QtCore.QSize(size, size)
+
+        # -- Icons are built at the physical resolution of the screen
+        self._ratio = imaging.device_pixel_ratio(self)
+
+        # -- Define our visual parameters on the widget
+        self.setSpacing(10)
+        self.setIconSize(self._size)
+        self.setResizeMode(QtWidgets.QListWidget.Adjust)
+        self.setSortingEnabled(False)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QtWidgets.QListWidget.NoSelection)
+        self.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+
+        # -- Store our factory and list of actions
+        self.factory = factory
+        self.action_list = action_list
+
+        if self.action_list is None:
+            self.action_list = factory.identifiers(show_beta=show_beta)
+
+        # -- Populate the panel
+        self.populate()
+
+        with tracing.span('apply stylesheet', 'style', target='ActionListWidget'):
+            self.setStyleSheet(
+                """
+                    background-image: url(%s);
+                    background-position: top right;
+                    background-origin: content;
+                    background-repeat: repeat-xy;
+                """ % resources.get('bg.png')
+            )
+
+        # -- Hook up the event to allow the window title to show the
+        # -- text of the active item
+        self.itemEntered.connect(self.updateWindowTitle)
+
+    # --------------------------------------------------------------------------
+    @tracing.traced('ActionListWidget.populate')
+    def populate(self):
+        """
+        This will populate the list widget with all the elements defined
+        in the action list during initialisation.
+        """
+        # -- Release any delegates from a previous population, as the
+        # -- rows they were assigned to are about to be cleared
+        for idx in range(self.count()):
+            self._releaseDelegate(idx)
+
+        self.clear()
+        self.alert_count = 0
+
+        valid_actions = self.factory.identifiers(
+            show_beta=self._show_beta
+        )
+
+        # -- Start by adding all the required items
+        for idx, action_name in enumerate(self.action_list):
+
+            if action_name not in valid_actions:
+                continue
+
+            # -- Create and add the item
+            self.addItem(self._createItem(action_name))
+
+        # -- Now assign the delegates to the items
+        for idx in range(self.count()):
+            self._assignDelegate(idx)
+
+        # -- Show the last known statuses whilst the actual status
+        # -- checks are carried out
+        self.restoreStatuses()
+
+    # --------------------------------------------------------------------------
+    def addAction(self, identifier):
+        """
+        Adds a row for the given action without repopulating the list. If
+        the action is already shown its row is refreshed instead.
+
+        :param identifier: Identifier of the action to add
+
+        :return: The item representing the action
+        """
+        if identifier not in self.action_list:
+            self.action_list.append(identifier)
+
+        # -- If we already have the item we only need a new delegate, as
+        # -- the action may well have changed
+        for idx in range(self.count()):
+            if self.item(idx).identifier == identifier:
+                self._assignDelegate(idx)
+                return self.item(idx)
+
+        self.addItem(self._createItem(identifier))
+        self._assignDelegate(self.count() - 1)
+
+        return self.item(self.count() - 1)
+
+    # --------------------------------------------------------------------------
+    # noinspection PyMethodMayBeStatic
+    def _createItem(self, identifier):
+        """
+        Creates the list item representing the given action
+        """
+        item = QtWidgets.QListWidgetItem(identifier)
+        item.identifier = identifier
+        item.setToolTip(identifier)
+
+        # -- We will store status information on the item
+        # -- which will change periodically. So assign these
+        # -- as blank values to begin with
+        item.status = None
+        item.stale = False
+
+        return item
+
+    # --------------------------------------------------------------------------
+    def _assignDelegate(self, row):
+        """
+        Creates the delegate which draws the given row
+        """
+        item = self.item(row)
+
+        # -- If the row already has a delegate it is being replaced
+        self._releaseDelegate(row)
+
+        delegate = ActionDelegate(
+            action=self.factory.request(item.identifier),
+            size=self._size,
+            ratio=self._ratio,
+            identifier=item.identifier,
+            parent=self,
+        )
+
+        # -- Carry over the status the item already has
+        delegate.requires_attention = item.status
+        delegate.stale = item.stale
+
+        # -- When a delegate changes we only redraw its own row
+        delegate.needsRedraw.connect(
+            functools.partial(self.redrawItem, item),
+        )
+
+        # -- Assign the delegate
+        self.setItemDelegateForRow(
+            row,
+            delegate
+        )
+
+    # --------------------------------------------------------------------------
+    def _releaseDelegate(self, row):
+        """
+        Unassigns the delegate of the given row (if there is one) and
+        schedules it for deletion
+        """
+        delegate = self.itemDelegateForRow(row)
 
-    # --------------------------------------------------------------------------
-    def __init__(self, factory, action_list, show_beta=False, size=75, parent=None):
-        super(ActionListWidget, self).__init__(parent=parent)
+        if not isinstance(delegate, ActionDelegate):
+            return
 
-        # -- store the launch panel
-        self._launch_panel = parent
-        self._parent = parent
-        self._show_beta = show_beta
+        self.setItemDelegateForRow(row, None)
+
+        delegate.release()
+        delegate.deleteLater()
+
+    # --------------------------------------------------------------------------
+    def teardown(self):
+        """
+        Cancels any status checks which are in flight and releases all the
+        delegates (and their pixmaps). The widget itself is then scheduled
+        for deletion, so it must not be used after this is called.
+        """
+        engine.get().scheduler.cancel(self)
 
-        # -- This variable can be used to query whether this widget has any items
-        # -- within it which have alerts
-        self.status_threads = list()
         self.status_tracker = dict()
+        self.alert_count = 0
 
-        # -- Define some optimisation variables
-        self._size = QtCore.QSize(size, size)
+        self._alert_timer.stop()
+        self._pending_alerts = set()
 
-        # -- Define our visual parameters on the widget
-        self.setSpacing(10)
-        self.setIconSize(self._size)
-        self.setResizeMode(QtWidgets.QListWidget.Adjust)
-        self.setSortingEnabled(False)
-        self.setMouseTracking(True)
-        self.setSelectionMode(QtWidgets.QListWidget.NoSelection)
-        self.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        for idx in range(self.count()):
+            self._releaseDelegate(idx)
 
-        # -- Store our factory and list of actions
-        self.factory = factory
-        self.action_list = action_list or factory.identifiers(show_beta=show_beta)
+        self.clear()
+        self.deleteLater()
 
-        # -- Populate the panel
-        self.populate()
+    # --------------------------------------------------------------------------
+    def redrawItem(self, item):
+        """
+        Triggers a repaint of just the given item
+        """
+        self.update(self.indexFromItem(item))
 
-        self.setStyleSheet(
-            """
-                background-image: url(%s);
-                background-position: top right;
-                background-origin: content;
-                background-repeat: repeat-xy;
-            """ % resources.get('bg.png')
-        )
+    # --------------------------------------------------------------------------
+    def setIconSize(self, size):
+        """
+        Overrides the usual setIconSize and passes the size information
+        to all the registered draw delegates. This does not rebuild the
+        pixmaps, for that call requestPixmaps.
+        """
+        self._size = size
 
-        # -- Hook up the event to allow the window title to show the
-        # -- text of the active item
-        self.itemEntered.connect(self.updateWindowTitle)
+        for row_idx in range(self.count()):
+            self.itemDelegateForRow(row_idx).setSize(size)
+
+        super(ActionListWidget, self).setIconSize(size)
 
     # --------------------------------------------------------------------------
-    def populate(self):
+    def requestPixmaps(self):
         """
-        This will populate the list widget with all the elements defined
-        in the action list during initialisation.
+        Asks all the registered draw delegates to rebuild their pixmaps
+        at the current icon size. This happens outside of the ui thread.
         """
-        self.clear()
-        valid_actions = self.factory.identifiers(
-            show_beta=self._show_beta
-        )
+        for row_idx in range(self.count()):
+            self.itemDelegateForRow(row_idx).requestPixmaps()
 
-        # -- Start by adding all the required items
-        for idx, action_name in enumerate(self.action_list):
+    # --------------------------------------------------------------------------
+    def memoryReport(self, seen=None):
+        """
+        Reports the live counts and estimated sizes of the resources held
+        by this list.
 
-            if action_name not in valid_actions:
-                continue
+        :param seen: Optional set of cache keys of pixmaps and images which
+            have already been counted, and should therefore not be counted
+            again.
 
-            # -- Create the item
-            item = QtWidgets.QListWidgetItem(action_name)
-            item.identifier = action_name
-            item.setToolTip(action_name)
+        :return: dict
+        """
+        seen = seen if seen is not None else set()
 
-            # -- We will store status information on the item
-            # -- which will change periodically. So assign these
-            # -- as blank values to begin with
-            item.status = None
+        report = collections.OrderedDict()
+        report['list_widgets'] = 1
+        report['items'] = self.count()
+        report['delegates'] = 0
+        report['pixmaps'] = 0
+        report['pixmap_bytes'] = 0
+        report['images'] = 0
+        report['image_bytes'] = 0
+        report['status_checks'] = engine.get().scheduler.pending(self)
 
-            # -- Add the item
-            self.addItem(item)
+        for delegate in self.findChildren(ActionDelegate):
+            report['delegates'] += 1
 
-        # -- Now assign the delegates to the items
-        for idx in range(self.count()):
-            item = self.item(idx)
+            held = [
+                ('pixmap', delegate.pixmaps()),
+                ('image', delegate.images()),
+            ]
 
-            delegate = ActionDelegate(
-                action=self.factory.request(item.identifier),
-                size=self._size,
-                parent=self,
-            )
+            for key, held_resources in held:
+                for resource in held_resources:
 
-            delegate.needsRedraw.connect(self.viewport().update)
+                    if resource.cacheKey() in seen:
+                        continue
 
-            # -- Assign the delegate
-            self.setItemDelegateForRow(
-                idx,
-                delegate
-            )
+                    seen.add(resource.cacheKey())
+                    report['%ss' % key] += 1
+                    report['%s_bytes' % key] += estimate_bytes(resource)
+
+        return report
 
     # --------------------------------------------------------------------------
-    def setIconSize(self, size):
+    def setDevicePixelRatio(self, ratio):
         """
-        Overrides the usual setIconSize and passes the size information
-        to all the registered draw delegates.
+        Rebuilds the pixmaps of all the delegates for the given pixel
+        ratio. This does nothing if the ratio has not changed.
         """
-        super(ActionListWidget, self).setIconSize(size)
+        if ratio == self._ratio:
+            return
+
+        self._ratio = ratio
 
         for row_idx in range(self.count()):
-            self.itemDelegateForRow(row_idx).buildPixmaps(size)
+            self.itemDelegateForRow(row_idx).setDevicePixelRatio(ratio)
 
     # --------------------------------------------------------------------------
     def run(self, item):
@@ -746,13 +1508,29 @@ class ActionListWidget(QtWidgets.QListWidget):
         action = self.factory.request(item.identifier)
 
         # -- check we have not disabled the action
-        if launchpad.PluginStates.DISABLED in action.state():
+        with watchdog.attribute(item.identifier, 'state'):
+            state = action.state()
+
+        if launchpad.PluginStates.DISABLED in state:
             return
 
-        action.run()
+        # -- The runner decides where the action runs, and the panel
+        # -- will trigger a status check once it has finished
+        self._parent.runner.submit(item.identifier, action)
+
+    # --------------------------------------------------------------------------
+    def setBusy(self, identifier, state):
+        """
+        Sets the busy state of any items representing the given action
+        """
+        for idx in range(self.count()):
+            item = self.item(idx)
+
+            if item.identifier != identifier:
+                continue
 
-        # -- Trigger a status check for this item
-        self._parent.performStatusCheckOfActionType(item.identifier)
+            self.itemDelegateForRow(idx).busy = state
+            self.redrawItem(item)
 
     # --------------------------------------------------------------------------
     def mousePressEvent(self, event):
@@ -763,7 +1541,10 @@ class ActionListWidget(QtWidgets.QListWidget):
     def contextMenuEvent(self, event):
         """
         Generate a context menu based on the action plugin the user
-        has right clicked.
+        has right clicked. The entries of the plugin come from the engines
+        menu cache. If they are not cached the menu is shown straight away
+        with a placeholder, which is replaced by the entries once the plugin
+        has built them.
 
         :param event: QContextMenuEvent
         """
@@ -772,20 +1553,26 @@ class ActionListWidget(QtWidgets.QListWidget):
         if not item:
             return
 
-        # -- Get the settings
-        settings = scribble.get(self._launch_panel.environment_id)
-        is_user_item = item.identifier in settings.get(
-            'user_actions',
-            list(),
-        )
+        plugin = self.factory.request(item.identifier)
+        menus = engine.get().menus
+
+        # -- Plugins which need to build their menu on the ui thread can
+        # -- ask for it, though they are still cached
+        if menus.entries(plugin) is None and getattr(plugin, 'ACTIONS_ON_UI_THREAD', False):
+            with watchdog.attribute(item.identifier, 'actions'):
+                menus.store(plugin, collections.OrderedDict(plugin.actions() or dict()))
+
+        entries = menus.entries(plugin)
 
         # -- Add all the plugin menu items first
         menu_dict = collections.OrderedDict()
-        menu_dict.update(self.factory.request(item.identifier).actions())
-        menu_dict['-'] = None
+
+        if entries is not None:
+            menu_dict.update(entries)
+            menu_dict['-'] = None
 
         # -- Now add the launchpad options
-        if is_user_item:
+        if item.identifier in self._launch_panel.settings.user_actions:
             menu_dict['Remove From User Panel'] = functools.partial(
                 self.removeUserItem,
                 item.identifier,
@@ -796,29 +1583,106 @@ class ActionListWidget(QtWidgets.QListWidget):
                 item.identifier,
             )
 
-        # -- Pop up the menu
+        # -- Pop up the menu. It is only needed whilst it is shown
         menu = qtility.menus.create(menu_dict, parent=self)
+        menu.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+
+        if entries is None:
+            self._requestMenuEntries(menu, plugin)
+
         menu.popup(event.globalPos())
 
+    # --------------------------------------------------------------------------
+    def _requestMenuEntries(self, menu, plugin):
+        """
+        Adds a placeholder to the top of the given menu and requests the
+        entries of the plugin to replace it with. If they do not arrive
+        within the deadline the placeholder says so.
+        """
+        first_action = menu.actions()[0] if menu.actions() else None
+
+        # -- Adding an action which is already in the menu moves it
+        placeholder = menu.addAction('Loading...')
+        placeholder.setEnabled(False)
+        menu.insertAction(first_action, placeholder)
+        menu.insertSeparator(first_action)
+
+        # -- The timer belongs to the menu, so it goes when the menu does
+        deadline = QtCore.QTimer(menu)
+        deadline.setSingleShot(True)
+        deadline.setInterval(self.MENU_DEADLINE)
+        deadline.timeout.connect(
+            functools.partial(self.fillMenu, menu, placeholder, None),
+        )
+        deadline.start()
+
+        menu.destroyed.connect(functools.partial(self._cancelMenuRequest, menu))
+
+        engine.get().menus.request(
+            plugin,
+            functools.partial(self.fillMenu, menu, placeholder),
+            owner=menu,
+        )
+
+    # --------------------------------------------------------------------------
+    # noinspection PyMethodMayBeStatic,PyUnusedLocal
+    def _cancelMenuRequest(self, menu, *args):
+        engine.get().menus.cancel(menu)
+
+    # --------------------------------------------------------------------------
+    def fillMenu(self, menu, placeholder, entries):
+        """
+        Replaces the placeholder in the given menu with the plugins menu
+        entries. If there are no entries (because they failed to build or
+        did not arrive in time) the placeholder says so instead.
+        """
+        # -- Whichever of the entries or the deadline comes second
+        # -- has nothing left to do
+        engine.get().menus.cancel(menu)
+
+        for timer in menu.findChildren(QtCore.QTimer):
+            timer.stop()
+
+        if placeholder not in menu.actions():
+            return
+
+        if entries is None:
+            placeholder.setText('Menu Unavailable')
+            return
+
+        # -- We build the entries as a menu of their own, and then move
+        # -- its actions into the menu being shown
+        built = qtility.menus.create(entries, parent=menu)
+        menu.insertActions(placeholder, built.actions())
+        menu.removeAction(placeholder)
+
+        # -- If the plugin has no entries of its own we do not need the
+        # -- separator either
+        if not entries:
+            separator = menu.actions()[0]
+
+            if separator.isSeparator():
+                menu.removeAction(separator)
+
     # --------------------------------------------------------------------------
     def removeUserItem(self, name):
-        settings = scribble.get(self._launch_panel.environment_id)
+        settings = self._launch_panel.settings
+        user_actions = settings.user_actions
 
-        if 'user_actions' not in settings:
+        if name not in user_actions:
             return
 
-        settings['user_actions'].remove(name)
-        settings.save()
+        user_actions.remove(name)
+        settings.user_actions = user_actions
 
         self._launch_panel.populateUserActions()
 
     # --------------------------------------------------------------------------
     def addUserItem(self, name):
-        settings = scribble.get(self._launch_panel.environment_id)
-        user_actions = settings.get('user_actions', list())
+        settings = self._launch_panel.settings
+        user_actions = settings.user_actions
         user_actions.append(name)
-        settings['user_actions'] = user_actions
-        settings.save()
+        settings.user_actions = user_actions
 
         self._launch_panel.populateUserActions()
 
@@ -860,90 +1724,137 @@ class ActionListWidget(QtWidgets.QListWidget):
     # --------------------------------------------------------------------------
     def performSingleStatusCheck(self, item):
         """
-        This cycles over all the items in the list and will ask for the status
-        of that item. All status checks are performed in threads to ensure they
-        do not block the interface.
+        This asks for the status of the given item. The check is performed
+        by the engines scheduler in a thread, to ensure it does not block
+        the interface, and is shared with any other list showing the same
+        action.
 
         :return:
         """
         # -- Get the plugin this item represents
         plugin = self.factory.request(item.identifier)
 
+        engine.get().scheduler.check(
+            plugin,
+            functools.partial(self.updateStatus, item, plugin),
+            owner=self,
+            throttle=self._launch_panel.settings.throttle_status_checks,
+        )
+
+    # --------------------------------------------------------------------------
+    def restoreStatuses(self):
+        """
+        Shows the last known status of each item, providing it is recent
+        enough. These are marked as stale until their status check has
+        been carried out.
+        """
+        history = self._launch_panel.status_history
+
+        for idx in range(self.count()):
+            item = self.item(idx)
+            entry = history.get(item.identifier)
+
+            if not entry or not entry.get('message'):
+                continue
+
+            self.updateStatus(
+                item,
+                self.factory.request(item.identifier),
+                entry['message'],
+                stale=True,
+            )
+
+    # --------------------------------------------------------------------------
+    def updateStatus(self, item, plugin, status, stale=False):
+        """
+        Updates the item and delegate according to the status information
+        returned by a status check.
+
+        :param item: The item to update
+        :param plugin: The plugin the item represents
+        :param status: The status message, or None if there is nothing
+            to report
+        :param stale: True if this is the last known status rather than
+            the result of a status check
+
+        :return:
+        """
+        # -- Record the result so it can be shown at the next startup
+        if not stale:
+            self._launch_panel.status_history.record(item.identifier, status)
+            self._launch_panel.queueStatusHistorySave()
+
         # -- The status is different to what it was before so
         # -- we need to update the view accordingly
         index = self.indexFromItem(item)
-        delegate = self.itemDelegate(index)
 
-        # -- Create the thread which we will perform the check
-        thread = StatusCheckThread(
-            plugin=plugin,
-            item=item,
-            delegate=delegate,
-        )
+        # -- Qt5 bindings only have the deprecated itemDelegate
+        if hasattr(self, 'itemDelegateForIndex'):
+            delegate = self.itemDelegateForIndex(index)
 
-        # -- Once the thread is finished, we need to parse the
-        # -- result, so connect the finished signal
-        thread.finished.connect(self.updateStatusChecks)
+        else:
+            delegate = self.itemDelegate(index)
+
+        if isinstance(delegate, ActionDelegate):
+            delegate.requires_attention = status
+            delegate.stale = stale
+
+        # -- Update the tooltip. If there is no alert state it can
+        # -- simply by blank
+        item.setToolTip(str(status or plugin.Description))
+
+        # -- Keep our count of alerting items in step with the change
+        self.alert_count += int(bool(status)) - int(bool(item.status))
+        item.status = status
+        item.stale = stale
 
-        # -- To ensure we can iterate as optimally as possible, track
-        # -- all the threads which we are generating
-        self.status_threads.append(thread)
+        # -- Finally we trigger a redraw of this item
+        self.redrawItem(item)
+
+        # -- If the status is different we need to emit a status
+        # -- change
+        if item.identifier in self.status_tracker:
+            if status != self.status_tracker[item.identifier]:
+                self.queueAlert(item.identifier)
+                self.status_tracker[item.identifier] = status
+
+                # -- The menu of an action often depends on its status
+                engine.get().menus.invalidate(plugin)
+
+        else:
+            # -- In this situation its the first time we have run for this
+            # -- item, so we only want to trigger an alert propogation if there
+            # -- is an actual message
+            self.status_tracker[item.identifier] = status
 
-        # -- Kick the thread off
-        thread.start()
+            if status:
+                self.queueAlert(item.identifier)
 
     # --------------------------------------------------------------------------
-    def updateStatusChecks(self, *args, **kwargs):
+    def queueAlert(self, identifier):
         """
-        This function will cycle through any status threads and update the
-        item and delegate according to the status information of that thread.
-
-        :return:
+        Records that the state of the given action has changed. All the
+        changes recorded before control returns to the event loop are
+        propogated together.
         """
-        threads_to_remove = list()
+        self._pending_alerts.add(identifier)
 
-        # -- Cycle over our active threads
-        for thread in self.status_threads:
+        if not self._alert_timer.isActive():
+            self._alert_timer.start()
 
-            # -- If the thread is not finished we leave it
-            # -- to continue
-            if not thread.isFinished():
-                continue
+    # --------------------------------------------------------------------------
+    def propogateAlerts(self):
+        """
+        Emits a single alert propogation for all the changes which have
+        been queued
+        """
+        if not self._pending_alerts:
+            return
+
+        identifiers = self._pending_alerts
+        self._pending_alerts = set()
 
-            # -- Ensure we remove this thread once we're done with it
-            threads_to_remove.append(thread)
-
-            thread.delegate.requires_attention = thread.status
-
-            # -- Update the tooltip. If there is no alert state it can
-            # -- simply by blank
-            thread.item.setToolTip(str(thread.status or thread.plugin.Description))
-            thread.item.status = thread.status
-
-            # -- Finally we trigger a redraw of this item
-            self.update(self.indexFromItem(thread.item))
-
-            # -- If the status is different we need to emit a status
-            # -- change
-            if thread.item.identifier in self.status_tracker:
-                if thread.status != self.status_tracker[thread.item.identifier]:
-                    self.alertPropogation.emit(self)
-                    self.status_tracker[thread.item.identifier] = thread.status
-            
-            else:
-                # -- In this situation its the first time we have run for this
-                # -- item, so we only want to trigger an alert propogation if there
-                # -- is an actual message
-                self.status_tracker[thread.item.identifier] = thread.status
-                
-                if thread.status:
-                    self.alertPropogation.emit(self)
-
-        # -- Now we can clean up any complete threads. We do not do this
-        # -- during the update iteration as the lists are mutable
-        for thread in threads_to_remove:
-            if thread in self.status_threads:
-                self.status_threads.remove(thread)
+        self.alertPropogation.emit(self, identifiers)
 
 
 # ------------------------------------------------------------------------------
@@ -969,65 +1880,152 @@ class ActionDelegate(QtWidgets.QItemDelegate):
     needsRedraw = QtCore.Signal()
 
     # -- This pixmap will always be the same, so we only need to build it
-    # -- once and can then share it
+    # -- once per pixel ratio and can then share it
     _ALERT_SIZE = 25
-    _ALERT_PIXMAP = None
+    _ALERT_PIXMAPS = dict()
+
+    # -- The last known status is shown faded until it has been checked
+    STALE_ALERT_OPACITY = 0.4
+
+    # -- The default icon is shown whilst the real icon is decoded, and
+    # -- as its the same for every delegate we share it per size and
+    # -- pixel ratio
+    _PLACEHOLDERS = dict()
 
     # --------------------------------------------------------------------------
-    def __init__(self, action, size, parent=None):
+    def __init__(self, action, size, ratio=1.0, identifier=None, parent=None):
         super(ActionDelegate, self).__init__(parent=parent)
 
         # -- Store the action, as this is used during painting
         self.action = action
-        self.state = action.state()
+
+        # -- This is the identifier the action is listed under, which
+        # -- any stall in the plugin is attributed to
+        self.identifier = identifier or action.Name
+
+        with watchdog.attribute(self.identifier, 'state'):
+            self.state = action.state()
         self.requires_attention = False
 
+        # -- This is set whilst the status shown is the last known status
+        # -- rather than the result of a status check
+        self.stale = False
+
+        # -- This is set whilst a run of the action is in flight
+        self.busy = False
+
         # -- Extract the icon, and create the pixmaps for the
         # -- icons
         self.icon_colour = None
         self.icon_bw = None
         self.size = size
+        self.ratio = ratio
         self.polygon = None
         self.highlight = None
+        self._source = None
         self.buildPixmaps(size)
 
     # --------------------------------------------------------------------------
     def buildPixmaps(self, size):
         """
         Rebuilds the colour and black-and-white pixmaps to the specified
-        sizes and updates the size hint
+        sizes and updates the size hint. If the icon has not yet been
+        decoded the placeholder icon is shown whilst the icon is decoded
+        outside of the ui thread.
         """
 
         # -- If we have an icon, and we can access the
         if not self.action:
             return
 
-        icon_path = self._DEFAULT_ICON
+        with tracing.span('ActionDelegate.buildPixmaps', 'icons', action=self.action.Name):
+            self.setSize(size)
 
-        # -- If we have an icon path, generate a colour
-        # -- and a black and white variation
-        if self.action.Icon and os.path.exists(self.action.Icon):
-            icon_path = self.action.Icon
+            # -- If another delegate has already built this icon we can use
+            # -- its pixmaps straight away
+            pixmaps = engine.get().icons.pixmaps(
+                self.iconPath(),
+                self.pixelSize(),
+                self.ratio,
+            )
 
-        # -- Create a scaled version of our icon
-        self.icon_colour = QtGui.QPixmap(icon_path).scaled(
-            size.height(),
-            size.height(),
-            mode=QtCore.Qt.SmoothTransformation,
-        )
+            if pixmaps:
+                self.applyPixmaps(pixmaps)
+                return
 
-        # -- Build the pixmap we use to show alerts, but only build it
-        # -- if it does not already exist
-        if not ActionDelegate._ALERT_PIXMAP:
-            ActionDelegate._ALERT_PIXMAP = QtGui.QPixmap(resources.get('alert.png')).scaled(
-                self._ALERT_SIZE,
-                self._ALERT_SIZE,
-                mode=QtCore.Qt.SmoothTransformation,
+            # -- Otherwise we show the placeholder until the icon has
+            # -- been decoded
+            self.icon_colour, self.icon_bw, self.highlight = self._placeholder(
+                size.height(),
+                self.ratio,
+            )
+            self.requestPixmaps()
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def _alertPixmap(cls, ratio):
+        """
+        Returns the pixmap used to show alerts at the given pixel ratio
+        """
+        if ratio not in cls._ALERT_PIXMAPS:
+            image = imaging.scaled(
+                QtGui.QImage(resources.get('alert.png')),
+                imaging.physical(cls._ALERT_SIZE, ratio),
+            )
+            cls._ALERT_PIXMAPS[ratio] = imaging.to_pixmap(image, ratio)
+
+        return cls._ALERT_PIXMAPS[ratio]
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def _placeholder(cls, size, ratio=1.0):
+        """
+        Returns the colour pixmap, grayscale pixmap and highlight colour of
+        the default icon at the given size and pixel ratio. These are shared
+        between all delegates.
+        """
+        key = (size, ratio)
+
+        if key not in cls._PLACEHOLDERS:
+            images = imaging.build(
+                QtGui.QImage(cls._DEFAULT_ICON),
+                imaging.physical(size, ratio),
+            )
+
+            cls._PLACEHOLDERS[key] = (
+                imaging.to_pixmap(images.colour, ratio),
+                imaging.to_pixmap(images.grayscale, ratio),
+                images.highlight,
             )
 
-        # -- Now create a grayscale version of our icon
-        self.icon_bw = qtility.pixmaps.grayscaled(self.icon_colour)
+        return cls._PLACEHOLDERS[key]
+
+    # --------------------------------------------------------------------------
+    def pixelSize(self):
+        """
+        Returns the edge length of the icon in physical pixels
+        """
+        return imaging.physical(self.size.height(), self.ratio)
+
+    # --------------------------------------------------------------------------
+    def setDevicePixelRatio(self, ratio):
+        """
+        Changes the pixel ratio the pixmaps are built for. The existing
+        pixmaps continue to be drawn until the new ones are ready.
+        """
+        if ratio == self.ratio:
+            return
+
+        self.ratio = ratio
+        self.requestPixmaps()
 
+    # --------------------------------------------------------------------------
+    def setSize(self, size):
+        """
+        Changes the size the delegate draws at without rebuilding the
+        pixmaps. Until new pixmaps are applied the existing ones are scaled
+        at paint time, which is cheap but lower quality.
+        """
         # -- Generate the painter polygon
         self.polygon = QtGui.QPolygonF()
         self.polygon.append(QtCore.QPoint(0, size.height() * 0.25))
@@ -1040,32 +2038,92 @@ class ActionDelegate(QtWidgets.QItemDelegate):
         # -- of the size hint
         self.size = size
 
-        # -- We want to load the image as a q-image to allow us to
-        # -- inspect the general colour of the icon for use as a highlighting
-        # -- mechanism.
-        image = QtGui.QImage(icon_path)
-        counter = 0
-        r, g, b = [], [], []
+    # --------------------------------------------------------------------------
+    def iconPath(self):
+        """
+        Returns the path of the icon this delegate shows
+        """
+        return self.action.Icon or self._DEFAULT_ICON
+
+    # --------------------------------------------------------------------------
+    def requestPixmaps(self):
+        """
+        Requests the pixmaps for the current size from the engine. They are
+        swapped in once they are ready. If they have not been built before
+        then they are built in a worker thread, and if the icon has not been
+        decoded yet that is also done in the worker.
+        """
+        # -- Any request we already have in flight is now stale
+        engine.get().icons.cancel(self)
+
+        engine.get().icons.request(
+            self.iconPath(),
+            self.pixelSize(),
+            self.ratio,
+            self.applyPixmaps,
+            owner=self,
+            fallback=self._DEFAULT_ICON,
+        )
+
+    # --------------------------------------------------------------------------
+    def applyPixmaps(self, pixmaps):
+        """
+        Takes the pixmaps from the engine and swaps them in.
 
-        # -- Cycle the pixels and pull out the colour
-        for x in range(0, int(image.width() * 0.1)):
-            for y in range(0, int(image.height() * 0.1)):
-                counter += 1
-                colors = QtGui.QColor(image.pixel(x * 10, y * 10)).getRgbF()
+        :param pixmaps: engine.IconPixmaps
+        """
+        # -- Keep hold of the decoded icon so we never need to
+        # -- decode it again
+        if self._source is None:
+            self._source = pixmaps.source
+
+        # -- If the size or pixel ratio has changed since these were
+        # -- requested then they are stale and a newer request will follow
+        if pixmaps.size != self.pixelSize() or pixmaps.ratio != self.ratio:
+            return
 
-                r.append(colors[0])
-                g.append(colors[1])
-                b.append(colors[2])
+        self.icon_colour = pixmaps.colour
+        self.icon_bw = pixmaps.grayscale
 
         # -- Providing we have a valid image, we set the highlight
         # -- colour
-        if len(r):
-            self.highlight = QtGui.QColor(
-                (sum(r) / len(r)) * 255,
-                (sum(g) / len(g)) * 255,
-                (sum(b) / len(b)) * 255,
-                a=100,
-            )
+        if pixmaps.highlight:
+            self.highlight = pixmaps.highlight
+
+        self.needsRedraw.emit()
+
+    # --------------------------------------------------------------------------
+    def release(self):
+        """
+        Cancels any icon builds which are in flight and drops the pixmaps
+        and images held by this delegate
+        """
+        engine.get().icons.cancel(self)
+
+        self.icon_colour = None
+        self.icon_bw = None
+        self._source = None
+
+    # --------------------------------------------------------------------------
+    def pixmaps(self):
+        """
+        Returns all the pixmaps held by this delegate
+        """
+        return [
+            pixmap
+            for pixmap in [self.icon_colour, self.icon_bw]
+            if pixmap is not None and not pixmap.isNull()
+        ]
+
+    # --------------------------------------------------------------------------
+    def images(self):
+        """
+        Returns all the images held by this delegate
+        """
+        if self._source is None or self._source.isNull():
+            return list()
+
+        return [self._source]
 
     # --------------------------------------------------------------------------
     # noinspection PyUnusedLocal
@@ -1095,7 +2153,7 @@ class ActionDelegate(QtWidgets.QItemDelegate):
             icon_opacity = 1
             icon_px = self.icon_colour
 
-        if disabled:
+        if disabled or self.busy:
             icon_opacity = 0.25
             icon_px = self.icon_bw
 
@@ -1117,13 +2175,14 @@ class ActionDelegate(QtWidgets.QItemDelegate):
                 )
 
         if self.requires_attention:
+            painter.setOpacity(self.STALE_ALERT_OPACITY if self.stale else 1)
             painter.setBrush(QtGui.QBrush(QtCore.Qt.red))
             painter.drawPixmap(
                 option.rect.width() - self._ALERT_SIZE,
                 option.rect.y() + 10,
                 self._ALERT_SIZE,
                 self._ALERT_SIZE,
-                self._ALERT_PIXMAP,
+                self._alertPixmap(self.ratio),
             )
 
         # -- Define the opacity of the painter based on the values
@@ -1171,7 +2230,7 @@ class ActionDelegate(QtWidgets.QItemDelegate):
         painter.drawText(
             desc_rect,
             QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
-            self.action.Description,
+            'Running...' if self.busy else self.action.Description,
         )
 
         painter.drawLine(
@@ -1183,40 +2242,14 @@ class ActionDelegate(QtWidgets.QItemDelegate):
 
 
 # ------------------------------------------------------------------------------
-class StatusCheckThread(QtCore.QThread):
+def estimate_bytes(resource):
     """
-    This is the thread which calls the status of a plugin. This is to ensure
-    the status check is never blocking to the UI
-    """
-
-    # --------------------------------------------------------------------------
-    def __init__(self, plugin, item, delegate):
-        super(StatusCheckThread, self).__init__()
-        self.plugin = plugin
-        self.item = item
-        self.delegate = delegate
-        self.status = None
-
-    # --------------------------------------------------------------------------
-    def runAfterDelay(self):
-        # -- We're running code from within a plugin, so we wrap it as we
-        # -- cannot guarantee its quality
-        try:
-            # -- skip any INVALID plugins
-            if self.plugin.state() == launchpad.PluginStates.INVALID:
-                return
-
-            # -- only update the tooltip if we have a Status to report
-            self.status = self.plugin.status_message() or None
-
-        except:
-            print('Failed to get status for {}'.format(self.item.identifier))
-            print(sys.exc_info())
+    Estimates the memory used by the pixel data of the given QPixmap
+    or QImage.
 
-    # --------------------------------------------------------------------------
-    def run(self):
-        time.sleep(self.plugin.STATUS_DELAY)
-        self.runAfterDelay()
+    :return: int
+    """
+    return int(resource.width() * resource.height() * resource.depth() / 8)
 
 
 # ------------------------------------------------------------------------------
@@ -1229,7 +2262,14 @@ def launch(blocking=True, show_splash=True, *args, **kwargs):
     :param kwargs:
     :return:
     """
-    q_app = qtility.app.get()
+    # -- If asked for, trace everything from here on
+    trace = kwargs.pop('trace', None)
+
+    if trace:
+        tracing.enable(trace)
+
+    with tracing.span('create application', 'startup'):
+        q_app = qtility.app.get()
 
     splash_screen = None
 
@@ -1249,7 +2289,8 @@ def launch(blocking=True, show_splash=True, *args, **kwargs):
     icon = kwargs.pop('icon', '')
 
     # -- Create a window and embed our widget into it
-    launch_widget = LaunchPanel(*args, **kwargs)
+    with tracing.span('create panel', 'startup'):
+        launch_widget = LaunchPanel(*args, **kwargs)
     launch_window = QtWidgets.QMainWindow(parent=qtility.windows.application())
 
     # -- Update the geometry of the window to the last stored
@@ -1266,7 +2307,8 @@ def launch(blocking=True, show_splash=True, *args, **kwargs):
     )
 
     # -- Show the ui, and if we're blocking call the exec_
-    launch_window.show()
+    with tracing.span('show window', 'startup'):
+        launch_window.show()
 
     if show_splash and splash_screen is not None:
         splash_screen.finish(launch_window)
@@ -1275,3 +2317,54 @@ def launch(blocking=True, show_splash=True, *args, **kwargs):
         q_app.exec_()
 
     return launch_window
+
+
+# ------------------------------------------------------------------------------
+# noinspection PyUnresolvedReferences
+def launch_single_instance(*args, **kwargs):
+    """
+    Launches the panel as the single instance, meaning any later
+    invocations (through instance.forward) will be shown in this process
+    rather than starting up from scratch. Each environment_id is given its
+    own window, and requesting an environment which is already open will
+    simply raise its window.
+
+    This is always blocking.
+    """
+    q_app = qtility.app.get()
+
+    # -- Track the window we create for each environment
+    windows = dict()
+
+    def show(show_args, show_kwargs):
+        environment_id = show_kwargs.get('environment_id', 'launchpanel')
+
+        if len(show_args) > 1:
+            environment_id = show_args[1]
+
+        # -- If we already have a window for this environment we just
+        # -- bring it to the front
+        window = windows.get(environment_id)
+
+        if window:
+            window.show()
+            window.setWindowState(window.windowState() & ~QtCore.Qt.WindowMinimized)
+            window.raise_()
+            window.activateWindow()
+            return
+
+        windows[environment_id] = launch(False, False, *show_args, **show_kwargs)
+
+    def receive(argv):
+        forwarded_args, forwarded_kwargs = utils.format_sys_argv(argv)
+        forwarded_kwargs.pop('single_instance', None)
+        show(forwarded_args, forwarded_kwargs)
+
+    # -- Start listening for any other invocations, we hold a reference
+    # -- to the server for as long as the application runs
+    server = instance.listen(receive)
+
+    show(args, kwargs)
+    q_app.exec_()
+
+    server.close()
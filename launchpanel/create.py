@@ -5,10 +5,14 @@ their own plugins without coding.
 import os
 import sys
 import qtility
+import py_compile
 import launchpad
 
 from Qt import QtCore, QtWidgets, QtGui
 
+from . import styling
+from . import resources
+
 
 # ------------------------------------------------------------------------------
 # -- This is the template code for all action plugins
@@ -39,23 +43,6 @@ _ACTION_COMMAND_
 """
 
 
-# ------------------------------------------------------------------------------
-def _get_resource(name):
-    """
-    This is a convinience function to get files from the resources directory
-    and correct handle the slashing.
-
-    :param name: Name of file to pull from the resource directory
-
-    :return: Absolute path to the resource requested.
-    """
-    return os.path.join(
-        os.path.dirname(__file__),
-        '_resources',
-        name,
-    ).replace('//', '/')
-
-
 # ------------------------------------------------------------------------------
 # noinspection PyUnresolvedReferences
 class ClassWizard(QtWidgets.QWizard):
@@ -73,18 +60,21 @@ class ClassWizard(QtWidgets.QWizard):
 
         self.setPixmap(
             QtWidgets.QWizard.WatermarkPixmap,
-            QtGui.QPixmap(_get_resource('wizard.png')),
+            QtGui.QPixmap(resources.get('wizard.png')),
         )
 
+        # -- We share the compiled stylesheets with the panel, so these
+        # -- are only read the first time they're needed
         qtility.styling.apply(
             [
-                _get_resource('space.qss'),
-                _get_resource('wizard.qss'),
+                styling.get_style(),
+                styling.get_style('wizard.qss'),
             ],
             self,
         )
 
         self.save_directory = None
+        self.save_location = None
 
         # -- Add pages to the wizard
         self.addPage(IntroductionPage())
@@ -146,35 +136,67 @@ class ClassWizard(QtWidgets.QWizard):
         with open(save_location, 'w') as f:
             f.write(template)
 
+        # -- Byte-compile the file now so its first import is quick. This
+        # -- is purely an optimisation so we do not fail if it cannot be done
+        try:
+            py_compile.compile(save_location, doraise=True)
+
+        except (py_compile.PyCompileError, IOError, OSError):
+            print('Could not byte-compile {}'.format(save_location))
+
         # -- Store the save directory
         self.save_directory = save_dir
+        self.save_location = save_location
 
         # -- Super to finalise
         super(ClassWizard, self).accept()
 
 # ------------------------------------------------------------------------------
-# noinspection PyUnresolvedReferences
+# noinspection PyUnresolvedReferences,PyPep8Naming
 class BasePage(QtWidgets.QWizardPage):
+    """
+    The pages are only built when they are first navigated to, which keeps
+    the wizard quick to open. Subclasses define the ui file to load and
+    implement setup to register their fields.
+    """
+
+    UI_FILE = None
 
     # --------------------------------------------------------------------------
     def __init__(self, parent=None):
         super(BasePage, self).__init__(parent=parent)
 
         self.setLayout(qtility.layouts.slimify(QtWidgets.QVBoxLayout()))
+        self.ui = None
+
+    # --------------------------------------------------------------------------
+    def initializePage(self):
+        # -- Build the page the first time it is shown
+        if self.ui is not None:
+            return
+
+        # -- Load in our ui element
+        self.ui = resources.load_ui(self.UI_FILE)
+        self.layout().addWidget(self.ui)
+
+        self.setup()
+
+    # --------------------------------------------------------------------------
+    def setup(self):
+        """
+        Called once the ui of the page has been built
+        """
+        pass
 
 
 # ------------------------------------------------------------------------------
 # noinspection PyUnresolvedReferences
 class IntroductionPage(BasePage):
 
-    # --------------------------------------------------------------------------
-    def __init__(self, parent=None):
-        super(IntroductionPage, self).__init__(parent)
-
-        # -- Load in our ui element
-        self.ui = qtility.designer.load(_get_resource('wizard_page_one.ui'))
-        self.layout().addWidget(self.ui)
+    UI_FILE = 'wizard_page_one.ui'
 
+    # --------------------------------------------------------------------------
+    def setup(self):
         # -- Register the field
         self.registerField('actionName', self.ui.actionName)
 
@@ -183,14 +205,10 @@ class IntroductionPage(BasePage):
 # noinspection PyUnresolvedReferences
 class DetailsPage(BasePage):
 
-    # --------------------------------------------------------------------------
-    def __init__(self, parent=None):
-        super(DetailsPage, self).__init__(parent)
-
-        # -- Load in our ui element
-        self.ui = qtility.designer.load(_get_resource('wizard_page_two.ui'))
-        self.layout().addWidget(self.ui)
+    UI_FILE = 'wizard_page_two.ui'
 
+    # --------------------------------------------------------------------------
+    def setup(self):
         # -- Register the field
         self.registerField(
             'actionDescription',
@@ -203,14 +221,10 @@ class DetailsPage(BasePage):
 # noinspection PyUnresolvedReferences
 class GroupsPage(BasePage):
 
-    # --------------------------------------------------------------------------
-    def __init__(self, parent=None):
-        super(GroupsPage, self).__init__(parent)
-
-        # -- Load in our ui element
-        self.ui = qtility.designer.load(_get_resource('wizard_page_three.ui'))
-        self.layout().addWidget(self.ui)
+    UI_FILE = 'wizard_page_three.ui'
 
+    # --------------------------------------------------------------------------
+    def setup(self):
         # -- Register the field
         self.registerField(
             'actionGroups',
@@ -223,6 +237,8 @@ class GroupsPage(BasePage):
 # noinspection PyUnresolvedReferences,PyPep8Naming
 class CommandPage(BasePage):
 
+    UI_FILE = 'wizard_page_four.ui'
+
     DESCRIPTIONS = {
         'Execute Python Code': 'This will execute the python code you write in this box whenever the action is run. It will be run "as-is."',
         'Execute Python Script File': 'This will execute a python script on the run of the action. You should copy/paste (write) the filepath to the script in the box below.',
@@ -230,13 +246,7 @@ class CommandPage(BasePage):
     }
 
     # --------------------------------------------------------------------------
-    def __init__(self, parent=None):
-        super(CommandPage, self).__init__(parent)
-
-        # -- Load in our ui element
-        self.ui = qtility.designer.load(_get_resource('wizard_page_four.ui'))
-        self.layout().addWidget(self.ui)
-
+    def setup(self):
         # -- Register the field
         self.registerField('actionCommand', self.ui.actionCommand, "plainText")
         self.registerField('actionCommandType', self.ui.actionCommandType)
@@ -268,14 +278,10 @@ class SummaryPage(BasePage):
     <html><head/><body><p>Your action (<span style=" color:#2fc1ff;">actionName</span>) will <span style=" color:#2fc1ff;">actionType</span> using the data shown below. It will be shown in the groups <span style=" color:#2fc1ff;">actionGroups</span>.</p></body></html>
     """
 
-    # --------------------------------------------------------------------------
-    def __init__(self, parent=None):
-        super(SummaryPage, self).__init__(parent)
-
-        # -- Load in our ui element
-        self.ui = qtility.designer.load(_get_resource('wizard_page_five.ui'))
-        self.layout().addWidget(self.ui)
+    UI_FILE = 'wizard_page_five.ui'
 
+    # --------------------------------------------------------------------------
+    def setup(self):
         self.registerField('actionSaveLocation', self.ui.actionSaveLocation)
 
         self.ui.changeSaveLocation.clicked.connect(
@@ -284,6 +290,8 @@ class SummaryPage(BasePage):
 
     # --------------------------------------------------------------------------
     def initializePage(self):
+        super(SummaryPage, self).initializePage()
+
         # -- We need to collage all the information we have so far to
         # -- allow the user to confirm.
         action_name = self.field('actionName')
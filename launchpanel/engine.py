@@ -0,0 +1,860 @@
+"""
+The engine holds everything which can be shared between panels running in
+the same process. Any number of panels (typically for different
+environments) attach to the one engine, and share:
+
+    * Plugin discovery, for panels requesting the same plugin locations
+    * Decoded icons and the pixmaps built from them
+    * Status checks, so a plugin is only ever being checked once at a time
+      regardless of how many panels or tabs are showing it
+
+Settings are never shared, and remain specific to each environment.
+"""
+import sys
+import time
+import launchpad
+import functools
+import collections
+
+from Qt import QtCore
+
+from . import utils
+from . import status
+from . import imaging
+from . import tracing
+from . import watchdog
+
+
+# -- We only ever want one engine per process
+_ENGINE = dict()
+
+# -- These are the pixmaps held for an icon at a given size
+IconPixmaps = collections.namedtuple(
+    'IconPixmaps',
+    [
+        'source',
+        'colour',
+        'grayscale',
+        'highlight',
+        'size',
+        'ratio',
+    ],
+)
+
+
+# ------------------------------------------------------------------------------
+def get():
+    """
+    Returns the engine for this process, creating it the first time it
+    is requested.
+
+    :return: Engine
+    """
+    if 'engine' not in _ENGINE:
+        _ENGINE['engine'] = Engine()
+
+    return _ENGINE['engine']
+
+
+# ------------------------------------------------------------------------------
+class Engine(QtCore.QObject):
+    """
+    This is the per-process engine which all panels attach to
+    """
+
+    # -- Emitted with the factory and the identifiers of the plugins which
+    # -- were registered with it, so every panel using the factory can
+    # -- show them
+    pluginRegistered = QtCore.Signal(object, list)
+
+    # --------------------------------------------------------------------------
+    def __init__(self):
+        super(Engine, self).__init__()
+
+        self.icons = IconCache()
+
+        # -- Status results are shared with the other processes on the
+        # -- machine through the status board
+        self.board = status.Board()
+        self.scheduler = StatusScheduler(board=self.board)
+
+        # -- This watches the ui thread for stalls, and must be created
+        # -- from the ui thread
+        self.watchdog = watchdog.Watchdog()
+
+        # -- The context menu entries of each plugin are built in the
+        # -- background and cached here
+        self.menus = MenuCache()
+
+        # -- Factories are keyed by their locations, and we track which
+        # -- factory each panel is using so we know when one is unused
+        self._factories = dict()
+        self._users = dict()
+
+        # -- Each panel has its own stall threshold, and the watchdog
+        # -- uses the shortest of them
+        self._stall_thresholds = dict()
+
+    # --------------------------------------------------------------------------
+    def factory(self, plugin_locations=None, use_plugin_host=False, refresh=False, owner=None):
+        """
+        Returns the factory for the given plugin locations. Panels which
+        request the same locations are given the same factory, meaning the
+        locations are only ever searched once.
+
+        :param plugin_locations: List of locations to search for plugins
+        :param use_plugin_host: If True the plugins are run in a separate
+            host process
+        :param refresh: If True a new factory is created (searching the
+            locations again) even if one already exists. Any panel using
+            the previous factory continues to do so.
+        :param owner: Optional object (such as the panel) which is using
+            the factory. Any factory it was previously given is released,
+            and once a factory has no owners left it is discarded.
+
+        :return: The launchpad factory (or a HostedFactory)
+        """
+        plugin_locations = sorted(set(plugin_locations or list()))
+        key = (bool(use_plugin_host), tuple(plugin_locations))
+
+        if refresh or key not in self._factories:
+
+            if use_plugin_host:
+                from . import host
+                self._factories[key] = host.HostedFactory(plugin_locations=plugin_locations)
+
+            else:
+                self._factories[key] = launchpad.LaunchPad(plugin_locations=plugin_locations)
+
+        factory = self._factories[key]
+
+        if owner is not None and self._users.get(owner) is not factory:
+            self._releaseFactory(owner)
+            self._users[owner] = factory
+
+        return factory
+
+    # --------------------------------------------------------------------------
+    def setStallThreshold(self, threshold, owner):
+        """
+        Sets how long (in ms) the given owner allows the ui thread to be
+        unresponsive for. The watchdog uses the shortest threshold of all
+        the owners, ignoring any which have turned it off with 0.
+
+        :param threshold: The threshold in ms
+        :param owner: Object (such as the panel) the threshold belongs to
+        """
+        self._stall_thresholds[owner] = threshold
+        self._applyStallThreshold()
+
+    # --------------------------------------------------------------------------
+    def _applyStallThreshold(self):
+        """
+        Gives the watchdog the shortest threshold of all the owners
+        """
+        thresholds = [
+            threshold
+            for threshold in self._stall_thresholds.values()
+            if threshold
+        ]
+
+        self.watchdog.setThreshold(min(thresholds) if thresholds else 0)
+
+    # --------------------------------------------------------------------------
+    def release(self, owner):
+        """
+        Releases everything held for the given owner. If no other owner is
+        using its factory then the factory is discarded, stopping its
+        plugin host if it has one, and the watchdog goes back to using the
+        thresholds of the remaining owners.
+
+        :param owner: The object the factory was given to
+        """
+        if self._stall_thresholds.pop(owner, None) is not None:
+            self._applyStallThreshold()
+
+        self._releaseFactory(owner)
+
+    # --------------------------------------------------------------------------
+    def _releaseFactory(self, owner):
+        """
+        Releases the factory used by the given owner, discarding it if no
+        other owner is using it
+        """
+        factory = self._users.pop(owner, None)
+
+        if factory is None:
+            return
+
+        if any(used is factory for used in self._users.values()):
+            return
+
+        # -- The factory may have already been replaced by a refresh, in
+        # -- which case the entry belongs to its replacement
+        for key, cached in list(self._factories.items()):
+            if cached is factory:
+                self._factories.pop(key)
+
+        if hasattr(factory, 'host'):
+            factory.host.stop()
+
+    # --------------------------------------------------------------------------
+    def registerPluginFile(self, factory, filepath):
+        """
+        Registers the plugins within the given file with the given factory,
+        and tells every panel using the factory about them.
+
+        :param factory: The factory to register the plugins with
+        :param filepath: Absolute path to the plugin file
+
+        :return: The identifiers of the plugins which were registered
+        """
+        # -- The plugin host loads the file itself, otherwise we load
+        # -- it here and register what we find
+        if hasattr(factory, 'register_file'):
+            identifiers = factory.register_file(filepath)
+
+        else:
+            identifiers = utils.register_file(factory, filepath)
+
+        self.pluginRegistered.emit(factory, identifiers)
+
+        return identifiers
+
+    # --------------------------------------------------------------------------
+    def factories(self):
+        """
+        Returns all the factories which have been created and are
+        still in use
+
+        :return: list
+        """
+        return list(self._factories.values())
+
+
+# ------------------------------------------------------------------------------
+class IconCache(object):
+    """
+    Holds the decoded icons and the pixmaps built from them, keyed by the
+    icon path. Only a couple of sizes are held per icon, so the cache grows
+    with the number of unique icons rather than the number of delegates.
+    """
+
+    # -- This is the number of sizes we hold the pixmaps of for each icon
+    SIZES_PER_ICON = 2
+
+    # --------------------------------------------------------------------------
+    def __init__(self):
+        self._sources = dict()
+        self._pixmaps = dict()
+
+        # -- These are the builds in flight, along with the owner and
+        # -- callback of everything waiting on them
+        self._jobs = dict()
+        self._waiting = dict()
+
+    # --------------------------------------------------------------------------
+    def pixmaps(self, path, size, ratio):
+        """
+        Returns the cached pixmaps for the given icon
+
+        :param path: Path of the icon
+        :param size: Edge length in physical pixels
+        :param ratio: The device pixel ratio
+
+        :return: IconPixmaps or None if they are not cached
+        """
+        return self._pixmaps.get(path, dict()).get((size, ratio))
+
+    # --------------------------------------------------------------------------
+    def request(self, path, size, ratio, callback, owner=None, fallback=None):
+        """
+        Calls the given callback with the pixmaps of the given icon. If they
+        are cached this happens straight away, otherwise they are built in a
+        worker thread. Requests for the same icon whilst it is being built
+        all wait on the one build.
+
+        :param path: Path of the icon
+        :param size: Edge length in physical pixels
+        :param ratio: The device pixel ratio
+        :param callback: Function to call with the IconPixmaps
+        :param owner: Optional object making the request, which can be
+            used to cancel it
+        :param fallback: Path of the icon to use if the icon cannot be loaded
+        """
+        pixmaps = self.pixmaps(path, size, ratio)
+
+        if pixmaps:
+            callback(pixmaps)
+            return
+
+        key = (path, size, ratio)
+        self._waiting.setdefault(key, list()).append((owner, callback))
+
+        if key in self._jobs:
+            return
+
+        # -- If we have already decoded the icon we only need to scale it
+        source = self._sources.get(path)
+
+        job = imaging.IconJob(
+            source if source is not None else path,
+            size,
+            fallback=fallback,
+        )
+        job.signals.completed.connect(
+            functools.partial(self._complete, key),
+        )
+
+        self._jobs[key] = job
+        imaging.pool().start(job)
+
+    # --------------------------------------------------------------------------
+    def cancel(self, owner):
+        """
+        Cancels all the requests made by the given owner. Any builds which
+        nothing is waiting on anymore are cancelled too.
+        """
+        for key in list(self._waiting.keys()):
+            self._waiting[key] = [
+                waiting
+                for waiting in self._waiting[key]
+                if waiting[0] is not owner
+            ]
+
+            if self._waiting[key]:
+                continue
+
+            self._waiting.pop(key)
+            job = self._jobs.pop(key, None)
+
+            if job:
+                job.cancel()
+
+    # --------------------------------------------------------------------------
+    def pending(self, owner):
+        """
+        Returns the number of requests the given owner is waiting on
+        """
+        return len(
+            [
+                waiting
+                for waiting_list in self._waiting.values()
+                for waiting in waiting_list
+                if waiting[0] is owner
+            ]
+        )
+
+    # --------------------------------------------------------------------------
+    def _complete(self, key, images):
+        """
+        Stores the built images as pixmaps and passes them to everything
+        which is waiting on them
+        """
+        path, size, ratio = key
+
+        self._jobs.pop(key, None)
+        self._sources.setdefault(path, images.source)
+
+        pixmaps = IconPixmaps(
+            source=self._sources[path],
+            colour=imaging.to_pixmap(images.colour, ratio),
+            grayscale=imaging.to_pixmap(images.grayscale, ratio),
+            highlight=images.highlight,
+            size=size,
+            ratio=ratio,
+        )
+
+        # -- Store the pixmaps, dropping the oldest size if we are
+        # -- holding too many
+        sizes = self._pixmaps.setdefault(path, collections.OrderedDict())
+        sizes[(size, ratio)] = pixmaps
+
+        while len(sizes) > self.SIZES_PER_ICON:
+            sizes.popitem(last=False)
+
+        for _, callback in self._waiting.pop(key, list()):
+            callback(pixmaps)
+
+
+# ------------------------------------------------------------------------------
+# noinspection PyUnresolvedReferences
+class MenuCache(QtCore.QObject):
+    """
+    Holds the context menu entries returned by each plugins actions method.
+    Entries which are not cached are built in a thread, so a plugin which
+    builds its menu from a slow query never blocks the ui. Requests for the
+    same plugin whilst it is being built all wait on the one build.
+
+    Entries are held until they are older than the TTL or are invalidated,
+    which the panel does whenever the action is run or its status changes.
+    """
+
+    # -- This is how long (in seconds) the entries of a plugin are used
+    # -- for before they are built again
+    TTL = 60 * 5
+
+    # --------------------------------------------------------------------------
+    def __init__(self, parent=None):
+        super(MenuCache, self).__init__(parent=parent)
+
+        self._entries = dict()
+
+        # -- These are the builds in flight, along with the owner and
+        # -- callback of everything waiting on them
+        self._threads = dict()
+        self._waiting = dict()
+
+        # -- Each invalidation moves on the generation of the plugin (or of
+        # -- every plugin), so a build which was started before it is never
+        # -- cached
+        self._generation = 0
+        self._generations = dict()
+
+    # --------------------------------------------------------------------------
+    def entries(self, plugin):
+        """
+        Returns the cached menu entries of the given plugin
+
+        :return: OrderedDict or None if they are not cached
+        """
+        cached = self._entries.get(plugin)
+
+        if not cached or time.time() - cached[0] > self.TTL:
+            return None
+
+        return cached[1]
+
+    # --------------------------------------------------------------------------
+    def store(self, plugin, entries):
+        """
+        Caches the given menu entries for the plugin
+        """
+        self._entries[plugin] = (time.time(), entries)
+
+    # --------------------------------------------------------------------------
+    def request(self, plugin, callback, owner=None):
+        """
+        Calls the given callback with the menu entries of the given plugin.
+        If they are cached this happens straight away, otherwise they are
+        built in a thread. If the plugin fails to build its entries the
+        callback is given None.
+
+        :param plugin: The plugin to get the menu entries of
+        :param callback: Function to call with the entries
+        :param owner: Optional object making the request, which can be
+            used to cancel it
+        """
+        entries = self.entries(plugin)
+
+        if entries is not None:
+            callback(entries)
+            return
+
+        self._waiting.setdefault(plugin, list()).append((owner, callback))
+
+        if plugin in self._threads:
+            return
+
+        thread = ActionsThread(plugin)
+        thread.generation = self._generationOf(plugin)
+        thread.finished.connect(
+            functools.partial(self._complete, plugin, thread),
+        )
+
+        self._threads[plugin] = thread
+        thread.start()
+
+    # --------------------------------------------------------------------------
+    def cancel(self, owner):
+        """
+        Cancels all the requests made by the given owner. Builds are always
+        left to finish, as their result is still worth caching.
+        """
+        for plugin in list(self._waiting.keys()):
+            self._waiting[plugin] = [
+                waiting
+                for waiting in self._waiting[plugin]
+                if waiting[0] is not owner
+            ]
+
+            if not self._waiting[plugin]:
+                self._waiting.pop(plugin)
+
+    # --------------------------------------------------------------------------
+    def invalidate(self, plugin=None):
+        """
+        Drops the cached entries of the given plugin, or of every plugin
+        if no plugin is given
+        """
+        if plugin is None:
+            self._entries.clear()
+            self._generations.clear()
+            self._generation += 1
+
+        else:
+            self._entries.pop(plugin, None)
+            self._generations[plugin] = self._generations.get(plugin, 0) + 1
+
+    # --------------------------------------------------------------------------
+    def _generationOf(self, plugin):
+        return self._generation, self._generations.get(plugin, 0)
+
+    # --------------------------------------------------------------------------
+    def _complete(self, plugin, thread):
+        """
+        Caches the built entries and passes them to everything which is
+        waiting on them
+        """
+        thread.deleteLater()
+
+        if self._threads.get(plugin) is thread:
+            self._threads.pop(plugin)
+
+        # -- A failed build is never cached, so it is tried again next
+        # -- time. Neither is a build which was invalidated whilst it was
+        # -- in flight, though anything waiting on it is still given it.
+        if thread.entries is not None and thread.generation == self._generationOf(plugin):
+            self.store(plugin, thread.entries)
+
+        for _, callback in self._waiting.pop(plugin, list()):
+            callback(thread.entries)
+
+
+# ------------------------------------------------------------------------------
+class ActionsThread(QtCore.QThread):
+    """
+    Calls the actions method of a plugin, so building its context menu
+    entries never blocks the ui
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, plugin):
+        super(ActionsThread, self).__init__()
+        self.plugin = plugin
+        self.entries = None
+
+        # -- This is the generation of the menu cache the build was
+        # -- started in
+        self.generation = None
+
+    # --------------------------------------------------------------------------
+    def run(self):
+        # -- We're running code from within a plugin, so we wrap it as we
+        # -- cannot guarantee its quality
+        try:
+            with tracing.span('actions', 'menu', action=self.plugin.Name):
+                self.entries = collections.OrderedDict(self.plugin.actions() or dict())
+
+        except:
+            print('Failed to get the actions of {}'.format(self.plugin.Name))
+            print(sys.exc_info())
+
+
+# ------------------------------------------------------------------------------
+# noinspection PyUnresolvedReferences
+class StatusScheduler(QtCore.QObject):
+    """
+    All status checks go through the scheduler. If a check is requested for
+    a plugin which is already being checked then the request simply waits
+    on the existing check, so each plugin is only checked once no matter
+    how many panels and tabs are showing it.
+
+    Checks are started once control returns to the event loop, meaning all
+    the checks requested during a sweep are started together. Plugins which
+    share a status provider (see the status module) are checked with a
+    single call to the provider, and the rest are checked individually.
+
+    A check which is still running after the timeout of the status metrics
+    is counted as having timed out, and nothing waits on it any longer.
+    """
+
+    # -- This is how often (in ms) we look for checks which have timed out
+    EXPIRY_INTERVAL = 1000
+
+    # --------------------------------------------------------------------------
+    def __init__(self, board=None, parent=None):
+        super(StatusScheduler, self).__init__(parent=parent)
+
+        # -- If given, results are shared with other processes
+        # -- through this board
+        self.board = board
+
+        # -- These are the checks in flight, along with the owner and
+        # -- callback of everything waiting on them
+        self._threads = dict()
+        self._waiting = dict()
+
+        # -- Plugins are queued here until the sweep is complete
+        self._queued = list()
+        self._queued_at = None
+        self._sweep_timer = QtCore.QTimer(self)
+        self._sweep_timer.setSingleShot(True)
+        self._sweep_timer.setInterval(0)
+        self._sweep_timer.timeout.connect(self._startQueued)
+
+        # -- This only runs whilst there are checks in flight
+        self._expiry_timer = QtCore.QTimer(self)
+        self._expiry_timer.setInterval(self.EXPIRY_INTERVAL)
+        self._expiry_timer.timeout.connect(self._expire)
+
+    # --------------------------------------------------------------------------
+    def check(self, plugin, callback, owner=None, throttle=False):
+        """
+        Checks the status of the given plugin in a thread, and calls the
+        callback with the status once it is known.
+
+        :param plugin: The plugin to check
+        :param callback: Function to call with the status
+        :param owner: Optional object making the request, which can be
+            used to cancel it
+        :param throttle: If True the check is skipped if the checks of the
+            plugin keep failing, until it has been left alone for a while
+        """
+        # -- A throttled plugin simply keeps the status it already has
+        if throttle and status.metrics().throttled(plugin.Name):
+            return
+
+        self._waiting.setdefault(plugin, list()).append((owner, callback))
+
+        if plugin in self._threads or plugin in self._queued:
+            return
+
+        self._queued.append(plugin)
+
+        if not self._sweep_timer.isActive():
+            self._queued_at = tracing.now()
+            self._sweep_timer.start()
+
+    # --------------------------------------------------------------------------
+    def _startQueued(self):
+        """
+        Starts a check for each group of queued plugins sharing a provider,
+        and for each queued plugin which does not have one
+        """
+        queued = self._queued
+        self._queued = list()
+
+        groups = collections.OrderedDict()
+
+        for plugin in queued:
+
+            # -- Skip anything which has been cancelled whilst queued
+            if plugin not in self._waiting:
+                continue
+
+            key = status.provider(plugin)
+            groups.setdefault(plugin if key is None else key, list()).append(plugin)
+
+        for plugins in groups.values():
+            thread = StatusCheckThread(plugins=plugins, board=self.board)
+            thread.queued_at = self._queued_at
+            thread.finished.connect(
+                functools.partial(self._complete, thread),
+            )
+
+            for plugin in plugins:
+                self._threads[plugin] = thread
+
+            thread.start()
+
+        if self._threads and not self._expiry_timer.isActive():
+            self._expiry_timer.start()
+
+    # --------------------------------------------------------------------------
+    def _expire(self):
+        """
+        Stops waiting on any checks which have timed out. Their claims on
+        the status board are released so other processes can check them,
+        and anything waiting on them keeps the status it already has.
+        """
+        names = status.metrics().expire()
+
+        for plugin, thread in list(self._threads.items()):
+
+            if plugin.Name not in names:
+                continue
+
+            self._threads.pop(plugin)
+            self._waiting.pop(plugin, None)
+
+            if self.board:
+                self.board.release(plugin)
+
+            # -- A thread may be checking other plugins too, in which
+            # -- case it has to be left to finish
+            if thread not in self._threads.values():
+                thread.cancel()
+
+        if not self._threads:
+            self._expiry_timer.stop()
+
+    # --------------------------------------------------------------------------
+    def cancel(self, owner):
+        """
+        Cancels all the checks requested by the given owner. Any checks
+        which nothing is waiting on anymore are cancelled too.
+        """
+        for plugin in list(self._waiting.keys()):
+            self._waiting[plugin] = [
+                waiting
+                for waiting in self._waiting[plugin]
+                if waiting[0] is not owner
+            ]
+
+            if self._waiting[plugin]:
+                continue
+
+            self._waiting.pop(plugin)
+
+            if plugin in self._queued:
+                self._queued.remove(plugin)
+
+            thread = self._threads.pop(plugin, None)
+
+            # -- A thread may be checking other plugins too, in which
+            # -- case it has to be left to finish
+            if thread and thread not in self._threads.values():
+                thread.cancel()
+
+    # --------------------------------------------------------------------------
+    def pending(self, owner=None):
+        """
+        Returns the number of checks the given owner is waiting on, or the
+        number of plugins being checked if no owner is given.
+        """
+        if owner is None:
+            return len(self._threads) + len(self._queued)
+
+        return len(
+            [
+                waiting
+                for waiting_list in self._waiting.values()
+                for waiting in waiting_list
+                if waiting[0] is owner
+            ]
+        )
+
+    # --------------------------------------------------------------------------
+    def _complete(self, thread):
+        """
+        Passes the statuses to everything which is waiting on them
+        """
+        thread.deleteLater()
+
+        for plugin in thread.plugins:
+
+            # -- If the plugin was cancelled (and possibly requested again)
+            # -- whilst this was running then the result is not ours to give
+            if self._threads.get(plugin) is not thread:
+                continue
+
+            self._threads.pop(plugin)
+
+            for _, callback in self._waiting.pop(plugin, list()):
+                callback(thread.statuses.get(plugin.Name))
+
+        if not self._threads:
+            self._expiry_timer.stop()
+
+
+# ------------------------------------------------------------------------------
+class StatusCheckThread(QtCore.QThread):
+    """
+    This is the thread which calls the status of one or more plugins. This
+    is to ensure the status check is never blocking to the UI
+    """
+
+    # -- This is how often (in seconds) the thread checks whether it has been
+    # -- cancelled whilst waiting for the status delay to pass
+    CANCEL_GRANULARITY = 0.1
+
+    # -- Threads which are cancelled whilst running are held here until they
+    # -- finish, as a running thread must never be garbage collected
+    _CANCELLED = set()
+
+    # --------------------------------------------------------------------------
+    def __init__(self, plugins, board=None):
+        super(StatusCheckThread, self).__init__()
+        self.plugins = plugins
+        self.board = board
+
+        # -- This is when the check was requested, and is only used
+        # -- for tracing
+        self.queued_at = None
+        self.statuses = dict()
+        self.cancelled = False
+
+    # --------------------------------------------------------------------------
+    def cancel(self):
+        """
+        Abandons the check. If the thread is still running it is kept alive
+        until it finishes and is then deleted, otherwise it is deleted
+        straight away.
+        """
+        self.cancelled = True
+
+        try:
+            self.finished.disconnect()
+
+        except (RuntimeError, TypeError):
+            pass
+
+        if self.isRunning():
+            StatusCheckThread._CANCELLED.add(self)
+            self.finished.connect(self._retire)
+
+            # -- It may have finished before we connected
+            if self.isFinished():
+                self._retire()
+
+            return
+
+        self.deleteLater()
+
+    # --------------------------------------------------------------------------
+    def _retire(self):
+        StatusCheckThread._CANCELLED.discard(self)
+        self.deleteLater()
+
+    # --------------------------------------------------------------------------
+    def runAfterDelay(self):
+        if self.cancelled:
+            return
+
+        self.statuses = status.messages(
+            self.plugins,
+            board=self.board,
+            cancelled=lambda: self.cancelled,
+        )
+
+    # --------------------------------------------------------------------------
+    def run(self):
+        names = [plugin.Name for plugin in self.plugins]
+        started = tracing.now()
+
+        if self.queued_at is not None:
+            tracing.complete(
+                'status queue',
+                self.queued_at,
+                started,
+                category='status',
+                track='Status queue',
+                plugins=names,
+            )
+
+        # -- Wait in small steps so a cancelled check does not hold onto
+        # -- the thread for the whole delay. When checking several plugins
+        # -- together we wait for the longest of their delays
+        wait_until = time.time() + max(
+            getattr(plugin, 'STATUS_DELAY', 0)
+            for plugin in self.plugins
+        )
+
+        while not self.cancelled and time.time() < wait_until:
+            time.sleep(min(self.CANCEL_GRANULARITY, max(0, wait_until - time.time())))
+
+        tracing.complete('status delay', started, category='status', plugins=names)
+
+        with tracing.span('status check', 'status', plugins=names):
+            self.runAfterDelay()
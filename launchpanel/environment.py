@@ -0,0 +1,213 @@
+"""
+Each environment has its own settings, which are persisted using scribble.
+Rather than reading them from disk every time they are needed, a single
+settings object is held for each environment and it is only reloaded if
+the file backing it has been changed (for instance by another process).
+
+This module only uses scribble and the standard library, so it is safe to
+use without Qt.
+"""
+import os
+import scribble
+
+
+# -- We hold one settings object per environment
+_SETTINGS = dict()
+
+
+# ------------------------------------------------------------------------------
+def settings(environment_id):
+    """
+    Returns the settings for the given environment.
+
+    :param environment_id: The environment to get the settings for
+
+    :return: Settings
+    """
+    if environment_id not in _SETTINGS:
+        _SETTINGS[environment_id] = Settings(environment_id)
+
+    return _SETTINGS[environment_id]
+
+
+# ------------------------------------------------------------------------------
+def cached():
+    """
+    Returns all the settings objects which are currently held
+
+    :return: list(Settings)
+    """
+    return list(_SETTINGS.values())
+
+
+# ------------------------------------------------------------------------------
+class Settings(object):
+    """
+    Holds the settings of an environment, with accessors for each of the
+    settings the panel uses. Setting any value saves it immediately.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, environment_id):
+        self.environment_id = environment_id
+
+        self._data = None
+        self._signature = None
+
+    # --------------------------------------------------------------------------
+    def _fileSignature(self):
+        """
+        Returns the modification time and size of the backing file, or None
+        if it does not exist yet
+        """
+        try:
+            stat = os.stat(self._data.location())
+
+        except OSError:
+            return None
+
+        return stat.st_mtime, stat.st_size
+
+    # --------------------------------------------------------------------------
+    def data(self):
+        """
+        Returns the underlying scribble dictionary, reloading it first if
+        the file has changed since it was last read.
+
+        :return: scribble.ScribbleDictionary
+        """
+        if self._data is None or self._fileSignature() != self._signature:
+            self._data = scribble.get(self.environment_id)
+            self._signature = self._fileSignature()
+
+        return self._data
+
+    # --------------------------------------------------------------------------
+    def get(self, key, default=None):
+        return self.data().get(key, default)
+
+    # --------------------------------------------------------------------------
+    def set(self, key, value):
+        """
+        Stores the given value and saves the settings
+        """
+        self.data()[key] = value
+        self.save()
+
+    # --------------------------------------------------------------------------
+    def save(self):
+        self.data().save()
+
+        # -- We know what we have written, so there is no need to
+        # -- read it back in
+        self._signature = self._fileSignature()
+
+    # --------------------------------------------------------------------------
+    @property
+    def icon_size(self):
+        return int(self.get('icon_size', 50))
+
+    @icon_size.setter
+    def icon_size(self, value):
+        self.set('icon_size', int(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def geometry(self):
+        return [int(value) for value in self.get('geometry', [300, 300, 400, 400])]
+
+    @geometry.setter
+    def geometry(self, value):
+        self.set('geometry', [int(v) for v in value])
+
+    # --------------------------------------------------------------------------
+    @property
+    def user_actions(self):
+        # -- Lists are always copied so they cannot be altered in place
+        return list(self.get('user_actions', list()))
+
+    @user_actions.setter
+    def user_actions(self, value):
+        self.set('user_actions', list(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def plugin_locations(self):
+        return list(self.get('plugin_locations', list()))
+
+    @plugin_locations.setter
+    def plugin_locations(self, value):
+        self.set('plugin_locations', list(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def show_beta(self):
+        return bool(self.get('show_beta', False))
+
+    @show_beta.setter
+    def show_beta(self, value):
+        self.set('show_beta', bool(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def use_plugin_host(self):
+        return bool(self.get('use_plugin_host', False))
+
+    @use_plugin_host.setter
+    def use_plugin_host(self, value):
+        self.set('use_plugin_host', bool(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def use_mirror(self):
+        return bool(self.get('use_mirror', False))
+
+    @use_mirror.setter
+    def use_mirror(self, value):
+        self.set('use_mirror', bool(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def status_interval(self):
+        # -- This has always been stored under this (misspelt) key
+        return int(self.get('status_inverval', 1800))
+
+    @status_interval.setter
+    def status_interval(self, value):
+        self.set('status_inverval', int(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def throttle_status_checks(self):
+        return bool(self.get('throttle_status_checks', False))
+
+    @throttle_status_checks.setter
+    def throttle_status_checks(self, value):
+        self.set('throttle_status_checks', bool(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def stall_threshold(self):
+        return int(self.get('stall_threshold', 1000))
+
+    @stall_threshold.setter
+    def stall_threshold(self, value):
+        self.set('stall_threshold', int(value))
+
+    # --------------------------------------------------------------------------
+    @property
+    def tab_mode(self):
+        return self.get('tabMode')
+
+    @tab_mode.setter
+    def tab_mode(self, value):
+        self.set('tabMode', value)
+
+    # --------------------------------------------------------------------------
+    @property
+    def active_tab(self):
+        return self.get('active_tab')
+
+    @active_tab.setter
+    def active_tab(self, value):
+        self.set('active_tab', value)
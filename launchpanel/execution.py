@@ -0,0 +1,259 @@
+"""
+This module is responsible for running actions on behalf of the panel.
+
+By default an action is run directly on the ui thread, exactly as it
+always has been. Plugins can opt in to a different behaviour by defining
+any of the following class attributes:
+
+    * RUN_MODE : One of RUN_INLINE, RUN_THREAD or RUN_PROCESS. Thread runs
+        call the run method in a worker thread, whilst process runs call it
+        from within a fresh python interpreter.
+
+    * RUN_CONCURRENCY : The maximum number of runs of the action which can
+        be in flight at any one time. This defaults to 1.
+
+    * RUN_QUEUE : If True, any runs requested whilst the action is at its
+        concurrency limit are queued and run in turn. Otherwise they are
+        ignored. This defaults to False.
+"""
+import os
+import sys
+import inspect
+import logging
+import functools
+
+from Qt import QtCore
+
+from . import utils
+from . import tracing
+from . import watchdog
+
+
+# -- Failed runs are reported through this, rather than interrupting
+# -- whatever is writing to stdout
+_LOG = logging.getLogger(__name__)
+
+# -- These are the supported run modes
+RUN_INLINE = 'inline'
+RUN_THREAD = 'thread'
+RUN_PROCESS = 'process'
+
+# -- This is the code we give to the interpreter when running an action
+# -- in a subprocess. It is given the plugin file and class name as arguments
+_PROCESS_BOOTSTRAP = (
+    'import sys, runpy\n'
+    'namespace = runpy.run_path(sys.argv[1])\n'
+    'namespace[sys.argv[2]].run()\n'
+)
+
+
+# ------------------------------------------------------------------------------
+# noinspection PyUnresolvedReferences,PyPep8Naming
+class ActionRunner(QtCore.QObject):
+    """
+    Runs actions according to their run mode and tracks which actions
+    are currently in flight.
+    """
+
+    # -- These are emitted with the identifier of the action whenever
+    # -- a run starts or finishes
+    started = QtCore.Signal(str)
+    finished = QtCore.Signal(str)
+
+    # --------------------------------------------------------------------------
+    def __init__(self, parent=None):
+        super(ActionRunner, self).__init__(parent=parent)
+
+        # -- We keep our own pool so long running actions never starve
+        # -- anything else which is using the global pool
+        self._pool = QtCore.QThreadPool()
+
+        # -- Track how many runs of each identifier are in flight, and
+        # -- how many are waiting to run
+        self._running = dict()
+        self._queued = dict()
+
+        # -- Any thread tasks or processes are held here until they
+        # -- complete so they are not garbage collected
+        self._tasks = list()
+
+    # --------------------------------------------------------------------------
+    def isRunning(self, identifier):
+        """
+        Returns True if there is a run of the given action in flight
+        """
+        return self._running.get(identifier, 0) > 0
+
+    # --------------------------------------------------------------------------
+    def submit(self, identifier, action):
+        """
+        Requests a run of the given action. If the action is already at its
+        concurrency limit the run is either queued or ignored, depending on
+        the actions RUN_QUEUE attribute.
+
+        :param identifier: Identifier of the action
+        :param action: The action plugin to run
+
+        :return: True if the run was started or queued
+        """
+        limit = max(1, getattr(action, 'RUN_CONCURRENCY', 1))
+
+        if self._running.get(identifier, 0) >= limit:
+
+            if not getattr(action, 'RUN_QUEUE', False):
+                return False
+
+            self._queued[identifier] = self._queued.get(identifier, 0) + 1
+            return True
+
+        self._start(identifier, action)
+        return True
+
+    # --------------------------------------------------------------------------
+    def _start(self, identifier, action):
+        """
+        Starts the run of the action using its run mode
+        """
+        self._running[identifier] = self._running.get(identifier, 0) + 1
+        self.started.emit(identifier)
+
+        run_mode = getattr(action, 'RUN_MODE', RUN_INLINE)
+
+        if run_mode == RUN_THREAD:
+            task = _ThreadTask(identifier, action)
+            task.signals.finished.connect(
+                functools.partial(self._complete, identifier, action, task),
+            )
+
+            self._tasks.append(task)
+            self._pool.start(task)
+
+        elif run_mode == RUN_PROCESS:
+            process = QtCore.QProcess(self)
+
+            # -- The child needs to be able to import the same modules
+            # -- the plugin can see in this process
+            environment = QtCore.QProcessEnvironment.systemEnvironment()
+            environment.insert('PYTHONPATH', os.pathsep.join(sys.path))
+            process.setProcessEnvironment(environment)
+
+            process.finished.connect(
+                functools.partial(self._complete, identifier, action, process),
+            )
+
+            # -- A process which fails to start never finishes, so we
+            # -- have to complete the run ourselves
+            process.errorOccurred.connect(
+                functools.partial(self._processError, identifier, action, process),
+            )
+
+            # -- The run happens in another process, so we can only trace
+            # -- it from here
+            process.started_at = tracing.now()
+
+            self._tasks.append(process)
+            process.start(
+                utils.python_executable(),
+                [
+                    '-c',
+                    _PROCESS_BOOTSTRAP,
+                    inspect.getfile(action),
+                    action.__name__,
+                ],
+            )
+
+        else:
+            # -- Inline runs behave as they always have, so we do not
+            # -- swallow any exceptions, but we must always complete
+            try:
+                with tracing.span('run', 'action', action=identifier):
+                    with watchdog.attribute(identifier, 'run'):
+                        action.run()
+
+            finally:
+                self._complete(identifier, action, None)
+
+    # --------------------------------------------------------------------------
+    def _processError(self, identifier, action, process, error):
+        """
+        Called whenever a process run reports an error. Only a failure to
+        start needs handling, as any other error is followed by finished.
+        """
+        if error != QtCore.QProcess.FailedToStart:
+            return
+
+        _LOG.error('Failed to start a process to run %s', identifier)
+        self._complete(identifier, action, process)
+
+    # --------------------------------------------------------------------------
+    # noinspection PyUnusedLocal
+    def _complete(self, identifier, action, task, *args):
+        """
+        Called whenever a run finishes, regardless of its run mode. A run
+        is only ever completed once.
+        """
+        # -- Thread and process runs are tracked until they complete, so
+        # -- if we are no longer tracking it this run is already complete
+        if task is not None and task not in self._tasks:
+            return
+
+        if task is not None:
+            self._tasks.remove(task)
+
+            if isinstance(task, QtCore.QProcess):
+                tracing.complete(
+                    'run',
+                    task.started_at,
+                    category='action',
+                    track='Action processes',
+                    action=identifier,
+                )
+                task.deleteLater()
+
+        self._running[identifier] = max(0, self._running.get(identifier, 0) - 1)
+        self.finished.emit(identifier)
+
+        # -- If there is anything queued for this action, start it now
+        if self._queued.get(identifier, 0):
+            self._queued[identifier] -= 1
+            self._start(identifier, action)
+
+
+# ------------------------------------------------------------------------------
+# noinspection PyUnresolvedReferences
+class _ThreadTaskSignals(QtCore.QObject):
+    """
+    QRunnable's cannot emit signals, so this carries them on the tasks
+    behalf.
+    """
+    finished = QtCore.Signal()
+
+
+# ------------------------------------------------------------------------------
+class _ThreadTask(QtCore.QRunnable):
+    """
+    Calls the run method of an action from within a worker thread
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, identifier, action):
+        super(_ThreadTask, self).__init__()
+        self.identifier = identifier
+        self.action = action
+        self.signals = _ThreadTaskSignals()
+
+        # -- The lifetime of the task is owned by the runner
+        self.setAutoDelete(False)
+
+    # --------------------------------------------------------------------------
+    def run(self):
+        # -- We're running code from within a plugin, so we wrap it as we
+        # -- cannot guarantee its quality
+        try:
+            with tracing.span('run', 'action', action=self.identifier):
+                self.action.run()
+
+        except:
+            _LOG.exception('Failed to run %s', self.identifier)
+
+        self.signals.finished.emit()
@@ -0,0 +1,180 @@
+"""
+This module allows actions to be listed, run and status checked without
+any ui at all. It uses the same plugin locations and settings as the panel
+for the given environment, but never imports Qt.
+
+This is typically invoked through run.py, for example:
+
+    python run.py headless=list
+    python run.py headless=run action="My Action"
+    python run.py headless=status action="My Action" environment_id=foo
+"""
+import sys
+import launchpad
+
+from . import index
+from . import status
+from . import environment
+
+
+# ------------------------------------------------------------------------------
+class HeadlessRunner(object):
+    """
+    Resolves actions for an environment. Where a valid discovery index
+    exists it is used, meaning only the file of the requested action is
+    imported. Otherwise a full search is made and the index is rebuilt.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, plugin_locations=None, environment_id='launchpanel', show_beta=None):
+        self.environment_id = environment_id
+
+        # -- Combine any paths we're given with any stored paths
+        # -- and then ensure we remove any duplicates
+        settings = environment.settings(environment_id)
+        stored_plugin_paths = settings.plugin_locations
+        stored_plugin_paths.extend(plugin_locations or list())
+        self.plugin_locations = list(set(stored_plugin_paths))
+
+        if show_beta is None:
+            show_beta = settings.show_beta
+
+        self.show_beta = show_beta
+
+        self._factory = None
+        self._index = index.get(environment_id, self.plugin_locations)
+
+    # --------------------------------------------------------------------------
+    def factory(self):
+        """
+        Returns the launchpad factory, searching all the plugin locations
+        (and rebuilding the index) the first time it is requested.
+        """
+        if not self._factory:
+            self._factory = launchpad.LaunchPad(plugin_locations=self.plugin_locations)
+            self._index = index.build(
+                self._factory,
+                self.environment_id,
+                self.plugin_locations,
+            )
+
+        return self._factory
+
+    # --------------------------------------------------------------------------
+    def identifiers(self):
+        """
+        Returns the identifiers of all the available actions
+        """
+        if self._index is None:
+            return self.factory().identifiers(show_beta=self.show_beta)
+
+        identifiers = list()
+
+        for identifier, entry in self._index['plugins'].items():
+            state = launchpad.PluginStates(entry['state'])
+
+            if not self.show_beta and launchpad.PluginStates.BETA in state:
+                continue
+
+            if state == launchpad.PluginStates.INVALID:
+                continue
+
+            identifiers.append(identifier)
+
+        return sorted(identifiers, key=lambda t: t.lower())
+
+    # --------------------------------------------------------------------------
+    def request(self, identifier):
+        """
+        Returns the action with the given identifier, or None if there is
+        no such action.
+        """
+        if self._index is not None:
+            action = index.load(self._index, identifier)
+
+            if action:
+                return action
+
+        return self.factory().request(identifier)
+
+    # --------------------------------------------------------------------------
+    def run(self, identifier):
+        """
+        Runs the given action.
+
+        :return: True if the action was run
+        """
+        action = self.request(identifier)
+
+        if not action:
+            print('Could not find an action called %s' % identifier)
+            return False
+
+        if launchpad.PluginStates.DISABLED in action.state():
+            print('%s is disabled' % identifier)
+            return False
+
+        action.run()
+        return True
+
+    # --------------------------------------------------------------------------
+    def status(self, identifier):
+        """
+        Returns the status message of the given action, which is None if
+        the action has nothing to report.
+        """
+        action = self.request(identifier)
+
+        if not action:
+            raise KeyError('Could not find an action called %s' % identifier)
+
+        return status.messages([action]).get(action.Name)
+
+
+# ------------------------------------------------------------------------------
+def main(args, kwargs):
+    """
+    Carries out the headless command described by the arguments given
+    to run.py.
+
+    :param args: Positional arguments from utils.format_sys_argv
+    :param kwargs: Keyword arguments from utils.format_sys_argv
+
+    :return: The exit code. A status check returns 2 if the action has
+        a status to report.
+    """
+    command = kwargs.get('headless')
+    identifier = kwargs.get('action')
+
+    runner = HeadlessRunner(
+        plugin_locations=kwargs.get('plugin_locations'),
+        environment_id=kwargs.get('environment_id', 'launchpanel'),
+        show_beta=kwargs.get('show_beta'),
+    )
+
+    if command == 'list':
+        for action_name in runner.identifiers():
+            print(action_name)
+
+        return 0
+
+    if not identifier:
+        print('An action must be given, for example action="My Action"')
+        return 1
+
+    if command == 'run':
+        return 0 if runner.run(identifier) else 1
+
+    if command == 'status':
+        try:
+            status = runner.status(identifier)
+
+        except KeyError:
+            print(sys.exc_info()[1])
+            return 1
+
+        print(status or 'OK')
+        return 2 if status else 0
+
+    print('Unknown headless command : %s' % command)
+    return 1
@@ -0,0 +1,377 @@
+"""
+This module allows the panel to run its plugins in a separate plugin host
+process rather than within the ui process.
+
+The host imports all the plugins once and serves status, run and actions
+requests over a local connection. This keeps plugin code from competing with
+the ui for the GIL, and means a misbehaving plugin cannot take down the
+application hosting the panel.
+
+The HostedFactory exposes the same interface the panel uses from the
+launchpad factory, so it can be used as a drop in replacement.
+"""
+import os
+import sys
+import uuid
+import time
+import binascii
+import collections
+import tempfile
+import threading
+import subprocess
+import multiprocessing.connection
+
+import launchpad
+
+from . import utils
+
+
+# ------------------------------------------------------------------------------
+class PluginHostError(Exception):
+    """
+    Raised when the plugin host fails to resolve a request
+    """
+
+
+# ------------------------------------------------------------------------------
+class PluginHost(object):
+    """
+    Starts and talks to the plugin host process. A pool of connections is
+    kept open so requests from multiple threads can be served at once
+    without paying for a new connection each time.
+    """
+
+    # -- This is how long we wait for the host to import all the
+    # -- plugins and begin listening
+    STARTUP_TIMEOUT = 60
+
+    # --------------------------------------------------------------------------
+    def __init__(self, plugin_locations=None, workers=4):
+        self.plugin_locations = list(plugin_locations or list())
+        self.workers = workers
+
+        # -- Any files registered directly with the host, which have to
+        # -- be registered again should the host ever be restarted
+        self.registered_files = list()
+
+        self._process = None
+        self._address = None
+        self._authkey = None
+
+        # -- Idle connections are held here ready to be used. The lock is
+        # -- also held whilst the host is (re)started, so it is re-entrant
+        self._connections = list()
+        self._lock = threading.RLock()
+
+    # --------------------------------------------------------------------------
+    def start(self):
+        """
+        Starts the host process and waits for it to be ready
+        """
+        with self._lock:
+            self._start()
+
+    # --------------------------------------------------------------------------
+    def _start(self):
+        # -- Each host gets its own address and key, so no other process
+        # -- can talk to it
+        name = 'launchpanel-%s' % uuid.uuid4().hex
+
+        if sys.platform == 'win32':
+            self._address = r'\\.\pipe\%s' % name
+
+        else:
+            self._address = os.path.join(tempfile.gettempdir(), '%s.sock' % name)
+
+        self._authkey = os.urandom(16)
+
+        # -- We keep the stdin of the host open for as long as we're alive,
+        # -- as the host uses that to know when to exit
+        self._process = subprocess.Popen(
+            [
+                utils.python_executable(),
+                os.path.join(os.path.dirname(__file__), '_plugin_host.py'),
+                self._address,
+                binascii.hexlify(self._authkey).decode(),
+            ] + self.plugin_locations,
+            stdin=subprocess.PIPE,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        )
+
+        # -- Warm up our connections, the first of which will only succeed
+        # -- once the host is ready
+        connection = self._connect(timeout=self.STARTUP_TIMEOUT)
+        self._connections = [connection]
+
+        for _ in range(self.workers - 1):
+            self._connections.append(self._connect())
+
+        # -- The host only knows about the plugin locations it was started
+        # -- with, so anything registered since has to be registered again
+        for filepath in self.registered_files:
+            self._request('register_file', dict(filepath=filepath))
+
+    # --------------------------------------------------------------------------
+    def stop(self):
+        """
+        Closes all connections and stops the host process
+        """
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+
+            self._connections = list()
+
+        if self._process and self._process.poll() is None:
+            self._process.stdin.close()
+            self._process.wait()
+
+        self._process = None
+
+    # --------------------------------------------------------------------------
+    def isRunning(self):
+        return self._process is not None and self._process.poll() is None
+
+    # --------------------------------------------------------------------------
+    def request(self, command, **kwargs):
+        """
+        Sends a request to the host and waits for the result. This is safe
+        to call from any thread. If the host has died it is restarted and
+        the request is tried again.
+
+        :param command: Name of the command to run in the host
+        :param kwargs: Arguments for the command
+
+        :return: The result of the command
+        """
+        with self._lock:
+            if not self.isRunning():
+                self.stop()
+                self.start()
+
+            process = self._process
+
+        try:
+            success, result = self._request(command, kwargs)
+
+        except (EOFError, IOError, OSError):
+            with self._lock:
+                # -- If the host is still running then the failure was not
+                # -- down to the host going away. If another thread has
+                # -- already restarted it then we just try again.
+                if self._process is process:
+                    if self.isRunning():
+                        raise
+
+                    self.stop()
+                    self.start()
+
+            success, result = self._request(command, kwargs)
+
+        if not success:
+            raise PluginHostError(result)
+
+        return result
+
+    # --------------------------------------------------------------------------
+    def _request(self, command, kwargs):
+        with self._lock:
+            connection = self._connections.pop() if self._connections else None
+
+        if connection is None:
+            connection = self._connect()
+
+        connection.send((command, kwargs))
+        response = connection.recv()
+
+        with self._lock:
+            self._connections.append(connection)
+
+        return response
+
+    # --------------------------------------------------------------------------
+    def _connect(self, timeout=5):
+        """
+        Opens a new connection to the host, retrying until the given
+        timeout is reached.
+        """
+        start_time = time.time()
+
+        while True:
+            try:
+                return multiprocessing.connection.Client(
+                    self._address,
+                    authkey=self._authkey,
+                )
+
+            except (IOError, OSError):
+                if not self.isRunning() or time.time() - start_time > timeout:
+                    raise PluginHostError('Could not connect to the plugin host')
+
+                time.sleep(0.05)
+
+
+# ------------------------------------------------------------------------------
+class HostedAction(object):
+    """
+    This stands in for a LaunchAction class, forwarding any calls to the
+    plugin host. The static information of the action (and its state) is
+    taken from the description provided by the host.
+    """
+
+    # -- Any run is a request to the host, so it should never block the ui
+    RUN_MODE = 'thread'
+
+    # --------------------------------------------------------------------------
+    def __init__(self, host, description):
+        self._host = host
+
+        self.Name = description['Name']
+        self.Description = description['Description']
+        self.Icon = description['Icon']
+        self.Groups = description['Groups']
+        self.Version = description['Version']
+        self.STATUS_DELAY = description['STATUS_DELAY']
+        self.RUN_CONCURRENCY = description['RUN_CONCURRENCY']
+        self.RUN_QUEUE = description['RUN_QUEUE']
+
+        self._state = launchpad.PluginStates(description['state'])
+
+    # --------------------------------------------------------------------------
+    def state(self):
+        return self._state
+
+    # --------------------------------------------------------------------------
+    def run(self):
+        return self._host.request('run', identifier=self.Name)
+
+    # --------------------------------------------------------------------------
+    def status_message(self):
+        return self._host.request('status', identifier=self.Name)
+
+    # --------------------------------------------------------------------------
+    def actions(self):
+        return self._build_menu(
+            self._host.request('actions', identifier=self.Name),
+            list(),
+        )
+
+    # --------------------------------------------------------------------------
+    def properties(self):
+        return dict()
+
+    # --------------------------------------------------------------------------
+    def _build_menu(self, menu, path):
+        """
+        Rebuilds the menu structure returned by the host, replacing each
+        entry with a callable which invokes it within the host.
+        """
+        structure = collections.OrderedDict()
+
+        for label, target in menu:
+            if isinstance(target, list):
+                structure[label] = self._build_menu(target, path + [label])
+
+            elif target:
+                structure[label] = self._invoker(path + [label])
+
+            else:
+                structure[label] = None
+
+        return structure
+
+    # --------------------------------------------------------------------------
+    def _invoker(self, path):
+        def invoke(*args, **kwargs):
+            self._host.request(
+                'invoke_action',
+                identifier=self.Name,
+                path=path,
+            )
+
+        return invoke
+
+
+# ------------------------------------------------------------------------------
+class HostedFactory(object):
+    """
+    This exposes the parts of the launchpad factory interface which the panel
+    uses, but resolves them all through a plugin host.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, plugin_locations=None, workers=4):
+        self.host = PluginHost(plugin_locations=plugin_locations, workers=workers)
+        self.host.start()
+
+        self._actions = dict()
+        self.refresh()
+
+    # --------------------------------------------------------------------------
+    def refresh(self):
+        """
+        Re-reads the descriptions of all the plugins from the host
+        """
+        self._actions = dict()
+
+        for identifier, description in self.host.request('describe').items():
+            self._actions[identifier] = HostedAction(self.host, description)
+
+    # --------------------------------------------------------------------------
+    def paths(self):
+        return self.host.request('paths')
+
+    # --------------------------------------------------------------------------
+    def add_path(self, path):
+        self.host.request('add_path', path=path)
+
+        # -- This ensures the path is still searched if the host
+        # -- is restarted
+        if path not in self.host.plugin_locations:
+            self.host.plugin_locations.append(path)
+
+        self.refresh()
+
+    # --------------------------------------------------------------------------
+    def remove_path(self, path):
+        self.host.request('remove_path', path=path)
+
+        if path in self.host.plugin_locations:
+            self.host.plugin_locations.remove(path)
+
+        self.refresh()
+
+    # --------------------------------------------------------------------------
+    def register_file(self, filepath):
+        """
+        Registers the plugins in the given file within the host, without
+        the host searching any of its paths.
+
+        :return: The identifiers of the plugins which were registered
+        """
+        identifiers = self.host.request('register_file', filepath=filepath)
+
+        # -- This ensures the file is registered again if the host
+        # -- is restarted
+        if filepath not in self.host.registered_files:
+            self.host.registered_files.append(filepath)
+
+        self.refresh()
+
+        return identifiers
+
+    # --------------------------------------------------------------------------
+    def identifiers(self, show_beta=False):
+        return self.host.request('identifiers', show_beta=show_beta)
+
+    # --------------------------------------------------------------------------
+    def grouped_identifiers(self, show_beta=False):
+        return self.host.request('grouped_identifiers', show_beta=show_beta)
+
+    # --------------------------------------------------------------------------
+    def plugins(self):
+        return list(self._actions.values())
+
+    # --------------------------------------------------------------------------
+    def request(self, identifier):
+        return self._actions.get(identifier)
@@ -0,0 +1,284 @@
+"""
+This module holds the image processing used to build the action icons.
+
+Everything in here operates on QImage's rather than QPixmap's, which means
+it is safe to run outside of the ui thread. The resulting images are handed
+back to the ui thread where they are converted to pixmaps.
+"""
+import os
+import threading
+import collections
+
+from Qt import QtCore, QtGui
+
+from . import tracing
+
+
+# -- This is the result of an icon build. The images are always QImage's, and
+# -- the highlight is either a QColor or None if it could not be resolved
+IconImages = collections.namedtuple(
+    'IconImages',
+    [
+        'source',
+        'colour',
+        'grayscale',
+        'highlight',
+        'size',
+    ],
+)
+
+# -- We use our own pool rather than the global instance so we never
+# -- compete with any threads the host application may be running
+_POOL = None
+
+# -- Jobs which are cancelled whilst queued or running are held here until
+# -- they finish, as they cannot be released whilst the pool is using them
+_CANCELLED = set()
+_CANCELLED_LOCK = threading.Lock()
+
+
+# ------------------------------------------------------------------------------
+def pool():
+    """
+    Returns the thread pool used to process icon images.
+
+    :return: QtCore.QThreadPool
+    """
+    global _POOL
+
+    if _POOL is None:
+        _POOL = QtCore.QThreadPool()
+
+    return _POOL
+
+
+# ------------------------------------------------------------------------------
+def load(path, fallback=None):
+    """
+    Decodes the image at the given path. If the path does not exist or
+    cannot be decoded then the fallback path is decoded instead.
+
+    :param path: Absolute path to the image
+    :param fallback: Optional absolute path to use if the path is not valid
+
+    :return: QtGui.QImage
+    """
+    if path and os.path.exists(path):
+        image = QtGui.QImage(path)
+
+        if not image.isNull():
+            return image
+
+    if fallback:
+        return QtGui.QImage(fallback)
+
+    return QtGui.QImage()
+
+
+# ------------------------------------------------------------------------------
+def scaled(image, size, smooth=True):
+    """
+    Returns a square scaled copy of the given image.
+
+    :param image: QImage to scale
+    :param size: Edge length in pixels
+    :param smooth: If True a smooth transformation is used, otherwise the
+        fast transformation is used.
+
+    :return: QtGui.QImage
+    """
+    return image.scaled(
+        size,
+        size,
+        QtCore.Qt.IgnoreAspectRatio,
+        QtCore.Qt.SmoothTransformation if smooth else QtCore.Qt.FastTransformation,
+    )
+
+
+# ------------------------------------------------------------------------------
+def grayscaled(image):
+    """
+    Creates a grayscale version of the given image whilst retaining the
+    alpha channel of the original.
+
+    :param image: QImage to convert
+
+    :return: QtGui.QImage
+    """
+    # -- Let Qt do the colour conversion, which is far quicker than
+    # -- cycling the pixels ourselves
+    gray = image.convertToFormat(QtGui.QImage.Format_Grayscale8)
+    gray = gray.convertToFormat(QtGui.QImage.Format_ARGB32_Premultiplied)
+
+    # -- The grayscale format has no alpha, so we stamp the alpha of the
+    # -- original image back over the top
+    painter = QtGui.QPainter(gray)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, image)
+    painter.end()
+
+    return gray
+
+
+# ------------------------------------------------------------------------------
+def highlight(image):
+    """
+    Inspects the general colour of the given image for use as a
+    highlighting colour.
+
+    :param image: QImage to inspect
+
+    :return: QtGui.QColor or None if the image holds no pixels
+    """
+    r, g, b = [], [], []
+
+    # -- Cycle the pixels and pull out the colour
+    for x in range(0, int(image.width() * 0.1)):
+        for y in range(0, int(image.height() * 0.1)):
+            colors = QtGui.QColor(image.pixel(x * 10, y * 10)).getRgbF()
+
+            r.append(colors[0])
+            g.append(colors[1])
+            b.append(colors[2])
+
+    if not r:
+        return None
+
+    return QtGui.QColor(
+        int((sum(r) / len(r)) * 255),
+        int((sum(g) / len(g)) * 255),
+        int((sum(b) / len(b)) * 255),
+        100,
+    )
+
+
+# ------------------------------------------------------------------------------
+def device_pixel_ratio(device):
+    """
+    Returns the ratio of physical to logical pixels of the given widget
+    or screen.
+
+    :return: float
+    """
+    if hasattr(device, 'devicePixelRatioF'):
+        return float(device.devicePixelRatioF())
+
+    return float(device.devicePixelRatio())
+
+
+# ------------------------------------------------------------------------------
+def physical(size, ratio):
+    """
+    Returns the edge length in physical pixels of a logical size
+
+    :return: int
+    """
+    return int(round(size * ratio))
+
+
+# ------------------------------------------------------------------------------
+def to_pixmap(image, ratio):
+    """
+    Converts an image built at physical resolution into a pixmap which
+    is drawn at its logical size. This must be called in the ui thread.
+
+    :return: QtGui.QPixmap
+    """
+    pixmap = QtGui.QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(ratio)
+
+    return pixmap
+
+
+# ------------------------------------------------------------------------------
+def build(source, size):
+    """
+    Builds all the images required to draw an icon at the given size.
+
+    :param source: The unscaled QImage of the icon
+    :param size: Edge length in pixels
+
+    :return: IconImages
+    """
+    colour = scaled(source, size)
+
+    return IconImages(
+        source=source,
+        colour=colour,
+        grayscale=grayscaled(colour),
+        highlight=highlight(source),
+        size=size,
+    )
+
+
+# ------------------------------------------------------------------------------
+# noinspection PyUnresolvedReferences
+class IconJobSignals(QtCore.QObject):
+    """
+    QRunnable's cannot emit signals, so this carries them on the jobs
+    behalf.
+    """
+    completed = QtCore.Signal(object)
+
+
+# ------------------------------------------------------------------------------
+class IconJob(QtCore.QRunnable):
+    """
+    Builds the icon images for a given source in a worker thread. The source
+    can either be an already decoded QImage or a path to decode. The
+    completed signal is emitted with the resulting IconImages.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, source, size, fallback=None):
+        super(IconJob, self).__init__()
+        self.source = source
+        self.size = size
+        self.fallback = fallback
+        self.signals = IconJobSignals()
+        self.cancelled = False
+        self.finished = False
+
+        # -- The lifetime of the job is owned by whoever requested it
+        self.setAutoDelete(False)
+
+    # --------------------------------------------------------------------------
+    def cancel(self):
+        """
+        Stops the completed signal from being emitted. The requester can
+        release the job straight away, as it is held onto until the pool
+        has finished with it.
+        """
+        self.cancelled = True
+
+        try:
+            self.signals.completed.disconnect()
+
+        except (RuntimeError, TypeError):
+            pass
+
+        with _CANCELLED_LOCK:
+            if not self.finished:
+                _CANCELLED.add(self)
+
+    # --------------------------------------------------------------------------
+    def run(self):
+        try:
+            if self.cancelled:
+                return
+
+            source = self.source
+
+            with tracing.span('decode icon', 'icons', size=self.size):
+                if not isinstance(source, QtGui.QImage):
+                    source = load(source, self.fallback)
+
+                images = build(source, self.size)
+
+            if not self.cancelled:
+                self.signals.completed.emit(images)
+
+        finally:
+            with _CANCELLED_LOCK:
+                self.finished = True
+                _CANCELLED.discard(self)
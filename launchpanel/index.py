@@ -0,0 +1,149 @@
+"""
+The discovery index records which file and class each action lives in. This
+allows an individual action to be imported on its own, rather than having to
+search and import every file in every plugin location.
+
+The index is stored alongside the environment settings and is only ever used
+whilst the files in the plugin locations are unchanged since it was built.
+"""
+import os
+import re
+import inspect
+import scribble
+import launchpad
+
+from . import utils
+
+
+# -- This matches the files the factory considers when searching
+# -- for plugins
+_PY_CHECK = re.compile(r'([a-zA-Z].*)(\.py$)')
+
+
+# ------------------------------------------------------------------------------
+def _identifier(environment_id):
+    return '%s_index' % environment_id
+
+
+# ------------------------------------------------------------------------------
+def _requested(plugin_locations):
+    """
+    Returns the description of the locations being requested. If this
+    differs from when the index was built then the index is not valid.
+    """
+    return [
+        sorted(set(plugin_locations or list())),
+        os.environ.get(launchpad.LAUNCHPAD_PLUGIN_ENVVAR, ''),
+    ]
+
+
+# ------------------------------------------------------------------------------
+def _files(paths):
+    """
+    Returns a dictionary of every plugin file within the given paths, along
+    with its modification time and size.
+    """
+    files = dict()
+
+    for path in paths:
+        for root, _, filenames in os.walk(path):
+            for filename in filenames:
+
+                if not _PY_CHECK.match(filename):
+                    continue
+
+                filepath = os.path.join(root, filename).replace('\\', '/')
+                stat = os.stat(filepath)
+                files[filepath] = [stat.st_mtime, stat.st_size]
+
+    return files
+
+
+# ------------------------------------------------------------------------------
+def build(factory, environment_id, plugin_locations=None):
+    """
+    Builds and stores the index from a factory which has already searched
+    all its paths.
+
+    :param factory: The launchpad factory
+    :param environment_id: The environment the index is for
+    :param plugin_locations: The locations which were given to the factory
+
+    :return: The index data
+    """
+    plugins = dict()
+
+    # -- There may be multiple versions of a plugin, so we always
+    # -- record the one the factory would give us
+    for identifier in set(plugin.Name for plugin in factory.plugins()):
+        plugin = factory.request(identifier)
+
+        try:
+            filepath = inspect.getfile(plugin)
+
+        except TypeError:
+            continue
+
+        plugins[identifier] = dict(
+            file=filepath.replace('\\', '/'),
+            cls=plugin.__name__,
+            description=plugin.Description,
+            groups=list(plugin.Groups or list()),
+            state=plugin.state().value,
+        )
+
+    index = scribble.get(_identifier(environment_id))
+    index.clear()
+    index['requested'] = _requested(plugin_locations)
+    index['paths'] = factory.paths()
+    index['files'] = _files(factory.paths())
+    index['plugins'] = plugins
+    index.save()
+
+    return index
+
+
+# ------------------------------------------------------------------------------
+def get(environment_id, plugin_locations=None):
+    """
+    Returns the stored index for the environment, providing it is still
+    valid for the given plugin locations.
+
+    :param environment_id: The environment the index is for
+    :param plugin_locations: The locations which are being requested
+
+    :return: The index data or None if there is no valid index
+    """
+    index = scribble.get(_identifier(environment_id))
+
+    if not index.get('plugins'):
+        return None
+
+    if index.get('requested') != _requested(plugin_locations):
+        return None
+
+    # -- Any added, removed or changed file means a full search is
+    # -- required, as we cannot know what plugins it holds
+    if index.get('files') != _files(index.get('paths', list())):
+        return None
+
+    return index
+
+
+# ------------------------------------------------------------------------------
+def load(index, identifier):
+    """
+    Imports only the file holding the given plugin and returns the plugin.
+
+    :param index: The index data
+    :param identifier: The identifier of the plugin
+
+    :return: The plugin class, or None if it is not in the index
+    """
+    entry = index['plugins'].get(identifier)
+
+    if not entry:
+        return None
+
+    module = utils.load_module(entry['file'])
+    return getattr(module, entry['cls'], None)
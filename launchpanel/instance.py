@@ -0,0 +1,127 @@
+"""
+This module allows the panel to run as a single instance. The first
+invocation listens on a local socket, and any later invocation forwards its
+arguments to it rather than starting up a panel of its own.
+
+The forwarding side only uses the standard library, so a second invocation
+never has to pay for importing Qt.
+"""
+import os
+import sys
+import json
+import socket
+import getpass
+import tempfile
+import functools
+
+
+# ------------------------------------------------------------------------------
+def address():
+    """
+    Returns the address the single instance listens on. This is unique
+    per user, so multiple users on one machine do not collide.
+
+    :return: str
+    """
+    name = 'launchpanel-%s' % getpass.getuser()
+
+    # -- On windows a QLocalServer name resolves to a named pipe, whereas
+    # -- elsewhere we give it the full path of the socket file
+    if sys.platform == 'win32':
+        return name
+
+    return os.path.join(tempfile.gettempdir(), '%s.sock' % name)
+
+
+# ------------------------------------------------------------------------------
+def forward(argv):
+    """
+    Attempts to send the given arguments to the running instance.
+
+    :param argv: List of arguments, in the same format as sys.argv[1:]
+
+    :return: True if there is a running instance which received the
+        arguments, otherwise False
+    """
+    message = (json.dumps(list(argv)) + '\n').encode('utf-8')
+
+    try:
+        if sys.platform == 'win32':
+            with open(r'\\.\pipe\%s' % address(), 'r+b', buffering=0) as pipe:
+                pipe.write(message)
+
+        else:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+            try:
+                client.connect(address())
+                client.sendall(message)
+
+            finally:
+                client.close()
+
+    except (IOError, OSError):
+        return False
+
+    return True
+
+
+# ------------------------------------------------------------------------------
+def listen(callback):
+    """
+    Starts listening for forwarded arguments. This should only be called
+    once forward has failed, as any stale server at the address is removed.
+
+    :param callback: Function to call with the list of forwarded arguments.
+        This is always called from within the ui thread.
+
+    :return: QtNetwork.QLocalServer
+    """
+    from Qt import QtNetwork
+
+    server = QtNetwork.QLocalServer()
+    server.setSocketOptions(QtNetwork.QLocalServer.UserAccessOption)
+
+    # -- Clear up after any instance which did not exit cleanly
+    QtNetwork.QLocalServer.removeServer(address())
+    server.listen(address())
+
+    server.newConnection.connect(
+        functools.partial(_accept, server, callback),
+    )
+
+    return server
+
+
+# ------------------------------------------------------------------------------
+def _accept(server, callback):
+    """
+    Reads the arguments from any pending connections
+    """
+    while server.hasPendingConnections():
+        connection = server.nextPendingConnection()
+        connection.readyRead.connect(
+            functools.partial(_read, connection, callback),
+        )
+        connection.disconnected.connect(connection.deleteLater)
+
+
+# ------------------------------------------------------------------------------
+def _read(connection, callback):
+    """
+    Once a full message has arrived on the connection its arguments are
+    passed to the callback
+    """
+    if not connection.canReadLine():
+        return
+
+    message = bytes(connection.readLine()).decode('utf-8')
+    connection.disconnectFromServer()
+
+    try:
+        argv = json.loads(message)
+
+    except ValueError:
+        return
+
+    callback(argv)
@@ -0,0 +1,284 @@
+"""
+The mirror keeps a local copy of plugin locations which live on network
+shares. When it is in use the panel only ever reads plugins (and their
+icons) from the local copy, meaning a slow share never blocks the ui.
+
+Each location is copied into its own directory within the mirror root,
+alongside a manifest recording the modification time and size of every
+file. Syncing compares the manifest against the location and only copies
+the files which have changed. Syncing is carried out in a background thread
+whenever the panel asks for it, and the panel is told whether anything
+changed so it can refresh. Until a location has been synced for the first
+time it is read from directly.
+
+The mirror root can be set using the LAUNCHPANEL_MIRROR_DIR environment
+variable.
+
+This module only uses the standard library, so it is safe to use
+without Qt.
+"""
+import os
+import json
+import shutil
+import getpass
+import hashlib
+import tempfile
+import threading
+
+
+# -- This environment variable can be used to define where the
+# -- mirrored locations are stored
+MIRROR_ENVVAR = 'LAUNCHPANEL_MIRROR_DIR'
+
+# -- This is the file within each mirrored location which records
+# -- the state of the files when they were copied
+MANIFEST_FILE = '.launchpanel_manifest.json'
+
+# -- These are never copied, as they are specific to the machine
+# -- which generated them
+_IGNORED_DIRECTORIES = ['__pycache__']
+_IGNORED_EXTENSIONS = ['.pyc', '.pyo']
+
+
+# ------------------------------------------------------------------------------
+def root():
+    """
+    Returns the directory all the mirrored locations are stored within
+
+    :return: str
+    """
+    return os.environ.get(
+        MIRROR_ENVVAR,
+        os.path.join(
+            tempfile.gettempdir(),
+            'launchpanel-mirror-%s' % getpass.getuser(),
+        ),
+    ).replace('\\', '/')
+
+
+# ------------------------------------------------------------------------------
+def manifest(directory):
+    """
+    Returns a dictionary of every file within the given directory (keyed
+    by its path relative to the directory) along with its modification
+    time and size.
+
+    :param directory: Directory to describe
+
+    :return: dict
+    """
+    files = dict()
+
+    for current, directories, filenames in os.walk(directory):
+
+        directories[:] = [
+            name
+            for name in directories
+            if name not in _IGNORED_DIRECTORIES
+        ]
+
+        for filename in filenames:
+
+            if os.path.splitext(filename)[-1] in _IGNORED_EXTENSIONS:
+                continue
+
+            if filename == MANIFEST_FILE:
+                continue
+
+            filepath = os.path.join(current, filename)
+            stat = os.stat(filepath)
+
+            relative_path = os.path.relpath(filepath, directory).replace('\\', '/')
+            files[relative_path] = [stat.st_mtime, stat.st_size]
+
+    return files
+
+
+# ------------------------------------------------------------------------------
+class Mirror(object):
+    """
+    Maps plugin locations to their local copies, and keeps those
+    copies in sync.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, directory=None):
+        self.directory = directory or root()
+
+        # -- We track which local copy belongs to which location so
+        # -- we can always give back the location the user knows. This is
+        # -- written to from the sync thread, so it has its own lock.
+        self._remotes = dict()
+        self._remotes_lock = threading.Lock()
+
+        self._lock = threading.Lock()
+        self._thread = None
+
+    # --------------------------------------------------------------------------
+    def local(self, location):
+        """
+        Returns the path of the local copy of the given location. This is
+        regardless of whether it has been synced yet.
+
+        :return: str
+        """
+        location = location.replace('\\', '/').rstrip('/')
+
+        name = '%s_%s' % (
+            os.path.basename(location) or 'root',
+            hashlib.sha1(location.encode('utf-8')).hexdigest()[:12],
+        )
+
+        local_path = '/'.join([self.directory, name])
+
+        with self._remotes_lock:
+            self._remotes[local_path] = location
+
+        return local_path
+
+    # --------------------------------------------------------------------------
+    def remote(self, path):
+        """
+        Returns the location the given local copy was taken from. Any path
+        which is not a local copy is returned unchanged.
+
+        :return: str
+        """
+        with self._remotes_lock:
+            return self._remotes.get(path.replace('\\', '/').rstrip('/'), path)
+
+    # --------------------------------------------------------------------------
+    def localise(self, locations):
+        """
+        Returns the local copies of all the given locations. Any location
+        which has never been synced is returned as it is, as syncing it
+        here would block until the whole location was copied. Once it has
+        been synced in the background its local copy is returned instead.
+
+        :param locations: List of plugin locations
+
+        :return: list(str)
+        """
+        return [
+            self.local(location) if self.synced(location) else location
+            for location in locations
+        ]
+
+    # --------------------------------------------------------------------------
+    def synced(self, location):
+        """
+        Returns True if the given location has a local copy
+
+        :return: bool
+        """
+        return os.path.exists(os.path.join(self.local(location), MANIFEST_FILE))
+
+    # --------------------------------------------------------------------------
+    def sync(self, location):
+        """
+        Brings the local copy of the given location up to date. If the
+        location cannot be reached the local copy is left untouched.
+
+        :param location: The plugin location to sync
+
+        :return: True if anything in the local copy was changed
+        """
+        local_path = self.local(location)
+        manifest_path = os.path.join(local_path, MANIFEST_FILE)
+
+        if not os.path.isdir(location):
+            return False
+
+        with self._lock:
+            try:
+                with open(manifest_path, 'r') as f:
+                    stored = json.load(f)
+
+            except (IOError, OSError, ValueError):
+                stored = dict()
+
+            current = manifest(location)
+
+            # -- A location with nothing in it still needs its manifest
+            # -- writing, as that marks it as synced
+            if current == stored and os.path.exists(manifest_path):
+                return False
+
+            if not os.path.exists(local_path):
+                os.makedirs(local_path)
+
+            # -- Copy anything which is new or has changed
+            for relative_path, signature in current.items():
+
+                if stored.get(relative_path) == signature:
+                    continue
+
+                target = os.path.join(local_path, relative_path)
+
+                if not os.path.exists(os.path.dirname(target)):
+                    os.makedirs(os.path.dirname(target))
+
+                # -- Copy to a temporary file first, so the file is never
+                # -- seen half written
+                temp_target = target + '.partial'
+                shutil.copy2(os.path.join(location, relative_path), temp_target)
+
+                if os.path.exists(target):
+                    os.remove(target)
+
+                os.rename(temp_target, target)
+
+            # -- Remove anything which no longer exists
+            for relative_path in set(stored) - set(current):
+                target = os.path.join(local_path, relative_path)
+
+                if os.path.exists(target):
+                    os.remove(target)
+
+            with open(manifest_path, 'w') as f:
+                json.dump(current, f)
+
+        return True
+
+    # --------------------------------------------------------------------------
+    def sync_in_background(self, locations, callback=None):
+        """
+        Syncs all the given locations in a background thread. If a sync is
+        already in progress this does nothing.
+
+        :param locations: List of plugin locations to sync
+        :param callback: Optional function to call once the sync is complete.
+            It is given True if anything changed. Note that this is called
+            from within the background thread.
+
+        :return: True if a sync was started
+        """
+        if self.is_syncing():
+            return False
+
+        self._thread = threading.Thread(
+            target=self._sync_all,
+            args=(list(locations), callback),
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+        return True
+
+    # --------------------------------------------------------------------------
+    def is_syncing(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    # --------------------------------------------------------------------------
+    def _sync_all(self, locations, callback):
+        changed = False
+
+        for location in locations:
+            try:
+                changed = self.sync(location) or changed
+
+            except (IOError, OSError):
+                print('Failed to sync %s to the mirror' % location)
+
+        if callback:
+            callback(changed)
@@ -1,4 +1,13 @@
 import os
+import importlib
+
+# -- These describe the precompiled bundle (see the bundle module)
+BUNDLE_PREFIX = 'launchpanel'
+BUNDLE_FILE = 'resources.rcc'
+
+# -- We only ever attempt to load the bundle once, this stores
+# -- the bundle description if it was loaded
+_BUNDLE = dict()
 
 
 def location():
@@ -9,10 +18,51 @@ def location():
     )
 
 
-def get(name):
+def compiled_location():
+
+    return os.path.join(
+        os.path.dirname(__file__),
+        '_compiled',
+    )
+
+
+def bundle():
+    """
+    Returns the description of the precompiled bundle, registering its
+    resources with Qt the first time this is called. If there is no bundle,
+    or it was built against a different Qt binding, None is returned.
+
+    :return: module or None
+    """
+    if 'bundle' in _BUNDLE:
+        return _BUNDLE['bundle']
+
+    _BUNDLE['bundle'] = None
+
+    try:
+        compiled = importlib.import_module('.'.join([__package__, '_compiled']))
+
+    except ImportError:
+        return None
+
+    import Qt
+    from Qt import QtCore
+
+    if compiled.BINDING != Qt.__binding__:
+        return None
+
+    if not QtCore.QResource.registerResource(os.path.join(compiled_location(), BUNDLE_FILE)):
+        return None
+
+    _BUNDLE['bundle'] = compiled
+    return compiled
+
+
+def get_file(name):
     """
     This is a convinience function to get files from the resources directory
-    and correct handle the slashing.
+    and correct handle the slashing. This always returns the path on disk,
+    regardless of whether the bundle is available.
 
     :param name: Name of file to pull from the resource directory
 
@@ -25,8 +75,91 @@ def get(name):
     ).replace('\\', '/')
 
 
+def get(name):
+    """
+    This is a convinience function to get files from the resources directory
+    and correct handle the slashing. If the precompiled bundle is available
+    the Qt resource path is returned instead, so this should only be given
+    to Qt.
+
+    :param name: Name of file to pull from the resource directory
+
+    :return: Absolute path to the resource requested.
+    """
+    if bundle():
+        return ':/%s/%s' % (BUNDLE_PREFIX, name)
+
+    return get_file(name)
+
+
 def all():
+    compiled = bundle()
+
+    if compiled:
+        return [get(name) for name in compiled.RESOURCES]
+
     files = list()
     for filename in os.listdir(location()):
         files.append(os.path.join(location(), filename).replace('\\', '/'))
-    return files
\ No newline at end of file
+    return files
+
+
+def read(name):
+    """
+    Returns the text content of the given resource, reading it from the
+    bundle if it is available.
+
+    :param name: Name of file to pull from the resource directory
+
+    :return: str
+    """
+    if bundle():
+        from Qt import QtCore
+
+        resource = QtCore.QFile(get(name))
+        resource.open(QtCore.QIODevice.ReadOnly | QtCore.QIODevice.Text)
+        content = bytes(resource.readAll()).decode('utf-8')
+        resource.close()
+
+        return content
+
+    with open(get_file(name), 'r') as f:
+        return f.read()
+
+
+def load_ui(name, parent=None):
+    """
+    Creates the widget described by the given designer file. If the bundle
+    is available the pre-generated class is used, otherwise the .ui file
+    is loaded at runtime.
+
+    In both cases the child widgets are accessible as attributes of the
+    returned widget.
+
+    :param name: Name of the .ui file in the resource directory
+    :param parent: Optional parent widget
+
+    :return: QtWidgets.QWidget
+    """
+    import qtility
+    from Qt import QtWidgets
+
+    compiled = bundle()
+
+    if not compiled or name not in compiled.UI_CLASSES:
+        return qtility.designer.load(get(name), parent)
+
+    module_name, class_name, base_class = compiled.UI_CLASSES[name]
+    module = importlib.import_module('.'.join([compiled.__name__, module_name]))
+
+    widget = getattr(QtWidgets, base_class)(parent)
+    form = getattr(module, class_name)()
+    form.setupUi(widget)
+
+    # -- Mirror the designer loader by exposing the children directly
+    # -- on the widget
+    for attribute, value in vars(form).items():
+        if not hasattr(widget, attribute):
+            setattr(widget, attribute, value)
+
+    return widget
@@ -1,3 +1,4 @@
+import sys
 
 
 # ------------------------------------------------------------------------------
@@ -6,6 +7,26 @@ if __name__ == '__main__':
 
     args, kwargs = launchpanel.utils.format_sys_argv()
 
+    # -- In headless mode we never construct the ui, we simply carry
+    # -- out the requested command and exit
+    if kwargs.get('headless'):
+        from launchpanel import headless
+        sys.exit(headless.main(args, kwargs))
+
+    # -- In single instance mode we first try to hand our arguments to
+    # -- a panel which is already running
+    if kwargs.pop('single_instance', False):
+        from launchpanel import instance
+
+        if instance.forward(sys.argv[1:]):
+            sys.exit(0)
+
+        launchpanel.launch_single_instance(
+            *args,
+            **kwargs
+        )
+        sys.exit(0)
+
     # -- Launch the panel window with the given arguments
     launchpanel.launch(
         *args,
@@ -0,0 +1,780 @@
+"""
+This module is responsible for getting the status messages of plugins.
+
+By default each plugin is asked for its status through its status_message
+method. Where many plugins query the same backend this means one request
+per plugin, so plugins can instead define the following class attribute:
+
+    * STATUS_PROVIDER : A callable which is given a list of plugins and
+        returns a dictionary of their status messages, keyed by the plugin
+        Name. Any plugin which is missing from the dictionary is considered
+        to have nothing to report.
+
+All the plugins sharing the same provider are asked for in a single call.
+As the provider is accessed through the plugin class it should be a plain
+function, a staticmethod or a callable object.
+
+The last known status of every action is also recorded in a history for
+each environment, so a panel can show it straight away at startup whilst
+the actual checks run in the background.
+
+When the panel is open in several applications at once they share their
+results through a status board on disk. Before a plugin is checked the
+board is consulted, and if another process has checked it recently that
+result is used. Otherwise the process claims the plugin (only one process
+can hold the claim), checks it and publishes the result for everyone else.
+Processes which fail to claim a plugin wait for the result to be published.
+The board is stored in the temp directory by default, but this can be
+changed using the LAUNCHPANEL_STATUS_BOARD environment variable.
+
+Every status check carried out in this process is measured, and the
+metrics of each plugin (how often it has been checked, how long the checks
+take and how often they fail) can be retrieved through metrics(). Plugins
+which repeatedly fail can then be throttled.
+
+This module only uses the standard library (along with launchpad and
+scribble), so it is safe to use without Qt.
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import errno
+import getpass
+import hashlib
+import inspect
+import tempfile
+import threading
+import traceback
+import scribble
+import launchpad
+import collections
+
+
+# -- This environment variable can be used to define where the
+# -- status board is stored
+BOARD_ENVVAR = 'LAUNCHPANEL_STATUS_BOARD'
+
+# -- We hold one history per environment
+_HISTORIES = dict()
+
+
+# ------------------------------------------------------------------------------
+def provider(plugin):
+    """
+    Returns the status provider of the given plugin, or None if it does
+    not have one
+    """
+    return getattr(plugin, 'STATUS_PROVIDER', None)
+
+
+# ------------------------------------------------------------------------------
+def messages(plugins, board=None, cancelled=None):
+    """
+    Returns the status messages of all the given plugins, keyed by the
+    plugin Name. Plugins sharing a provider are asked for together, and any
+    without a provider are asked individually. A plugin with nothing to
+    report (or which fails to report) has a status of None.
+
+    :param plugins: List of plugins
+    :param board: Optional status board to share the results through
+    :param cancelled: Optional function which returns True once the
+        statuses are no longer needed. This is checked whilst waiting on
+        other processes, and if it returns True we stop waiting and return
+        whatever statuses we have.
+
+    :return: dict
+    """
+    if board is None:
+        return _check(plugins)
+
+    statuses = dict()
+    pending = list(plugins)
+
+    # -- We never wait on another process for longer than it is
+    # -- allowed to hold its claim
+    give_up = time.time() + board.lease * 2
+
+    while pending:
+        claimed = list()
+        waiting = list()
+
+        for plugin in pending:
+            entry = board.read(plugin)
+
+            if entry is not None:
+                statuses[plugin.Name] = entry['message']
+
+            elif board.claim(plugin):
+                claimed.append(plugin)
+
+            else:
+                waiting.append(plugin)
+
+        if claimed:
+            try:
+                results = _check(claimed)
+
+                for plugin in claimed:
+                    board.publish(plugin, results[plugin.Name])
+
+                statuses.update(results)
+
+            finally:
+                for plugin in claimed:
+                    board.release(plugin)
+
+        if waiting and cancelled is not None and cancelled():
+            break
+
+        if waiting and time.time() > give_up:
+            statuses.update(_check(waiting))
+            break
+
+        if waiting:
+            time.sleep(board.POLL_INTERVAL)
+
+        pending = waiting
+
+    return statuses
+
+
+# ------------------------------------------------------------------------------
+def _check(plugins):
+    """
+    Carries out the status checks of the given plugins in this process,
+    recording how each one performed
+    """
+    statuses = dict()
+    providers = collections.OrderedDict()
+
+    for plugin in plugins:
+        statuses[plugin.Name] = None
+
+        started = time.time()
+        error = None
+        check = None
+
+        # -- We're running code from within a plugin, so we wrap it as we
+        # -- cannot guarantee its quality
+        try:
+            # -- skip any INVALID plugins
+            if plugin.state() == launchpad.PluginStates.INVALID:
+                continue
+
+            if provider(plugin) is not None:
+                providers.setdefault(provider(plugin), list()).append(plugin)
+                continue
+
+            check = _METRICS.begin(plugin.Name)
+            statuses[plugin.Name] = plugin.status_message() or None
+
+        except:
+            error = _describe_error()
+
+        _METRICS.record(plugin.Name, time.time() - started, error, check)
+
+    for status_provider, provided in providers.items():
+        started = time.time()
+        error = None
+        checks = [_METRICS.begin(plugin.Name) for plugin in provided]
+
+        try:
+            results = status_provider(provided) or dict()
+
+        except:
+            results = dict()
+            error = _describe_error()
+
+        # -- The plugins were checked together, so they share the time
+        # -- it took and any failure
+        latency = time.time() - started
+
+        for plugin, check in zip(provided, checks):
+            statuses[plugin.Name] = results.get(plugin.Name) or None
+            _METRICS.record(plugin.Name, latency, error, check)
+
+    return statuses
+
+
+# ------------------------------------------------------------------------------
+def _describe_error():
+    """
+    Returns a one line description of the exception currently being
+    handled. This is recorded in the metrics of the plugin, where it is
+    shown as the last error.
+    """
+    return ''.join(traceback.format_exception_only(*sys.exc_info()[:2])).strip()
+
+
+# ------------------------------------------------------------------------------
+def history(environment_id):
+    """
+    Returns the status history of the given environment.
+
+    :param environment_id: The environment to get the history for
+
+    :return: History
+    """
+    if environment_id not in _HISTORIES:
+        _HISTORIES[environment_id] = History(environment_id)
+
+    return _HISTORIES[environment_id]
+
+
+# ------------------------------------------------------------------------------
+class History(object):
+    """
+    Records the last known status of each action, along with when it was
+    checked. Recording a status does not save it, as statuses tend to arrive
+    in bursts, so save should be called once the burst is over.
+    """
+
+    # -- This is how long (in seconds) a recorded status is considered
+    # -- worth showing for
+    TTL = 60 * 60 * 24
+
+    # --------------------------------------------------------------------------
+    def __init__(self, environment_id):
+        self.environment_id = environment_id
+
+        self._data = None
+        self._dirty = False
+
+    # --------------------------------------------------------------------------
+    def data(self):
+        """
+        Returns the underlying scribble dictionary
+
+        :return: scribble.ScribbleDictionary
+        """
+        if self._data is None:
+            self._data = scribble.get('%s_status' % self.environment_id)
+
+        return self._data
+
+    # --------------------------------------------------------------------------
+    def get(self, identifier):
+        """
+        Returns the last known status of the given action, providing it was
+        checked within the TTL.
+
+        :param identifier: The identifier of the action
+
+        :return: dict with the message and time it was checked, or None if
+            there is no recent status
+        """
+        entry = self.data().get(identifier)
+
+        if not entry:
+            return None
+
+        if time.time() - entry.get('time', 0) > self.TTL:
+            return None
+
+        return entry
+
+    # --------------------------------------------------------------------------
+    def record(self, identifier, message):
+        """
+        Records the status of the given action as having just been checked
+        """
+        self.data()[identifier] = dict(
+            message=message,
+            time=time.time(),
+        )
+        self._dirty = True
+
+    # --------------------------------------------------------------------------
+    def save(self):
+        """
+        Saves the history if anything has been recorded since it was
+        last saved
+        """
+        if not self._dirty:
+            return
+
+        self.data().save()
+        self._dirty = False
+
+
+# ------------------------------------------------------------------------------
+def board_root():
+    """
+    Returns the directory the status board is stored within
+
+    :return: str
+    """
+    return os.environ.get(
+        BOARD_ENVVAR,
+        os.path.join(
+            tempfile.gettempdir(),
+            'launchpanel-status-%s' % getpass.getuser(),
+        ),
+    ).replace('\\', '/')
+
+
+# ------------------------------------------------------------------------------
+class Board(object):
+    """
+    Shares status results between all the processes on the machine. Each
+    plugin has a result file holding its last published status, and a
+    claim file which exists whilst a process is checking it. The claim file
+    is created exclusively, so only one process can ever hold it.
+    """
+
+    # -- This is how long (in seconds) a published result is used for
+    # -- before a process will check the plugin again
+    MAX_AGE = 60
+
+    # -- This is how long (in seconds) a claim is honoured for. If the
+    # -- process holding it has not published a result by then it is
+    # -- assumed to have died, and the claim is taken over
+    LEASE = 30
+
+    # -- This is how often (in seconds) waiting processes look for
+    # -- a published result
+    POLL_INTERVAL = 0.25
+
+    # --------------------------------------------------------------------------
+    def __init__(self, directory=None, max_age=None, lease=None):
+        self.directory = directory or board_root()
+        self.max_age = self.MAX_AGE if max_age is None else max_age
+        self.lease = self.LEASE if lease is None else lease
+
+        # -- Each claim we make holds a unique token, so we can tell
+        # -- whether it is still ours when we come to release it
+        self._tokens = dict()
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def key(cls, plugin):
+        """
+        Returns the key the given plugin is stored under. This includes the
+        file the plugin is defined in, as different environments may well
+        have different plugins of the same name.
+
+        :return: str
+        """
+        try:
+            filepath = inspect.getfile(plugin).replace('\\', '/')
+
+        except TypeError:
+            filepath = ''
+
+        return hashlib.sha1(
+            ('%s|%s' % (plugin.Name, filepath)).encode('utf-8'),
+        ).hexdigest()
+
+    # --------------------------------------------------------------------------
+    def _path(self, plugin, extension):
+        return '/'.join([self.directory, self.key(plugin) + extension])
+
+    # --------------------------------------------------------------------------
+    def read(self, plugin):
+        """
+        Returns the published result of the given plugin, providing it was
+        published within the max age.
+
+        :return: dict with the message and time it was checked, or None
+        """
+        try:
+            with open(self._path(plugin, '.json'), 'r') as f:
+                entry = json.load(f)
+
+        except (IOError, OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('time', 0) > self.max_age:
+            return None
+
+        return entry
+
+    # --------------------------------------------------------------------------
+    def claim(self, plugin):
+        """
+        Attempts to claim the given plugin so this process can check it.
+        If the board cannot be written to at all then the claim is always
+        given, as there is nobody to share with.
+
+        :return: True if the claim was made
+        """
+        if not os.path.exists(self.directory):
+            try:
+                os.makedirs(self.directory)
+
+            except OSError:
+                pass
+
+        claim_path = self._path(plugin, '.claim')
+        token = uuid.uuid4().hex
+
+        for _ in range(2):
+            try:
+                handle = os.open(claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+
+                try:
+                    os.write(handle, token.encode('utf-8'))
+
+                finally:
+                    os.close(handle)
+
+                self._tokens[claim_path] = token
+                return True
+
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    return True
+
+            # -- The claim is held elsewhere, so if it has been held for
+            # -- longer than the lease we take it over
+            try:
+                with open(claim_path, 'r') as f:
+                    held_token = f.read()
+                    held_since = os.fstat(f.fileno()).st_mtime
+
+            # -- If it has just been released we try to claim it again
+            except (IOError, OSError):
+                continue
+
+            if time.time() - held_since < self.lease:
+                return False
+
+            if not self._takeOver(claim_path, held_token, token):
+                return False
+
+        return False
+
+    # --------------------------------------------------------------------------
+    def _takeOver(self, claim_path, held_token, token):
+        """
+        Removes the given stale claim so it can be claimed again. Any number
+        of processes may find the same claim to be stale, so it is moved
+        aside first, as only one of them can move it. What was moved is
+        then checked to be the stale claim, as another process may have
+        taken it over in the meantime.
+
+        :param claim_path: Path of the claim file
+        :param held_token: The token of the claim which was found stale
+        :param token: Our own token, used to give the moved file a
+            unique name
+
+        :return: True if the stale claim was removed
+        """
+        stale_path = '%s.%s.stale' % (claim_path, token)
+
+        try:
+            os.rename(claim_path, stale_path)
+
+        except OSError:
+            return False
+
+        try:
+            with open(stale_path, 'r') as f:
+                if f.read() == held_token:
+                    return True
+
+            # -- We moved a new claim of another process, so we give it
+            # -- back, unless yet another process has claimed it since
+            os.link(stale_path, claim_path)
+
+        except (IOError, OSError):
+            pass
+
+        finally:
+            try:
+                os.remove(stale_path)
+
+            except OSError:
+                pass
+
+        return False
+
+    # --------------------------------------------------------------------------
+    def release(self, plugin):
+        """
+        Releases the claim on the given plugin, but only if it is still
+        ours. If we held it for longer than the lease another process may
+        have taken it over, and that claim is not ours to remove.
+        """
+        claim_path = self._path(plugin, '.claim')
+        token = self._tokens.pop(claim_path, None)
+
+        if token is None:
+            return
+
+        try:
+            with open(claim_path, 'r') as f:
+                if f.read() != token:
+                    return
+
+            os.remove(claim_path)
+
+        except (IOError, OSError):
+            pass
+
+    # --------------------------------------------------------------------------
+    def publish(self, plugin, message):
+        """
+        Publishes the status of the given plugin for all the other
+        processes to use
+        """
+        result_path = self._path(plugin, '.json')
+
+        # -- Write to a temporary file first, so the result is never
+        # -- seen half written
+        temp_path = '%s.%s.partial' % (result_path, os.getpid())
+
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(dict(message=message, time=time.time()), f)
+
+            # -- This replaces any previous result in one step, so readers
+            # -- always find a result
+            os.replace(temp_path, result_path)
+
+        # -- If the board cannot be written to the other processes simply
+        # -- carry out the check themselves
+        except (IOError, OSError):
+            try:
+                os.remove(temp_path)
+
+            except OSError:
+                pass
+
+    # --------------------------------------------------------------------------
+    def invalidate(self, plugin):
+        """
+        Removes the published result of the given plugin, meaning the next
+        request for it will check it again
+        """
+        try:
+            os.remove(self._path(plugin, '.json'))
+
+        except OSError:
+            pass
+
+
+# ------------------------------------------------------------------------------
+def metrics():
+    """
+    Returns the status check metrics of this process
+
+    :return: Metrics
+    """
+    return _METRICS
+
+
+# ------------------------------------------------------------------------------
+class Metrics(object):
+    """
+    Records how the status checks of each plugin have performed. Metrics are
+    recorded from the threads carrying out the checks, so everything given
+    out is a copy.
+    """
+
+    # -- These are the upper bounds (in seconds) of the latency histogram
+    # -- buckets. Anything slower falls into a final bucket
+    BUCKETS = [0.01, 0.05, 0.1, 0.5, 1, 5]
+
+    # -- A check which takes longer than this (in seconds) is counted as
+    # -- having timed out, see expire
+    TIMEOUT = 10
+
+    # -- A plugin which fails (or times out) this many times in a row is
+    # -- throttled, meaning it is not checked again until the throttle
+    # -- period (in seconds) has passed since its last failure
+    THROTTLE_FAILURES = 3
+    THROTTLE_PERIOD = 60 * 10
+
+    # --------------------------------------------------------------------------
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._plugins = dict()
+
+        # -- These are the checks currently being carried out, keyed by
+        # -- the token given out when each one began
+        self._running = dict()
+
+    # --------------------------------------------------------------------------
+    def _new(self, name):
+        return dict(
+            name=name,
+            calls=0,
+            errors=0,
+            timeouts=0,
+            total_time=0.0,
+            max_time=0.0,
+            histogram=[0] * (len(self.BUCKETS) + 1),
+            last_error=None,
+            failures_in_a_row=0,
+            last_failure=None,
+        )
+
+    # --------------------------------------------------------------------------
+    def begin(self, name):
+        """
+        Records that a status check of the given plugin has begun, so it can
+        be timed out whilst it is still running.
+
+        :param name: The Name of the plugin
+
+        :return: A token to pass to record once the check is complete
+        """
+        token = uuid.uuid4().hex
+
+        with self._lock:
+            self._running[token] = dict(
+                name=name,
+                started=time.time(),
+                timed_out=False,
+            )
+
+        return token
+
+    # --------------------------------------------------------------------------
+    def record(self, name, latency, error=None, check=None):
+        """
+        Records a status check of the given plugin.
+
+        :param name: The Name of the plugin
+        :param latency: How long (in seconds) the check took
+        :param error: Description of the error if the check failed
+        :param check: The token given by begin, if it was called
+        """
+        timed_out = latency > self.TIMEOUT
+
+        bucket = len(self.BUCKETS)
+
+        for idx, upper_bound in enumerate(self.BUCKETS):
+            if latency <= upper_bound:
+                bucket = idx
+                break
+
+        with self._lock:
+            entry = self._plugins.setdefault(name, self._new(name))
+            running = self._running.pop(check, None)
+
+            entry['calls'] += 1
+            entry['total_time'] += latency
+            entry['max_time'] = max(entry['max_time'], latency)
+            entry['histogram'][bucket] += 1
+
+            if error:
+                entry['errors'] += 1
+                entry['last_error'] = error
+
+            # -- A check which was timed out whilst running has already
+            # -- been counted as a failure
+            if running and running['timed_out']:
+                return
+
+            if timed_out:
+                entry['timeouts'] += 1
+
+            if error or timed_out:
+                self._fail(entry)
+
+            else:
+                entry['failures_in_a_row'] = 0
+
+    # --------------------------------------------------------------------------
+    def expire(self):
+        """
+        Counts every check which has been running for longer than the
+        timeout as having timed out, without waiting for it to complete.
+
+        :return: The Names of the plugins whose checks timed out
+        """
+        names = list()
+
+        with self._lock:
+            for running in self._running.values():
+
+                if running['timed_out'] or time.time() - running['started'] <= self.TIMEOUT:
+                    continue
+
+                running['timed_out'] = True
+
+                entry = self._plugins.setdefault(running['name'], self._new(running['name']))
+                entry['timeouts'] += 1
+                self._fail(entry)
+
+                names.append(running['name'])
+
+        return names
+
+    # --------------------------------------------------------------------------
+    def _fail(self, entry):
+        entry['failures_in_a_row'] += 1
+        entry['last_failure'] = time.time()
+
+    # --------------------------------------------------------------------------
+    def get(self, name):
+        """
+        Returns the metrics of the given plugin, along with whether it is
+        currently throttled and the mean time its checks take.
+
+        :param name: The Name of the plugin
+
+        :return: dict
+        """
+        with self._lock:
+            entry = dict(self._plugins.get(name) or self._new(name))
+            entry['histogram'] = list(entry['histogram'])
+
+        entry['mean_time'] = entry['total_time'] / entry['calls'] if entry['calls'] else 0.0
+        entry['throttled'] = self._is_throttled(entry)
+
+        return entry
+
+    # --------------------------------------------------------------------------
+    def report(self):
+        """
+        Returns the metrics of every plugin which has been checked
+
+        :return: list(dict)
+        """
+        with self._lock:
+            names = sorted(self._plugins.keys())
+
+        return [self.get(name) for name in names]
+
+    # --------------------------------------------------------------------------
+    def throttled(self, name):
+        """
+        Returns True if the given plugin has failed enough times in a row
+        that it should not be checked for now
+        """
+        with self._lock:
+            entry = self._plugins.get(name)
+
+            if not entry:
+                return False
+
+            return self._is_throttled(entry)
+
+    # --------------------------------------------------------------------------
+    def _is_throttled(self, entry):
+        if entry['failures_in_a_row'] < self.THROTTLE_FAILURES:
+            return False
+
+        return time.time() - entry['last_failure'] < self.THROTTLE_PERIOD
+
+    # --------------------------------------------------------------------------
+    def reset(self, name=None):
+        """
+        Clears the metrics of the given plugin, or of every plugin if no
+        name is given
+        """
+        with self._lock:
+            if name is None:
+                self._plugins.clear()
+
+            else:
+                self._plugins.pop(name, None)
+
+
+# -- The metrics are shared by everything in this process
+_METRICS = Metrics()
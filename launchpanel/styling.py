@@ -12,19 +12,44 @@ STYLE_DEFAULTS = {
     '_TEXT_': '255, 255, 255',
 }
 
-# -- We expose all of our resources as special variables
-for resource in resources.all():
-    key = '_%s_' % os.path.basename(resource).replace('.', '_').upper()
-    STYLE_DEFAULTS[key] = resource
+# -- The compiled stylesheets never change during a session, so we
+# -- only ever build them once
+_STYLE_CACHE = dict()
+_DEFAULTS_CACHE = dict()
 
 
-def get_style():
+def style_defaults():
+    """
+    Returns the style defaults along with all of our resources exposed as
+    special variables. The resources directory is only read when this is
+    first needed rather than when the module is imported.
+    """
+    if 'defaults' not in _DEFAULTS_CACHE:
+        defaults = STYLE_DEFAULTS.copy()
 
-    with open(resources.get("space.qss"), 'r') as f:
-        stylesheet = f.read()
+        for resource in resources.all():
+            key = '_%s_' % os.path.basename(resource).replace('.', '_').upper()
+            defaults[key] = resource
+
+        _DEFAULTS_CACHE['defaults'] = defaults
+
+    return _DEFAULTS_CACHE['defaults']
+
+
+def get_style(name='space.qss'):
+    """
+    Returns the given stylesheet with all the style variables resolved. Each
+    stylesheet is only read and resolved once, after which it is cached.
+
+    :param name: Name of the stylesheet in the resources directory
+    """
+    if name in _STYLE_CACHE:
+        return _STYLE_CACHE[name]
+
+    stylesheet = resources.read(name)
 
     # -- We need to combine the kwargs with the defaults
-    styling_parameters = STYLE_DEFAULTS.copy()
+    styling_parameters = style_defaults().copy()
 
     # -- Now that we have compounded all our style information we can cycle
     # -- over it and carry out any replacements
@@ -32,4 +57,5 @@ def get_style():
         regex = re.compile(regex)
         stylesheet = regex.sub(replacement, stylesheet)
 
+    _STYLE_CACHE[name] = stylesheet
     return stylesheet
@@ -0,0 +1,332 @@
+"""
+The tracer records what the panel spends its time doing, and writes it out
+in the Chrome trace event format. The resulting file can be opened in
+Perfetto (ui.perfetto.dev) or chrome://tracing.
+
+Tracing is off unless it is asked for, either by passing trace=<filepath>
+to run.py or by setting the LAUNCHPANEL_TRACE environment variable to the
+file to write to. Whilst it is off every call in this module returns
+straight away, so it is safe to leave the tracing calls in place.
+
+Events are written to the file as soon as they are recorded, meaning a
+trace is still readable if the panel has to be killed whilst frozen.
+
+This module only uses the standard library, so it is safe to use
+without Qt.
+"""
+import os
+import json
+import time
+import atexit
+import functools
+import threading
+
+
+# -- This environment variable can be used to turn on tracing, by
+# -- setting it to the file to write the trace to
+TRACE_ENVVAR = 'LAUNCHPANEL_TRACE'
+
+# -- The trace only needs a consistent clock, so we use the most
+# -- precise one available
+_clock = getattr(time, 'perf_counter', time.time)
+
+# -- This is the active tracer, or None if tracing is off
+_TRACER = None
+
+
+# ------------------------------------------------------------------------------
+def enable(filepath):
+    """
+    Starts writing a trace to the given file. If a trace is already being
+    written it is finished first.
+
+    :param filepath: The file to write the trace to
+    """
+    global _TRACER
+
+    disable()
+    _TRACER = _Tracer(filepath)
+
+
+# ------------------------------------------------------------------------------
+def disable():
+    """
+    Finishes the trace being written, if there is one
+    """
+    global _TRACER
+
+    if _TRACER is not None:
+        _TRACER.close()
+
+    _TRACER = None
+
+
+# ------------------------------------------------------------------------------
+def enabled():
+    return _TRACER is not None
+
+
+# ------------------------------------------------------------------------------
+def now():
+    """
+    Returns the current time in the clock used by the trace. This can be
+    used to time something which cannot be wrapped in a span, and then
+    record it using complete.
+    """
+    return _clock()
+
+
+# ------------------------------------------------------------------------------
+def span(name, category='panel', **details):
+    """
+    Returns a context manager which records the time spent within it.
+
+    :param name: Name of the span
+    :param category: Category of the span, which can be used for filtering
+        in the trace viewer
+    :param details: Any additional information to show alongside the span
+
+    :return: context manager
+    """
+    if _TRACER is None:
+        return _NULL_SPAN
+
+    return _Span(_TRACER, name, category, details)
+
+
+# ------------------------------------------------------------------------------
+def complete(name, start, end=None, category='panel', track=None, **details):
+    """
+    Records a span which has been timed elsewhere.
+
+    :param name: Name of the span
+    :param start: The time the span started, as given by now
+    :param end: The time the span ended, defaulting to now
+    :param category: Category of the span
+    :param track: Optional name of the track the span belongs to. If this
+        is not given the span is shown on the track of the current thread.
+        This should be used for anything which can overlap, such as work
+        which is queued or is carried out in another process. Spans on the
+        track of a thread have to nest, so these are recorded as async
+        spans instead, which the trace viewer lays out so they never clash.
+    :param details: Any additional information to show alongside the span
+    """
+    if _TRACER is None:
+        return
+
+    _TRACER.record(
+        name,
+        category,
+        start,
+        now() if end is None else end,
+        details,
+        track,
+    )
+
+
+# ------------------------------------------------------------------------------
+def traced(name=None, category='panel'):
+    """
+    Decorator which records a span for every call of the decorated function.
+    This should not be used on Qt slots, as the signature of the function
+    is hidden from Qt.
+
+    :param name: Name of the span, defaulting to the function name
+    :param category: Category of the span
+    """
+    def decorator(func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _TRACER is None:
+                return func(*args, **kwargs)
+
+            with span(name or func.__name__, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ------------------------------------------------------------------------------
+class _NullSpan(object):
+    """
+    Used in place of a span whilst tracing is off
+    """
+
+    # --------------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+    # --------------------------------------------------------------------------
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+# ------------------------------------------------------------------------------
+class _Span(object):
+    """
+    Records the time between entering and exiting
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, tracer, name, category, details):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.details = details
+        self.start = None
+
+    # --------------------------------------------------------------------------
+    def __enter__(self):
+        self.start = _clock()
+        return self
+
+    # --------------------------------------------------------------------------
+    def __exit__(self, *args):
+        self.tracer.record(
+            self.name,
+            self.category,
+            self.start,
+            _clock(),
+            self.details,
+        )
+        return False
+
+
+# ------------------------------------------------------------------------------
+class _Tracer(object):
+    """
+    Writes trace events to a file as they are recorded
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.pid = os.getpid()
+
+        # -- Events can be recorded from any thread
+        self._lock = threading.Lock()
+
+        # -- Each thread is named the first time it is seen
+        self._tids = dict()
+
+        # -- Every async span needs its own id to pair its start and end
+        self._async_id = 0
+
+        # -- The closing bracket is optional in the trace format, which is
+        # -- what allows an unfinished trace to be read
+        self._file = open(filepath, 'w')
+        self._file.write('[\n')
+        self._file.flush()
+        self._separator = ''
+
+    # --------------------------------------------------------------------------
+    def _write(self, event):
+        # -- Anything which is not serialisable is shown as its string
+        self._file.write(self._separator + json.dumps(event, default=str))
+        self._separator = ',\n'
+
+    # --------------------------------------------------------------------------
+    def _tid(self):
+        """
+        Returns the thread id to show events for the current thread
+        under, naming it if it is new
+        """
+        thread = threading.current_thread()
+
+        # -- Thread idents can be very large, so we number the
+        # -- threads in the order we see them
+        if thread.ident not in self._tids:
+            self._tids[thread.ident] = len(self._tids) + 1
+
+            self._write(
+                dict(
+                    name='thread_name',
+                    ph='M',
+                    pid=self.pid,
+                    tid=self._tids[thread.ident],
+                    args=dict(name=thread.name),
+                )
+            )
+
+        return self._tids[thread.ident]
+
+    # --------------------------------------------------------------------------
+    def record(self, name, category, start, end, details, track=None):
+        with self._lock:
+            if self._file is None:
+                return
+
+            if track is None:
+                self._write(
+                    dict(
+                        name=name,
+                        cat=category,
+                        ph='X',
+                        ts=start * 1000000,
+                        dur=max(0, end - start) * 1000000,
+                        pid=self.pid,
+                        tid=self._tid(),
+                        args=details,
+                    )
+                )
+
+            else:
+                # -- Spans on a track can overlap, so they are written as
+                # -- a pair of async events rather than a complete event
+                self._async_id += 1
+
+                event = dict(
+                    name=name,
+                    cat=category,
+                    id=self._async_id,
+                    pid=self.pid,
+                    tid=self._tid(),
+                )
+
+                self._write(
+                    dict(
+                        event,
+                        ph='b',
+                        ts=start * 1000000,
+                        args=dict(details, track=track),
+                    )
+                )
+                self._write(
+                    dict(
+                        event,
+                        ph='e',
+                        ts=max(start, end) * 1000000,
+                    )
+                )
+
+            self._file.flush()
+
+    # --------------------------------------------------------------------------
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+
+            self._write(
+                dict(
+                    name='process_name',
+                    ph='M',
+                    pid=self.pid,
+                    args=dict(name='Launch Panel'),
+                )
+            )
+            self._file.write('\n]\n')
+            self._file.close()
+            self._file = None
+
+
+atexit.register(disable)
+
+if os.environ.get(TRACE_ENVVAR):
+    enable(os.environ[TRACE_ENVVAR])
@@ -1,7 +1,18 @@
+import os
 import sys
 
 
-def format_sys_argv():
+# -- These keyword arguments are flags, so we convert them to booleans
+BOOLEAN_ARGUMENTS = [
+    'show_beta',
+    'single_instance',
+    'use_plugin_host',
+    'use_mirror',
+    'verbose',
+]
+
+
+def format_sys_argv(argv=None):
     """
     From the system arguments, get the specific positional and keyword arguments supported for launchpanel.
 
@@ -12,17 +23,32 @@ def format_sys_argv():
     style = 'space'
     title = 'Launch Panel'
     style_overrides = None
+    use_plugin_host = None
+    use_mirror = None
+    single_instance = False
+    trace = None
     parent = None
 
+    When running headless (without any ui) the following are used instead:
+
+    headless = 'list', 'run' or 'status'
+    action = The name of the action to run or status check
+    plugin_locations = None
+    environment_id = 'launchpanel'
+    show_beta = None
+
     Arguments can be provided as positional (in order, when not provided with an "=" sign), or keyword, when
     an "=" sign is included.
 
+    :param argv: Optional list of arguments to use rather than the system arguments
+    :type argv: list
+
     :return: tuple of args, kwargs
     :rtype: (list, dict)
     """
     # -- The first argument is always the filepath being executed
     # -- by python, so ignore that.
-    all_args = sys.argv[1:]
+    all_args = sys.argv[1:] if argv is None else argv
 
     # -- Define our args and keyword arguments. We need to seperate these
     args = list()
@@ -37,6 +63,9 @@ def format_sys_argv():
                 plugin_locations = arg.split('=')[1].split(';')
                 kwargs[arg.split('=')[0]] = plugin_locations
 
+            elif arg.split('=')[0] in BOOLEAN_ARGUMENTS:
+                kwargs[arg.split('=')[0]] = arg.split('=')[1].lower() in ['1', 'true', 'yes']
+
             else:
                 kwargs[arg.split('=')[0]] = arg.split('=')[1]
 
@@ -46,3 +75,124 @@ def format_sys_argv():
             args.append(arg)
 
     return args, kwargs
+
+
+def python_executable():
+    """
+    Returns the python interpreter to use when launching python in a
+    subprocess. When hosted within an application (such as Maya or Max)
+    the sys.executable is the application itself, so in that situation we
+    look to the LAUNCHPANEL_PYTHON environment variable, and then fall back
+    to whichever python is on the path.
+
+    :return: Path or name of the python interpreter
+    :rtype: str
+    """
+    if os.environ.get('LAUNCHPANEL_PYTHON'):
+        return os.environ['LAUNCHPANEL_PYTHON']
+
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+
+    return 'python'
+
+
+def load_module(filepath):
+    """
+    Loads the python file at the given path as a module. The module is given
+    a unique name in the same way the factory does, so it cannot clash with
+    any other module.
+
+    :param filepath: Absolute path to the python file
+    :type filepath: str
+
+    :return: The loaded module
+    """
+    import uuid
+
+    module_name = os.path.splitext(os.path.basename(filepath))[0]
+    module_name += str(uuid.uuid4())
+
+    if sys.version_info[0] > 2:
+        import importlib.util
+
+        spec = importlib.util.spec_from_file_location(module_name, filepath)
+        module = importlib.util.module_from_spec(spec)
+
+        # -- The module has to be registered before it is executed, as
+        # -- anything inspecting its classes looks it up by name
+        sys.modules[module_name] = module
+
+        try:
+            spec.loader.exec_module(module)
+
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+
+        return module
+
+    # -- Python 2 has no importlib.util
+    import imp
+    return imp.load_source(module_name, filepath)
+
+
+def register_file(factory, filepath):
+    """
+    Registers any plugins within the given file with the factory. If the
+    file is within one of the factory's paths then the factory is rebuilt
+    from its paths, which replaces any plugins previously loaded from the
+    file. Otherwise the file is loaded and its plugins registered without
+    the factory needing to search any of its paths.
+
+    This only uses the standard library and launchpad, as it is also used
+    by the plugin host.
+
+    :param factory: The launchpad factory
+    :param filepath: Absolute path to the python file
+
+    :return: The identifiers of the plugins which were registered
+    :rtype: list
+    """
+    import inspect
+    import launchpad
+
+    filepath = os.path.normcase(os.path.abspath(filepath))
+
+    def loaded_from_file(plugin):
+        try:
+            source = inspect.getfile(plugin)
+
+        except TypeError:
+            return False
+
+        return os.path.normcase(os.path.abspath(source)) == filepath
+
+    # -- The factory has no way of removing a single plugin, so if it
+    # -- would find the file itself we have it search its paths again
+    if any(
+            filepath.startswith(os.path.normcase(os.path.abspath(path)) + os.sep)
+            for path in factory.paths()
+    ):
+        factory.reload()
+
+        return [
+            plugin.Name
+            for plugin in factory.plugins(True)
+            if loaded_from_file(plugin)
+        ]
+
+    module = load_module(filepath)
+    identifiers = list()
+
+    for item_name in dir(module):
+        item = getattr(module, item_name)
+
+        if not inspect.isclass(item) or item == launchpad.LaunchAction:
+            continue
+
+        if issubclass(item, launchpad.LaunchAction):
+            factory.register(item)
+            identifiers.append(item.Name)
+
+    return identifiers
@@ -0,0 +1,285 @@
+"""
+The watchdog detects when the ui thread stops responding. Plugin code such
+as running an inline action, building its context menu or querying its
+state is carried out on the ui thread, so a slow plugin makes both the panel
+and any application hosting it unresponsive.
+
+Whilst the ui thread is responsive it regularly signals the watchdog. A
+background thread looks for these signals stopping, and if they stop for
+longer than the threshold the stack of the ui thread is captured at that
+moment. Anything calling plugin code on the ui thread declares which plugin
+it is running using attribute, allowing the stall to be attributed to it.
+The stall is logged and counted from the background thread as soon as it is
+detected, so a hang which never ends still leaves a record. Once the ui
+thread recovers the length of the stall is recorded too.
+"""
+import sys
+import time
+import threading
+import traceback
+import collections
+
+from Qt import QtCore
+
+from . import tracing
+
+
+# -- This is the plugin code currently being run on the ui thread, with
+# -- the innermost call last
+_ACTIVITY = list()
+
+
+# ------------------------------------------------------------------------------
+def attribute(identifier, activity):
+    """
+    Returns a context manager which declares that the given plugin is being
+    run on the ui thread whilst within it. Any stall detected whilst within
+    it is attributed to the plugin.
+
+    :param identifier: The identifier of the plugin being run
+    :param activity: What is being done, such as 'run' or 'actions'
+
+    :return: context manager
+    """
+    return _Attribution(identifier, activity)
+
+
+# ------------------------------------------------------------------------------
+class _Attribution(object):
+
+    # --------------------------------------------------------------------------
+    def __init__(self, identifier, activity):
+        self.entry = (identifier, activity)
+
+    # --------------------------------------------------------------------------
+    def __enter__(self):
+        _ACTIVITY.append(self.entry)
+        return self
+
+    # --------------------------------------------------------------------------
+    def __exit__(self, *args):
+        _ACTIVITY.pop()
+        return False
+
+
+# ------------------------------------------------------------------------------
+# noinspection PyUnresolvedReferences,PyPep8Naming
+class Watchdog(QtCore.QObject):
+    """
+    Watches the thread it is created in (which should be the ui thread)
+    for stalls.
+    """
+
+    # -- This is emitted with the description of each stall once the
+    # -- ui thread has recovered
+    stallDetected = QtCore.Signal(object)
+
+    # -- This is how often (in ms) the ui thread signals that it is
+    # -- still responsive
+    HEARTBEAT_INTERVAL = 50
+
+    # -- This is how many of the most recent stalls are held on to
+    HISTORY = 50
+
+    # --------------------------------------------------------------------------
+    def __init__(self, threshold=1000, parent=None):
+        super(Watchdog, self).__init__(parent=parent)
+
+        # -- This is how long (in ms) the ui thread has to be unresponsive
+        # -- for before it is considered stalled
+        self.threshold = threshold
+
+        self._thread_id = threading.current_thread().ident
+        self._last_beat = None
+        self._stall = None
+
+        # -- The last beat and the current stall are handed between the ui
+        # -- thread and the background thread under this lock
+        self._lock = threading.Lock()
+
+        self._stalls = collections.deque(maxlen=self.HISTORY)
+        self._counts = collections.Counter()
+
+        self._heartbeat = QtCore.QTimer(self)
+        self._heartbeat.setInterval(self.HEARTBEAT_INTERVAL)
+        self._heartbeat.timeout.connect(self.beat)
+
+        self._watcher = None
+        self._stop = None
+
+    # --------------------------------------------------------------------------
+    def setThreshold(self, threshold):
+        """
+        Sets how long (in ms) the ui thread has to be unresponsive for
+        before it is considered stalled. A threshold of 0 turns the
+        watchdog off.
+        """
+        self.threshold = threshold
+
+        if threshold:
+            self.start()
+
+        else:
+            self.stop()
+
+    # --------------------------------------------------------------------------
+    def start(self):
+        """
+        Starts watching, unless the watchdog is turned off or is
+        already watching
+        """
+        if not self.threshold or self.isWatching():
+            return
+
+        # -- We only start measuring from the first beat, as the event
+        # -- loop may not be running yet
+        self._last_beat = None
+        self._stop = threading.Event()
+        self._heartbeat.start()
+
+        self._watcher = threading.Thread(target=self._watch, args=(self._stop,))
+        self._watcher.daemon = True
+        self._watcher.start()
+
+    # --------------------------------------------------------------------------
+    def stop(self):
+        self._heartbeat.stop()
+
+        if self._stop is not None:
+            self._stop.set()
+
+        self._watcher = None
+
+    # --------------------------------------------------------------------------
+    def isWatching(self):
+        return self._watcher is not None and self._watcher.is_alive()
+
+    # --------------------------------------------------------------------------
+    def beat(self):
+        """
+        Called on the ui thread to show that it is responsive. If a stall
+        was detected whilst it was unresponsive then it is recorded now.
+        """
+        now = time.time()
+
+        with self._lock:
+            stall = self._stall
+            self._stall = None
+            self._last_beat = now
+
+        if stall is not None:
+            stall['duration'] = now - stall['started']
+            self._record(stall)
+
+    # --------------------------------------------------------------------------
+    def _watch(self, stop):
+        """
+        Runs in the background thread, looking for the ui thread failing
+        to beat in time
+        """
+        interval = self.HEARTBEAT_INTERVAL / 1000.0
+
+        while not stop.wait(interval):
+
+            with self._lock:
+                last_beat = self._last_beat
+
+                if last_beat is None or self._stall is not None:
+                    continue
+
+                if (time.time() - last_beat) * 1000 < self.threshold:
+                    continue
+
+                # -- The ui thread is stalled, so we capture what it is doing
+                # -- and who is responsible right now. The ui thread may be
+                # -- changing the activity as we read it, so we take a copy
+                frame = sys._current_frames().get(self._thread_id)
+                activity = (list(_ACTIVITY) or [(None, None)])[-1]
+
+                stall = dict(
+                    started=last_beat,
+                    duration=None,
+                    identifier=activity[0],
+                    activity=activity[1],
+                    stack=traceback.format_stack(frame) if frame else list(),
+                )
+
+                # -- The stall is held before it is logged, so if the ui
+                # -- thread recovers whilst we are logging it is recorded
+                self._stall = stall
+                self._stalls.append(stall)
+                self._counts[stall['identifier']] += 1
+
+            self._detected(stall)
+
+    # --------------------------------------------------------------------------
+    def _detected(self, stall):
+        """
+        Called from the background thread as soon as a stall is detected.
+        The ui thread may never recover, so we log it straight away.
+        """
+        print(
+            'The ui has been unresponsive for {:.2f}s whilst {}'.format(
+                time.time() - stall['started'],
+                self._describe(stall),
+            )
+        )
+        print(''.join(stall['stack']))
+
+        # -- If the process is killed whilst hung anything buffered
+        # -- would be lost
+        sys.stdout.flush()
+
+    # --------------------------------------------------------------------------
+    def _record(self, stall):
+        """
+        Called from the ui thread once it has recovered from the stall
+        """
+        print(
+            'The ui recovered after {:.2f}s whilst {}'.format(
+                stall['duration'],
+                self._describe(stall),
+            )
+        )
+
+        tracing.complete(
+            'stall',
+            tracing.now() - stall['duration'],
+            category='stall',
+            track='Stalls',
+            identifier=stall['identifier'],
+            activity=stall['activity'],
+        )
+
+        self.stallDetected.emit(stall)
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def _describe(cls, stall):
+        if not stall['identifier']:
+            return 'not running any plugin'
+
+        return 'running %s of %s' % (stall['activity'], stall['identifier'])
+
+    # --------------------------------------------------------------------------
+    def stalls(self):
+        """
+        Returns the most recent stalls, each described by a dictionary
+        holding when it started, how long it lasted, the plugin and
+        activity it is attributed to and the stack of the ui thread. The
+        duration is None whilst the ui thread has not yet recovered.
+
+        :return: list(dict)
+        """
+        return list(self._stalls)
+
+    # --------------------------------------------------------------------------
+    def counts(self):
+        """
+        Returns the number of stalls attributed to each plugin identifier.
+        Stalls which happened whilst no plugin was running are counted
+        under None.
+
+        :return: dict
+        """
+        return dict(self._counts)
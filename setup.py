@@ -25,8 +25,13 @@ setuptools.setup(
         'Operating System :: OS Independent',
     ],
     package_data={
-        '': ['_resources/*.png', '_resources/*.ui', '_resources/*.qss'],
+        '': ['_resources/*.png', '_resources/*.ui', '_resources/*.qss', '_compiled/*.rcc', '_compiled/*.py'],
     },
     install_requires=['qtility', 'scribble', 'factories', 'launchpad'],
+    extras_require={
+        # -- PySide6 6.12 drops references to None, which aborts the
+        # -- teardown tests once they have run for a while
+        'test': ['pytest', 'PySide6<6.12'],
+    },
     keywords="launch launchpad pad action actions launchpanel panel",
 )
@@ -0,0 +1,96 @@
+"""
+Shared setup for the tests. Any settings written by the panel go to a
+temporary directory rather than the settings of the user, and the ui tests
+run offscreen so they do not need a display.
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import pytest
+
+# -- This has to happen before scribble is imported, as it resolves where
+# -- to store its data when it is first imported
+_CONFIG_DIRECTORY = tempfile.mkdtemp(prefix='launchpanel-tests-')
+os.environ['XDG_CONFIG_HOME'] = _CONFIG_DIRECTORY
+os.environ['PYSCRIBBLE_STORAGE_DIR'] = os.path.join(_CONFIG_DIRECTORY, 'pyscribble')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ------------------------------------------------------------------------------
+def pytest_unconfigure(config):
+    shutil.rmtree(_CONFIG_DIRECTORY, ignore_errors=True)
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def app():
+    """
+    Returns the QApplication, skipping the test if Qt is not available
+    """
+    pytest.importorskip('Qt')
+    from Qt import QtWidgets
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def pump(app):
+    """
+    Returns a function which processes events for the given number of
+    seconds, including any deferred deletions.
+    """
+    from Qt import QtCore
+
+    def process(seconds=0.0):
+        end_time = time.time() + seconds
+
+        while True:
+            app.processEvents()
+            QtCore.QCoreApplication.sendPostedEvents(
+                None,
+                QtCore.QEvent.DeferredDelete,
+            )
+
+            if time.time() >= end_time:
+                break
+
+            time.sleep(0.01)
+
+    return process
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def plugin_location(tmp_path):
+    """
+    Returns a directory holding a small set of plugins, one of which
+    is in beta.
+    """
+    (tmp_path / 'test_plugins.py').write_text(
+        'import launchpad\n'
+        '\n'
+        '\n'
+        'class Alpha(launchpad.LaunchAction):\n'
+        '    Name = "Alpha"\n'
+        '    Groups = ["Tools"]\n'
+        '\n'
+        '\n'
+        'class Bravo(launchpad.LaunchAction):\n'
+        '    Name = "Bravo"\n'
+        '\n'
+        '\n'
+        'class Charlie(launchpad.LaunchAction):\n'
+        '    Name = "Charlie"\n'
+        '    Groups = ["Tools"]\n'
+        '\n'
+        '    @classmethod\n'
+        '    def state(cls):\n'
+        '        return launchpad.PluginStates.BETA\n'
+    )
+    return str(tmp_path)
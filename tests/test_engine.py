@@ -0,0 +1,179 @@
+"""
+These tests cover the sharing of factories between panels through
+the engine.
+"""
+import pytest
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def engine(app):
+    from launchpanel import engine
+
+    # -- We use our own engine rather than the one for the process, so
+    # -- the tests do not see each others factories
+    return engine.Engine()
+
+
+# ------------------------------------------------------------------------------
+def test_owners_share_a_factory(engine, plugin_location):
+    first = engine.factory([plugin_location], owner='first')
+    second = engine.factory([plugin_location], owner='second')
+
+    assert first is second
+    assert engine.factories() == [first]
+
+
+# ------------------------------------------------------------------------------
+def test_factory_is_discarded_once_unused(engine, plugin_location, tmp_path):
+    other_location = str(tmp_path / 'other')
+
+    original = engine.factory([plugin_location], owner='first')
+    engine.factory([plugin_location], owner='second')
+
+    # -- Moving one owner off the factory keeps it for the other
+    engine.factory([plugin_location, other_location], owner='first')
+    assert original in engine.factories()
+
+    engine.factory([plugin_location, other_location], owner='second')
+    assert original not in engine.factories()
+    assert len(engine.factories()) == 1
+
+    engine.release('first')
+    engine.release('second')
+    assert engine.factories() == []
+
+
+# ------------------------------------------------------------------------------
+def test_requesting_the_same_factory_keeps_it(engine, plugin_location):
+    factory = engine.factory([plugin_location], owner='first')
+
+    assert engine.factory([plugin_location], owner='first') is factory
+    assert engine.factories() == [factory]
+
+
+# ------------------------------------------------------------------------------
+def test_refreshed_factory_is_discarded_once_unused(engine, plugin_location):
+    original = engine.factory([plugin_location], owner='first')
+    engine.factory([plugin_location], owner='second')
+
+    refreshed = engine.factory([plugin_location], owner='first', refresh=True)
+    assert refreshed is not original
+    assert engine.factories() == [refreshed]
+
+    # -- The second owner is still using the original factory, so it is
+    # -- only discarded once it moves on to the refreshed one
+    assert engine.factory([plugin_location], owner='second') is refreshed
+    assert engine.factories() == [refreshed]
+
+
+# ------------------------------------------------------------------------------
+def test_unused_plugin_host_is_stopped(engine, plugin_location):
+    original = engine.factory([plugin_location], use_plugin_host=True, owner='first')
+    assert original.host.isRunning()
+
+    refreshed = engine.factory([plugin_location], use_plugin_host=True, owner='first', refresh=True)
+    assert not original.host.isRunning()
+    assert refreshed.host.isRunning()
+
+    engine.release('first')
+    assert not refreshed.host.isRunning()
+
+
+# ------------------------------------------------------------------------------
+def test_registering_a_file_replaces_its_plugins(engine, plugin_location):
+    import os
+
+    factory = engine.factory([plugin_location], owner='first')
+    original = factory.request('Alpha')
+
+    registered = list()
+    engine.pluginRegistered.connect(
+        lambda *args: registered.append(args),
+    )
+
+    filepath = os.path.join(plugin_location, 'test_plugins.py')
+
+    with open(filepath, 'a') as stream:
+        stream.write(
+            '\n'
+            '\n'
+            'class Delta(launchpad.LaunchAction):\n'
+            '    Name = "Delta"\n'
+        )
+
+    identifiers = engine.registerPluginFile(factory, filepath)
+
+    assert sorted(identifiers) == ['Alpha', 'Bravo', 'Charlie', 'Delta']
+    assert registered == [(factory, identifiers)]
+
+    # -- The plugins are replaced rather than added alongside the
+    # -- ones which were already loaded from the file
+    assert factory.request('Alpha') is not original
+    assert len(factory.versions('Alpha')) == 1
+
+
+# ------------------------------------------------------------------------------
+def test_watchdog_uses_the_shortest_stall_threshold(engine):
+    engine.setStallThreshold(2000, owner='first')
+    engine.setStallThreshold(500, owner='second')
+    engine.setStallThreshold(0, owner='third')
+    assert engine.watchdog.threshold == 500
+
+    engine.release('second')
+    assert engine.watchdog.threshold == 2000
+    assert engine.watchdog.isWatching()
+
+    # -- Once only owners which have turned it off are left, it stops
+    engine.release('first')
+    assert engine.watchdog.threshold == 0
+    assert not engine.watchdog.isWatching()
+
+
+# ------------------------------------------------------------------------------
+def test_hanging_status_check_is_timed_out(engine, pump, monkeypatch, tmp_path):
+    import os
+    import time
+    import threading
+    import launchpad
+    from launchpanel import status
+
+    release_check = threading.Event()
+
+    class Hanging(launchpad.LaunchAction):
+        Name = 'Hanging'
+
+        @classmethod
+        def status_message(cls):
+            release_check.wait(5)
+            return 'Finally'
+
+    monkeypatch.setattr(status.Metrics, 'TIMEOUT', 0.2)
+    monkeypatch.setattr(engine.scheduler, 'board', status.Board(directory=str(tmp_path)))
+    engine.scheduler._expiry_timer.setInterval(50)
+    status.metrics().reset('Hanging')
+
+    statuses = list()
+    engine.scheduler.check(Hanging, statuses.append, owner='first')
+
+    end_time = time.time() + 2
+    while engine.scheduler.pending() and time.time() < end_time:
+        pump(0.05)
+
+    # -- We stop waiting on the check and give up its claim, even though
+    # -- it is still running
+    assert engine.scheduler.pending() == 0
+    assert engine.scheduler.pending('first') == 0
+    assert statuses == []
+    assert not os.path.exists(engine.scheduler.board._path(Hanging, '.claim'))
+    assert status.metrics().get('Hanging')['timeouts'] == 1
+
+    # -- Once it does finish the timeout is not counted again
+    release_check.set()
+    pump(0.3)
+
+    metrics = status.metrics().get('Hanging')
+    assert metrics['calls'] == 1
+    assert metrics['timeouts'] == 1
+    assert metrics['failures_in_a_row'] == 1
+    assert statuses == []
@@ -0,0 +1,68 @@
+"""
+These tests check that the parts of the package which can be used without
+a ui (such as headless runs and the plugin host) never import Qt. Each
+import is carried out in a fresh interpreter, as the modules may already
+have been imported by other tests.
+"""
+import os
+import sys
+import json
+import subprocess
+
+
+# -- These are the top level modules which are only needed by the ui
+QT_MODULES = ['Qt', 'PySide', 'PySide2', 'PySide6', 'PyQt4', 'PyQt5', 'PyQt6', 'qtility']
+
+# -- This is the directory holding the launchpanel package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ------------------------------------------------------------------------------
+def imported_qt_modules(module_name):
+    """
+    Imports the given module in a fresh interpreter, returning the names of
+    any Qt modules which were imported along with it.
+    """
+    code = (
+        'import sys, json\n'
+        'import {}\n'
+        'print(json.dumps(sorted(sys.modules)))\n'
+    ).format(module_name)
+
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [ROOT] + [path for path in sys.path if path],
+    )
+
+    output = subprocess.check_output(
+        [sys.executable, '-c', code],
+        env=environment,
+    )
+
+    return [
+        name
+        for name in json.loads(output.decode().strip().splitlines()[-1])
+        if name.split('.')[0] in QT_MODULES
+    ]
+
+
+# ------------------------------------------------------------------------------
+def test_package_does_not_import_qt():
+    assert imported_qt_modules('launchpanel') == []
+
+
+# ------------------------------------------------------------------------------
+def test_headless_does_not_import_qt():
+    assert imported_qt_modules('launchpanel.headless') == []
+
+
+# ------------------------------------------------------------------------------
+def test_plugin_host_does_not_import_qt():
+    assert imported_qt_modules('launchpanel.host') == []
+
+
+# ------------------------------------------------------------------------------
+def test_core_is_imported_when_first_used(app):
+    import launchpanel
+
+    assert launchpanel.core.LaunchPanel is not None
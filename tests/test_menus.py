@@ -0,0 +1,74 @@
+"""
+These tests cover the caching of context menu entries
+"""
+import threading
+
+import pytest
+import launchpad
+
+
+# ------------------------------------------------------------------------------
+class Slow(launchpad.LaunchAction):
+    Name = 'Slow'
+
+    # -- The build of the menu waits on this
+    release = threading.Event()
+
+    @classmethod
+    def actions(cls):
+        cls.release.wait(10)
+        return {'Entry': cls.run}
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def menus(app):
+    from launchpanel import engine
+
+    Slow.release.clear()
+    return engine.MenuCache()
+
+
+# ------------------------------------------------------------------------------
+def wait_for(pump, results):
+    for _ in range(500):
+        if results:
+            return results[0]
+
+        pump(0.01)
+
+    raise AssertionError('The menu entries were never built')
+
+
+# ------------------------------------------------------------------------------
+def test_entries_are_cached(menus, pump):
+    results = list()
+    menus.request(Slow, results.append)
+
+    Slow.release.set()
+
+    assert list(wait_for(pump, results)) == ['Entry']
+    assert list(menus.entries(Slow)) == ['Entry']
+
+
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize('invalidated', [Slow, None])
+def test_build_invalidated_in_flight_is_not_cached(menus, pump, invalidated):
+    results = list()
+    menus.request(Slow, results.append)
+
+    # -- The plugin changes whilst its menu is being built
+    menus.invalidate(invalidated)
+    Slow.release.set()
+
+    # -- The menu which was waiting is still given the entries, but they
+    # -- are not kept for the next menu
+    assert list(wait_for(pump, results)) == ['Entry']
+    assert menus.entries(Slow) is None
+
+    # -- The next build is cached as normal
+    results = list()
+    menus.request(Slow, results.append)
+
+    assert list(wait_for(pump, results)) == ['Entry']
+    assert list(menus.entries(Slow)) == ['Entry']
@@ -0,0 +1,137 @@
+"""
+These tests cover the mirroring of plugin locations. The remote location is
+a local directory, made slow to read from so we can check the ui thread is
+never left waiting on it.
+"""
+import os
+import time
+import shutil
+import threading
+
+import pytest
+
+from launchpanel import mirror
+
+
+# -- This is how long every copy from the remote location takes
+LATENCY = 0.2
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def remote(tmp_path, monkeypatch):
+    """
+    Returns a directory with a couple of plugin files in it. Copying any
+    file from it is slow, as if it were on a network share.
+    """
+    location = tmp_path / 'remote'
+    (location / 'icons').mkdir(parents=True)
+    (location / 'tools.py').write_text('# -- tools')
+    (location / 'icons' / 'tool.png').write_text('png')
+
+    copy = shutil.copy2
+
+    def slow_copy(source, target):
+        if source.startswith(str(location)):
+            time.sleep(LATENCY)
+
+        return copy(source, target)
+
+    monkeypatch.setattr(mirror.shutil, 'copy2', slow_copy)
+
+    return str(location).replace('\\', '/')
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def local_mirror(tmp_path):
+    return mirror.Mirror(directory=str(tmp_path / 'mirror').replace('\\', '/'))
+
+
+# ------------------------------------------------------------------------------
+def sync_and_wait(local_mirror, locations):
+    """
+    Syncs the given locations in the background and returns whether
+    anything changed once it is complete
+    """
+    results = list()
+    finished = threading.Event()
+
+    def callback(changed):
+        results.append(changed)
+        finished.set()
+
+    assert local_mirror.sync_in_background(locations, callback=callback)
+    assert finished.wait(10)
+
+    return results[0]
+
+
+# ------------------------------------------------------------------------------
+def test_unsynced_location_is_used_directly(local_mirror, remote):
+    start = time.time()
+    paths = local_mirror.localise([remote])
+
+    assert time.time() - start < LATENCY
+    assert paths == [remote]
+    assert not local_mirror.synced(remote)
+
+
+# ------------------------------------------------------------------------------
+def test_synced_location_is_used_locally(local_mirror, remote):
+    assert sync_and_wait(local_mirror, [remote])
+
+    local_path = local_mirror.localise([remote])[0]
+
+    assert local_path != remote
+    assert local_mirror.remote(local_path) == remote
+    assert os.path.exists(os.path.join(local_path, 'tools.py'))
+    assert os.path.exists(os.path.join(local_path, 'icons', 'tool.png'))
+
+
+# ------------------------------------------------------------------------------
+def test_localise_does_not_wait_for_sync(local_mirror, remote):
+    local_mirror.sync_in_background([remote])
+
+    start = time.time()
+    paths = local_mirror.localise([remote])
+
+    assert time.time() - start < LATENCY
+    assert paths == [remote]
+
+
+# ------------------------------------------------------------------------------
+def test_only_changes_are_synced(local_mirror, remote):
+    assert sync_and_wait(local_mirror, [remote])
+    assert not sync_and_wait(local_mirror, [remote])
+
+    local_path = local_mirror.local(remote)
+
+    with open(os.path.join(remote, 'tools.py'), 'a') as f:
+        f.write('\n# -- more tools')
+
+    os.remove(os.path.join(remote, 'icons', 'tool.png'))
+
+    assert sync_and_wait(local_mirror, [remote])
+
+    with open(os.path.join(local_path, 'tools.py')) as f:
+        assert 'more tools' in f.read()
+
+    assert not os.path.exists(os.path.join(local_path, 'icons', 'tool.png'))
+
+
+# ------------------------------------------------------------------------------
+def test_empty_location_is_synced(local_mirror, tmp_path):
+    location = str(tmp_path / 'empty').replace('\\', '/')
+    os.makedirs(location)
+
+    assert sync_and_wait(local_mirror, [location])
+    assert local_mirror.localise([location]) == [local_mirror.local(location)]
+
+
+# ------------------------------------------------------------------------------
+def test_unreachable_location_is_used_directly(local_mirror, tmp_path):
+    location = str(tmp_path / 'missing').replace('\\', '/')
+
+    assert not sync_and_wait(local_mirror, [location])
+    assert local_mirror.localise([location]) == [location]
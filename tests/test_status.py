@@ -0,0 +1,122 @@
+"""
+These tests cover the sharing of status results between processes through
+the status board. Each board instance stands in for a separate process.
+"""
+import os
+import time
+
+import pytest
+import launchpad
+
+from launchpanel import status
+
+
+# ------------------------------------------------------------------------------
+class Counted(launchpad.LaunchAction):
+    Name = 'Counted'
+    checks = 0
+
+    @classmethod
+    def status_message(cls):
+        cls.checks += 1
+        return 'Checked %s times' % cls.checks
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def board_directory(tmp_path):
+    Counted.checks = 0
+    return str(tmp_path / 'board')
+
+
+# ------------------------------------------------------------------------------
+def test_result_is_shared(board_directory):
+    first = status.Board(directory=board_directory)
+    second = status.Board(directory=board_directory)
+
+    assert status.messages([Counted], board=first) == {'Counted': 'Checked 1 times'}
+    assert status.messages([Counted], board=second) == {'Counted': 'Checked 1 times'}
+    assert Counted.checks == 1
+
+
+# ------------------------------------------------------------------------------
+def test_release_leaves_a_claim_which_was_taken_over(board_directory):
+    first = status.Board(directory=board_directory, lease=1)
+    second = status.Board(directory=board_directory, lease=1)
+
+    assert first.claim(Counted)
+    assert not second.claim(Counted)
+
+    # -- Once the lease has run out the claim can be taken over
+    claim_path = first._path(Counted, '.claim')
+    os.utime(claim_path, (time.time() - 5, time.time() - 5))
+    assert second.claim(Counted)
+
+    first.release(Counted)
+    assert os.path.exists(claim_path)
+
+    second.release(Counted)
+    assert not os.path.exists(claim_path)
+
+
+# ------------------------------------------------------------------------------
+def test_stale_claim_is_only_taken_over_once(board_directory):
+    first = status.Board(directory=board_directory, lease=1)
+    second = status.Board(directory=board_directory, lease=1)
+    third = status.Board(directory=board_directory, lease=1)
+
+    assert first.claim(Counted)
+
+    claim_path = first._path(Counted, '.claim')
+    os.utime(claim_path, (time.time() - 5, time.time() - 5))
+
+    with open(claim_path, 'r') as f:
+        stale_token = f.read()
+
+    # -- The second process takes the claim over, whilst the third found
+    # -- the same claim to be stale before that happened
+    assert second.claim(Counted)
+    assert not third._takeOver(claim_path, stale_token, 'third')
+
+    # -- The claim of the second process is left in place
+    with open(claim_path, 'r') as f:
+        assert f.read() == second._tokens[claim_path]
+
+    assert os.listdir(board_directory) == [os.path.basename(claim_path)]
+
+
+# ------------------------------------------------------------------------------
+def test_publish_replaces_the_previous_result(board_directory):
+    board = status.Board(directory=board_directory)
+    os.makedirs(board_directory)
+
+    board.publish(Counted, 'First')
+    board.publish(Counted, 'Second')
+
+    assert board.read(Counted)['message'] == 'Second'
+    assert os.listdir(board_directory) == [os.path.basename(board._path(Counted, '.json'))]
+
+
+# ------------------------------------------------------------------------------
+def test_waiting_stops_when_cancelled(board_directory):
+    first = status.Board(directory=board_directory)
+    second = status.Board(directory=board_directory)
+
+    # -- The first process is checking the plugin, so the second waits
+    # -- for its result until it is cancelled
+    assert first.claim(Counted)
+
+    cancel_at = time.time() + 0.5
+    start = time.time()
+
+    statuses = status.messages(
+        [Counted],
+        board=second,
+        cancelled=lambda: time.time() > cancel_at,
+    )
+
+    assert time.time() - start < second.lease
+    assert 'Counted' not in statuses
+    assert Counted.checks == 0
+
+    first.release(Counted)
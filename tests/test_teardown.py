@@ -0,0 +1,84 @@
+"""
+These tests repeatedly rebuild the panel and check that nothing is left
+behind by the lists, delegates and status checks which are replaced.
+"""
+import gc
+
+import pytest
+
+
+# -- This is how many times the panel is rebuilt
+REPEATS = 200
+
+
+# ------------------------------------------------------------------------------
+def live_instances(class_type):
+    """
+    Returns the number of python objects of the given type which are
+    still alive
+    """
+    gc.collect()
+    return len([obj for obj in gc.get_objects() if isinstance(obj, class_type)])
+
+
+# ------------------------------------------------------------------------------
+def snapshot(panel):
+    """
+    Returns the counts which should stay flat however many times the
+    panel is rebuilt
+    """
+    from launchpanel import core
+
+    return dict(
+        totals=panel.memoryReport()['totals'],
+        orphaned=len(panel.memoryReport()['orphaned']),
+        list_widgets=live_instances(core.ActionListWidget),
+        delegates=live_instances(core.ActionDelegate),
+    )
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def panel(app, pump, plugin_location):
+    from launchpanel import core
+
+    panel = core.LaunchPanel(
+        plugin_locations=[plugin_location],
+        environment_id='teardown_test',
+    )
+    panel.show()
+    pump(0.5)
+
+    yield panel
+
+    panel.close()
+    panel.deleteLater()
+    pump()
+
+
+# ------------------------------------------------------------------------------
+def test_toggling_beta_does_not_leak(panel, pump):
+    # -- Toggling twice brings us back to the state we started in
+    before = snapshot(panel)
+
+    for _ in range(REPEATS):
+        panel.toggleBetaPlugins()
+        pump()
+
+        panel.toggleBetaPlugins()
+        pump()
+
+    pump(0.5)
+    assert snapshot(panel) == before
+
+
+# ------------------------------------------------------------------------------
+def test_repopulating_does_not_leak(panel, pump):
+    before = snapshot(panel)
+
+    for _ in range(REPEATS):
+        panel.populate()
+        pump()
+
+    pump(0.5)
+    assert snapshot(panel) == before
@@ -0,0 +1,63 @@
+"""
+These tests cover the trace written by the tracer
+"""
+import json
+
+import pytest
+
+from launchpanel import tracing
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def trace_path(tmp_path):
+    filepath = str(tmp_path / 'trace.json')
+    tracing.enable(filepath)
+
+    yield filepath
+
+    tracing.disable()
+
+
+# ------------------------------------------------------------------------------
+def read_events(filepath):
+    tracing.disable()
+
+    with open(filepath, 'r') as f:
+        return [event for event in json.load(f) if event['ph'] != 'M']
+
+
+# ------------------------------------------------------------------------------
+def test_spans_are_complete_events(trace_path):
+    with tracing.span('outer'):
+        with tracing.span('inner'):
+            pass
+
+    events = read_events(trace_path)
+
+    assert [event['name'] for event in events] == ['inner', 'outer']
+    assert all(event['ph'] == 'X' for event in events)
+
+
+# ------------------------------------------------------------------------------
+def test_overlapping_track_spans_are_async(trace_path):
+    start = tracing.now()
+
+    # -- The first span starts before the second but ends after it has
+    # -- started, so they overlap without nesting
+    tracing.complete('first', start, start + 2, track='Processes', detail=1)
+    tracing.complete('second', start + 1, start + 3, track='Processes', detail=2)
+
+    events = read_events(trace_path)
+
+    assert [event['ph'] for event in events] == ['b', 'e', 'b', 'e']
+
+    begins = [event for event in events if event['ph'] == 'b']
+    ends = [event for event in events if event['ph'] == 'e']
+
+    # -- Each span pairs its start and end through its own id
+    assert begins[0]['id'] != begins[1]['id']
+    assert [event['id'] for event in begins] == [event['id'] for event in ends]
+
+    assert begins[0]['args'] == dict(detail=1, track='Processes')
+    assert ends[0]['ts'] - begins[0]['ts'] == pytest.approx(2000000)
@@ -0,0 +1,51 @@
+"""
+These tests cover the detection of stalls on the ui thread
+"""
+import time
+
+import pytest
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def watchdog(app, pump):
+    from launchpanel import watchdog
+
+    dog = watchdog.Watchdog(threshold=100)
+    dog.start()
+
+    # -- The watchdog only starts measuring from the first beat
+    pump(0.2)
+
+    yield dog
+
+    dog.stop()
+
+
+# ------------------------------------------------------------------------------
+def test_stall_is_logged_before_recovery(watchdog, pump, capsys):
+    from launchpanel import watchdog as watchdog_module
+
+    recovered = list()
+    watchdog.stallDetected.connect(recovered.append)
+
+    # -- We hang the ui thread inside a plugin, and check that the stall
+    # -- has been logged whilst we are still hung
+    with watchdog_module.attribute('Hanging', 'run'):
+        time.sleep(0.5)
+
+        stalls = watchdog.stalls()
+        assert len(stalls) == 1
+        assert stalls[0]['identifier'] == 'Hanging'
+        assert stalls[0]['activity'] == 'run'
+        assert stalls[0]['duration'] is None
+        assert watchdog.counts() == {'Hanging': 1}
+        assert 'running run of Hanging' in capsys.readouterr().out
+
+    pump(0.2)
+
+    # -- Once recovered, the duration is recorded against the same stall
+    assert len(watchdog.stalls()) == 1
+    assert watchdog.stalls()[0]['duration'] >= 0.4
+    assert len(recovered) == 1
+    assert watchdog.counts() == {'Hanging': 1}